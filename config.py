@@ -16,6 +16,14 @@ class Settings(BaseSettings):
 
     # 세션 설정
     session_timeout: int = 86400  # 24시간 (초 단위)
+    # 세션 캐시 (sessions 테이블 조회 생략용, 워커 프로세스별 인메모리)
+    # 다른 워커에서 로그아웃한 세션은 최대 session_cache_ttl 동안 이 워커에 남을 수 있음
+    session_cache_size: int = 10000
+    session_cache_ttl: int = 60  # 초
+    # 인증 사용자 캐시 (get_current_user의 users 테이블 조회 생략용, 워커 프로세스별 인메모리)
+    # 다른 워커에서 수정/탈퇴한 사용자 정보는 최대 user_cache_ttl 동안 이 워커에 남을 수 있음
+    user_cache_size: int = 10000
+    user_cache_ttl: int = 30  # 초
 
     # 보안 키
     secret_key: str
@@ -28,6 +36,45 @@ class Settings(BaseSettings):
     db_name: str
     db_pool_size: int = 5
 
+    # 읽기 전용 복제본(Replica) 설정
+    # "host1:3307,host2" 형식 (포트 생략 시 db_port), 비어 있으면 모든 쿼리를 primary로 전송
+    db_replica_hosts: str = ""
+    db_replica_pool_size: int = 5
+    db_replica_health_interval: int = 5  # 복제본 헬스 체크 주기 (초)
+
+    # 게시글 목록 totalCount 캐시 (COUNT(*) 재계산 주기, 워커 프로세스별 인메모리)
+    post_count_ttl: int = 30  # 초
+
+    # 게시글 조회수 write-behind 반영 (워커 프로세스별 인메모리 누적 후 일괄 UPDATE)
+    hit_flush_interval: float = 5.0  # 초
+    hit_flush_threshold: int = 500  # 누적 조회수가 이 값 이상이면 주기와 무관하게 반영
+
+    # 게시글 조회수 중복 제거 (같은 세션/IP의 반복 조회는 윈도우 내 한 번만 집계, 0이면 비활성화)
+    view_dedup_window: int = 600  # 초
+    view_dedup_max_entries: int = 100000  # 버킷당 최대 지문 수 (약 수 MB)
+
+    # 이미지 변형(썸네일/중간 크기) 생성 프로세스 수 (0이면 비활성화, Pillow 필요)
+    image_variant_workers: int = 2
+
+    # 비밀번호 해싱(bcrypt) 동시 실행 수 (워커 프로세스별 전용 스레드 풀 크기)
+    # 초과 요청은 대기하며, 대기 수는 /metrics의 password_hash_pool 게이지로 확인
+    password_hash_concurrency: int = 4
+
+    # 실시간 이벤트 스트림(SSE, /v1/events) - 워커 프로세스별 인메모리 발행/구독
+    event_queue_size: int = 100  # 구독자별 미전송 이벤트 상한 (초과 시 연결 종료 → 클라이언트 재연결)
+    event_max_subscribers: int = 1000  # 워커 프로세스별 최대 동시 구독 수
+    event_ping_interval: float = 15.0  # 초, 프록시 유휴 타임아웃 방지용 주석(ping) 전송 주기
+
+    # 응답 압축 (gzip, brotli 설치 시 brotli 우선)
+    compression_min_size: int = 1024  # 바이트, 이보다 작은 단일 청크 응답은 압축하지 않음
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # 동적 응답용 (정적 파일 사전 압축은 최대 품질)
+    static_precompress_dir: str = ".cache/precompressed"  # 정적 파일 사전 압축본(.br/.gz) 저장 위치
+
+    # /metrics 접근 토큰 ("Authorization: Bearer <토큰>" 헤더로 전달)
+    # 비어 있으면 디버그 모드에서만 노출하고, 그 외에는 404 응답
+    metrics_token: str = ""
+
     # 디버그 모드
     debug: bool = False
 
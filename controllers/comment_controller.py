@@ -1,26 +1,24 @@
+from datetime import datetime
 from typing import List, Dict, Union
 from models.comment_model import comment_model
 from models.post_model import post_model
-from models.user_model import user_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
-from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, CommentAuthor, ResourceError
+from utils.common.pagination_utils import encode_cursor, decode_cursor
+from utils.database.db import transaction
+from utils.common.event_bus import event_bus, COMMENT_COUNT
+from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, CommentAuthor, PaginatedData, PaginationMeta, ResourceError
 
 
 class CommentController:
     """댓글 관련 비즈니스 로직"""
 
-    async def _formatComment(self, comment: Dict) -> CommentResponse:
-        """Comment 데이터를 API 응답 규격에 맞게 변환"""
-        author = await user_model.getUserById(comment["userId"])
-        
-        # 최신 닉네임 우선 사용
-        nickname = author.get("nickname") if author else comment["userNickname"]
-        
+    def _formatComment(self, comment: Dict) -> CommentResponse:
+        """Comment 데이터를 API 응답 규격에 맞게 변환 (작성자 정보는 댓글 조회 시 JOIN으로 함께 조회, DB 조회 없음)"""
         author_data = CommentAuthor(
             userId=comment["userId"],
-            nickname=nickname,
-            profileImageUrl=author.get("profileImageUrl") if author else None
+            nickname=comment.get("userNickname"),
+            profileImageUrl=comment.get("userProfileImageUrl")
         )
 
         return CommentResponse(
@@ -32,14 +30,44 @@ class CommentController:
             updatedAt=comment.get("updatedAt")
         )
 
-    async def getCommentsByPost(self, postId: str) -> List[CommentResponse]:
-        """특정 게시글의 댓글 목록 조회"""
+    async def getCommentsByPost(self, postId: str, limit: int = 20, cursor: str = "") -> PaginatedData[List[CommentResponse]]:
+        """특정 게시글의 댓글 목록 조회 (커서 기반, 빈 커서는 첫 페이지)"""
         post = await post_model.getPostById(postId)
         if not post:
             raise APIError(ErrorCode.POST_NOT_FOUND, ResourceError(resource="게시글", id=postId))
 
-        comments = await comment_model.getCommentsByPost(postId)
-        return [await self._formatComment(c) for c in comments]
+        before_created_at, before_comment_id = None, None
+        if cursor:
+            created_at, before_comment_id = decode_cursor(cursor, 2)
+            try:
+                before_created_at = datetime.fromisoformat(created_at)
+            except (TypeError, ValueError):
+                raise APIError(ErrorCode.INVALID_INPUT, {"cursor": ["INVALID_FORMAT"]})
+
+        result = await comment_model.getCommentsByPost(
+            postId,
+            limit=limit,
+            beforeCreatedAt=before_created_at,
+            beforeCommentId=before_comment_id,
+        )
+        comments = result["comments"]
+        has_next = result["hasNext"]
+
+        # 전체 댓글 수는 posts.comment_count 캐시 값 사용 (COUNT 쿼리 생략)
+        total_count = post.get("commentCount", 0)
+        total_page = (total_count + limit - 1) // limit if total_count > 0 else 0
+        next_cursor = encode_cursor([comments[-1]["createdAt"], comments[-1]["commentId"]]) if has_next and comments else None
+
+        return PaginatedData(
+            items=[self._formatComment(c) for c in comments],
+            pagination=PaginationMeta(
+                totalCount=total_count,
+                limit=limit,
+                totalPage=total_page,
+                hasNext=has_next,
+                nextCursor=next_cursor
+            )
+        )
 
     async def createComment(self, postId: str, req: CommentCreateRequest, user: Dict) -> CommentResponse:
         """댓글 작성"""
@@ -47,17 +75,21 @@ class CommentController:
         if not post:
             raise APIError(ErrorCode.POST_NOT_FOUND, ResourceError(resource="게시글", id=postId))
 
-        comment_data = await comment_model.createComment(
-            postId=postId,
-            userId=user["userId"],
-            userNickname=user["nickname"],
-            content=req.content
-        )
-        
-        # 게시글의 댓글 수 캐시 업데이트
-        await post_model.updateCommentCount(postId, 1)
+        # 댓글 INSERT와 게시글 댓글 수 갱신을 하나의 트랜잭션으로 처리
+        # 댓글 INSERT가 FK로 posts 행에 공유 잠금을 건 뒤 posts UPDATE를 기다리면 동시 작성 시 교착 상태가 발생하므로
+        # 댓글 수 갱신(posts 행 배타 잠금)을 먼저 수행
+        async with transaction():
+            comment_count = await post_model.updateCommentCount(postId, 1)
+
+            comment_data = await comment_model.createComment(
+                postId=postId,
+                userId=user["userId"],
+                userNickname=user["nickname"],
+                content=req.content
+            )
 
-        return await self._formatComment(comment_data)
+        event_bus.publish(COMMENT_COUNT, {"postId": post["postId"], "commentCount": comment_count})
+        return self._formatComment(comment_data)
 
     async def updateComment(self, postId: str, commentId: str, req: CommentUpdateRequest, user: Dict) -> CommentResponse:
         """댓글 수정"""
@@ -80,7 +112,7 @@ class CommentController:
             content=req.content
         )
 
-        return await self._formatComment(updated_comment)
+        return self._formatComment(updated_comment)
 
     async def deleteComment(self, postId: str, commentId: str, user: Dict) -> Dict:
         """댓글 삭제"""
@@ -98,11 +130,13 @@ class CommentController:
         if str(comment["userId"]) != str(user["userId"]):
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="댓글"))
 
-        await comment_model.deleteComment(commentId)
-        
-        # 게시글의 댓글 수 캐시 업데이트
-        await post_model.updateCommentCount(postId, -1)
+        # 작성과 같은 순서(posts → comments)로 잠금
+        async with transaction():
+            comment_count = await post_model.updateCommentCount(postId, -1)
+
+            await comment_model.deleteComment(commentId)
 
+        event_bus.publish(COMMENT_COUNT, {"postId": post["postId"], "commentCount": comment_count})
         return comment
 
 
@@ -1,42 +1,40 @@
-from typing import List, Dict, Union, Optional
-from models.post_model import post_model
+from typing import List, Dict, Union, Optional, Tuple
+from models.post_model import post_model, post_hit_buffer
 from models.comment_model import comment_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
-from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostAuthor, PostFile, PaginatedData, PaginationMeta, ResourceError
+from utils.common.pagination_utils import encode_cursor, decode_cursor
+from utils.common.view_dedup import view_deduplicator
+from utils.common.image_variants import image_variant_pipeline
+from utils.common.http_cache import make_etag
+from utils.common.event_bus import event_bus, POST_CREATED, POST_DELETED, LIKE_COUNT
+from utils.database.db import transaction
+from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostAuthor, PostFile, PostImage, PaginatedData, PaginationMeta, ResourceError
 
 
 class PostController:
     """게시글 관련 비즈니스 로직"""
 
-    async def _formatPost(
+    def _buildPostResponse(
         self,
         post: Dict,
-        current_user_id: Optional[str] = None,
+        post_images: Optional[List[Dict]] = None,
+        is_liked: Optional[bool] = None,
     ) -> PostResponse:
-        """Post 데이터를 API 응답 규격에 맞게 변환"""
-        author_id = post["authorId"]
-
-        nickname = post.get("authorNickname")
-        profile_image_url = post.get("authorProfileImageUrl")
-        
+        """Post 데이터와 미리 조회한 이미지로 API 응답 객체 생성 (DB 조회 없음)"""
         author_data = PostAuthor(
-            userId=author_id,
-            nickname=nickname,
-            profileImageUrl=profile_image_url
+            userId=post["authorId"],
+            nickname=post.get("authorNickname"),
+            profileImageUrl=post.get("authorProfileImageUrl")
         )
 
-        is_liked = post.get("isLiked")
-        if is_liked is None and current_user_id:
-            is_liked = await post_model.isLikedByUser(post["postId"], current_user_id)
-        
         # 다중 이미지 처리
-        post_images = await post_model.getPostImages(post["postId"])
-        from schemas import PostImage
         files_list = [
             PostImage(
                 imageId=img["imageId"],
                 imageUrl=img["imageUrl"],
+                thumbUrl=img.get("thumbUrl") or img["imageUrl"],
+                mediumUrl=img.get("mediumUrl") or img["imageUrl"],
                 sortOrder=img["sortOrder"]
             )
             for img in post_images
@@ -45,10 +43,11 @@ class PostController:
         return PostResponse(
             postId=post["postId"],
             title=post["title"],
-            content=post["content"],
+            content=post.get("content"),
+            excerpt=post.get("excerpt"),
             likeCount=post.get("likeCount", 0), # 캐시된 값 사용
             commentCount=post.get("commentCount", 0), # 캐시된 값 사용
-            hits=post["hits"],
+            hits=post["hits"] + post_hit_buffer.pending(post["postId"]),  # 아직 반영되지 않은 조회수 포함
             author=author_data,
             files=files_list,
             createdAt=post["createdAt"],
@@ -56,18 +55,51 @@ class PostController:
             isLiked=is_liked,
         )
 
-    async def getAllPosts(self, limit: int = 10, offset: int = 0, current_user_id: Optional[str] = None) -> PaginatedData[List[PostResponse]]:
-        """게시글 목록 조회 로직 (페이징 메타데이터 포함)"""
-        result = await post_model.getPosts(limit=limit, offset=offset, current_user_id=current_user_id)
+    async def _formatPost(
+        self,
+        post: Dict,
+        current_user_id: Optional[str] = None,
+    ) -> PostResponse:
+        """Post 데이터를 API 응답 규격에 맞게 변환 (단건용)"""
+        is_liked = post.get("isLiked")
+        if is_liked is None:
+            is_liked = await post_model.isLikedByUser(post["postId"], current_user_id) if current_user_id else False
+
+        post_images = await post_model.getPostImages(post["postId"])
+        return self._buildPostResponse(post, post_images, is_liked)
+
+    async def _formatPosts(self, posts: List[Dict], current_user_id: Optional[str] = None) -> List[PostResponse]:
+        """
+        Post 목록을 API 응답 규격에 맞게 변환 (목록용)
+        - 이미지와 좋아요 여부를 각각 단일 IN 쿼리로 일괄 조회하여 게시글 수와 무관하게 쿼리 횟수 고정
+        """
+        post_ids = [post["postId"] for post in posts]
+        images_by_post = await post_model.getPostImagesBulk(post_ids)
+        liked_post_ids = await post_model.getLikedPostIds(post_ids, current_user_id) if current_user_id else set()
+        return [
+            self._buildPostResponse(post, images_by_post.get(post["postId"]), post["postId"] in liked_post_ids)
+            for post in posts
+        ]
+
+    async def getAllPosts(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        current_user_id: Optional[str] = None,
+        exact_count: bool = False,
+        summary: bool = False,
+    ) -> PaginatedData[List[PostResponse]]:
+        """게시글 목록 조회 로직 (페이징 메타데이터 포함, totalCount는 exact_count=False 시 캐시된 근사치, summary 시 본문 대신 미리보기)"""
+        result = await post_model.getPosts(limit=limit, offset=offset, exactCount=exact_count, summary=summary)
         posts_data = result["posts"]
         total_count = result["totalCount"]
 
-        formatted_posts = [await self._formatPost(post, current_user_id=current_user_id) for post in posts_data]
+        formatted_posts = await self._formatPosts(posts_data, current_user_id=current_user_id)
         
         # 페이징 메타데이터 계산
         total_page = (total_count + limit - 1) // limit if total_count > 0 else 0
         current_page = (offset // limit) + 1
-        has_next = offset + limit < total_count
+        has_next = result["hasNext"]
 
         return PaginatedData(
             items=formatted_posts,
@@ -81,13 +113,47 @@ class PostController:
             )
         )
 
+    async def getPostsByCursor(
+        self,
+        limit: int = 10,
+        cursor: str = "",
+        current_user_id: Optional[str] = None,
+        exact_count: bool = False,
+        summary: bool = False,
+    ) -> PaginatedData[List[PostResponse]]:
+        """게시글 목록 조회 로직 (커서 기반, 빈 커서는 첫 페이지, summary 시 본문 대신 미리보기)"""
+        before_post_id = decode_cursor(cursor, 1)[0] if cursor else None
+        result = await post_model.getPostsByCursor(
+            limit=limit, beforePostId=before_post_id, exactCount=exact_count, summary=summary
+        )
+        posts_data = result["posts"]
+        total_count = result["totalCount"]
+        has_next = result["hasNext"]
+
+        formatted_posts = await self._formatPosts(posts_data, current_user_id=current_user_id)
+
+        total_page = (total_count + limit - 1) // limit if total_count > 0 else 0
+        next_cursor = encode_cursor([posts_data[-1]["postId"]]) if has_next and posts_data else None
+
+        return PaginatedData(
+            items=formatted_posts,
+            pagination=PaginationMeta(
+                totalCount=total_count,
+                limit=limit,
+                totalPage=total_page,
+                hasNext=has_next,
+                nextCursor=next_cursor
+            )
+        )
+
     async def getPostById(
         self,
         postId: str,
         incHits: bool = True,
         current_user_id: Optional[str] = None,
+        viewer_key: Optional[str] = None,
     ) -> PostResponse:
-        """게시글 상세 조회 로직"""
+        """게시글 상세 조회 로직 (viewer_key: 조회수 중복 제거용 세션 키 또는 클라이언트 IP)"""
         post = await post_model.getPostById(postId)
         if not post:
             raise APIError(
@@ -95,14 +161,71 @@ class PostController:
                 ResourceError(resource="게시글", id=postId)
             )
 
-        # 조회수 증가 (필요한 경우만)
-        if incHits:
-            await post_model.incrementViewCount(postId)
-            # 증가된 데이터 반영을 위해 다시 조회
-            post = await post_model.getPostById(postId)
+        # 조회수 증가 (필요한 경우만, 윈도우 내 같은 조회자의 반복 조회는 제외하고 버퍼에 누적)
+        if incHits and view_deduplicator.first_view(viewer_key, post["postId"]):
+            post_hit_buffer.add(post["postId"])
 
         return await self._formatPost(post, current_user_id=current_user_id)
 
+    def _makePostEtag(
+        self,
+        post: Dict,
+        image_state: str,
+        hits: int,
+        is_liked: bool,
+        current_user_id: Optional[str],
+    ) -> str:
+        """
+        게시글 상세 응답의 ETag (버전 조회와 상세 조회가 같은 값으로 계산해야 304 판단이 일치)
+        - 카운터(조회수/좋아요/댓글 수)와 조회자의 좋아요 여부는 어떤 타임스탬프에도 반영되지 않으므로
+          Last-Modified / If-Modified-Since는 사용하지 않고 ETag로만 검증
+        """
+        return make_etag(
+            "post",
+            post["postId"],
+            post["updatedAt"],
+            post["authorNickname"],
+            post["authorProfileImageUrl"],
+            image_state,
+            hits,
+            post["likeCount"],
+            post["commentCount"],
+            bool(is_liked),
+            current_user_id or "",
+        )
+
+    async def getPostEtag(self, postId: str, current_user_id: Optional[str] = None) -> Optional[str]:
+        """
+        조건부 요청의 빠른 검증용 ETag (본문 조회 없이 버전 정보만 사용, 일치하면 304)
+        - 게시글이 없으면 None (이후 상세 조회에서 404 처리)
+        """
+        version = await post_model.getPostVersion(postId, current_user_id)
+        if not version:
+            return None
+
+        hits = version["hits"] + post_hit_buffer.pending(version["postId"])
+        return self._makePostEtag(version, version["imageState"], hits, version["isLiked"], current_user_id)
+
+    async def getPostWithEtag(self, postId: str, current_user_id: Optional[str] = None) -> Tuple[PostResponse, str]:
+        """
+        조회수 증가 없는 상세 조회 + 응답을 만든 데이터로 계산한 ETag
+        - 버전 조회 이후 커밋된 쓰기가 있어도 ETag와 본문이 항상 같은 시점의 데이터를 가리키도록 본문 기준으로 다시 계산
+        """
+        post = await post_model.getPostById(postId)
+        if not post:
+            raise APIError(
+                ErrorCode.POST_NOT_FOUND,
+                ResourceError(resource="게시글", id=postId)
+            )
+
+        is_liked = await post_model.isLikedByUser(post["postId"], current_user_id) if current_user_id else False
+        post_images = await post_model.getPostImages(post["postId"])
+        response = self._buildPostResponse(post, post_images, is_liked)
+        etag = self._makePostEtag(
+            post, post_model.imageState(post_images), response.hits, is_liked, current_user_id
+        )
+        return response, etag
+
     async def createPost(self, req: PostCreateRequest, user: Dict) -> PostResponse:
         """게시글 생성 로직"""
         post_data = await post_model.createPost(
@@ -113,7 +236,14 @@ class PostController:
             fileUrls=req.fileUrls
         )
 
-        return await self._formatPost(post_data, current_user_id=user["userId"])
+        response = await self._formatPost(post_data, current_user_id=user["userId"])
+        event_bus.publish(POST_CREATED, {
+            "postId": response.postId,
+            "title": response.title,
+            "author": response.author.model_dump(),
+            "createdAt": response.createdAt,
+        })
+        return response
 
     async def updatePost(self, postId: str, req: PostUpdateRequest, user: Dict) -> PostResponse:
         """게시글 수정 로직"""
@@ -150,22 +280,31 @@ class PostController:
         if str(post["authorId"]) != str(user["userId"]):
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="게시글"))
 
-        # 게시글 삭제 시 관련 댓글들도 함께 삭제
-        await comment_model.deleteCommentsByPost(postId)
+        # 댓글 작성/삭제와 같은 순서(posts → comments)로 잠금
+        async with transaction():
+            # Model을 통해 게시글 삭제
+            await post_model.deletePost(postId)
 
-        # Model을 통해 게시글 삭제
-        await post_model.deletePost(postId)
+            # 게시글 삭제 시 관련 댓글들도 함께 삭제
+            await comment_model.deleteCommentsByPost(postId)
 
+        event_bus.publish(POST_DELETED, {"postId": post["postId"]})
         return post
 
+    def scheduleImageVariants(self, fileUrls: List[str]) -> None:
+        """업로드된 게시글 이미지의 썸네일/중간 크기 변형 생성을 백그라운드로 예약"""
+        for fileUrl in fileUrls:
+            image_variant_pipeline.schedule(fileUrl, onComplete=post_model.setImageVariants)
+
     async def togglePostLike(self, postId: str, userId: str) -> Dict:
-        """게시글 좋아요 토글"""
+        """게시글 좋아요 토글 (likeCount, isLiked 반환)"""
         post = await post_model.getPostById(postId)
         if not post:
             raise APIError(ErrorCode.POST_NOT_FOUND, ResourceError(resource="게시글", id=postId))
             
-        likeCount = await post_model.toggleLike(postId, userId)
-        return {"likeCount": likeCount}
+        result = await post_model.toggleLike(postId, userId)
+        event_bus.publish(LIKE_COUNT, {"postId": post["postId"], "likeCount": result["likeCount"]})
+        return result
 
 
 post_controller = PostController()
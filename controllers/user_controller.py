@@ -5,6 +5,7 @@ from models.post_model import post_model
 from models.comment_model import comment_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
+from utils.common.event_bus import event_bus, PROFILE_CHANGED
 from schemas import UserUpdateRequest, PasswordChangeRequest, UserResponse, ResourceError, FieldError
 
 
@@ -39,7 +40,14 @@ class UserController:
             post_model.updateAuthorNickname(userId, req.nickname)
             comment_model.updateUserNickname(userId, req.nickname)
 
-        return UserResponse.model_validate(updatedUser)
+        response = UserResponse.model_validate(updatedUser)
+        if req.nickname != currentUser["nickname"] or req.profileImageUrl != currentUser.get("profileImageUrl"):
+            event_bus.publish(PROFILE_CHANGED, {
+                "userId": response.userId,
+                "nickname": response.nickname,
+                "profileImageUrl": response.profileImageUrl,
+            })
+        return response
 
     async def changePassword(self, userId: str, req: PasswordChangeRequest, currentUser: Dict) -> Dict:
         """비밀번호 변경"""
@@ -9,7 +9,7 @@ from utils.database.db import execute, init_pool, close_pool
 
 OPTIMIZATION_SQL = [
     "CREATE INDEX idx_posts_deleted_created ON posts(deleted_at, created_at DESC)",
-    "CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC)",
+    "CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC, comment_id DESC)",
     "CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC)"
 ]
 
@@ -41,7 +41,7 @@ from utils.database.db import execute, init_pool, close_pool
 
 OPTIMIZATION_SQL = [
     "CREATE INDEX idx_posts_deleted_created ON posts(deleted_at, created_at DESC)",
-    "CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC)",
+    "CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC, comment_id DESC)",
     "CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC)"
 ]
 
@@ -0,0 +1,104 @@
+"""
+업로드 이미지 가비지 컬렉션 (mark-and-sweep)
+- mark: DB에서 참조 중인 이미지 URL 수집
+        (post_images.image_url/thumb_url/medium_url, posts.post_image_url, users.profile_image_url)
+        원본이 참조되면 그 변형(_thumb/_medium)도 참조된 것으로 간주
+- sweep: public/image/{post,profile} 아래에서 참조되지 않은 파일 삭제
+  업로드 직후 아직 게시글/프로필에 연결되지 않은 파일을 지우지 않도록 --min-age 보다 오래된 파일만 대상
+- 콘텐츠 주소 저장(같은 내용 = 같은 파일)으로 파일 하나를 여러 행이 공유하므로 행 삭제 시 파일을 즉시 지우지 않고 이 스크립트로 정리
+
+사용 예:
+    python db/gc_images.py                 # 삭제 대상만 출력 (dry-run)
+    python db/gc_images.py --apply         # 실제 삭제
+    python db/gc_images.py --apply --exclude-deleted   # 삭제(soft delete)된 게시글/사용자의 이미지도 정리
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Set
+
+# 프로젝트 루트를 path에 추가 (db 폴더 내부이므로 한 단계 더 위로)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(PROJECT_ROOT)
+
+from utils.common.image_variants import VARIANT_SIZES, variant_url
+from utils.database.db import close_pool, fetch_all, init_pool
+
+IMAGE_DIRS = ["public/image/post", "public/image/profile"]
+
+
+async def collect_references(exclude_deleted: bool) -> Set[str]:
+    """DB에서 참조 중인 이미지 URL 수집 (원본 참조 시 변형 URL 포함)"""
+    posts_filter = "WHERE p.deleted_at IS NULL" if exclude_deleted else ""
+    deleted_filter = "AND deleted_at IS NULL" if exclude_deleted else ""
+    queries = [
+        f"""
+        SELECT pi.image_url AS url, pi.thumb_url AS thumb, pi.medium_url AS medium
+        FROM post_images pi
+        JOIN posts p ON p.post_id = pi.post_id
+        {posts_filter}
+        """,
+        f"SELECT post_image_url AS url FROM posts WHERE post_image_url IS NOT NULL {deleted_filter}",
+        f"SELECT profile_image_url AS url FROM users WHERE profile_image_url IS NOT NULL {deleted_filter}",
+    ]
+
+    references: Set[str] = set()
+    for query in queries:
+        for row in await fetch_all(query, primary=True):
+            for value in row.values():
+                if value:
+                    references.add(value)
+
+    for url in list(references):
+        references.update(variant_url(url, name) for name in VARIANT_SIZES)
+    return references
+
+
+def sweep(references: Set[str], min_age: float, apply: bool) -> None:
+    now = time.time()
+    removed, removed_bytes, kept = 0, 0, 0
+    for image_dir in IMAGE_DIRS:
+        directory = os.path.join(PROJECT_ROOT, image_dir)
+        if not os.path.exists(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            path = os.path.join(directory, filename)
+            if not os.path.isfile(path):
+                continue
+            if f"/{image_dir}/{filename}" in references or now - os.path.getmtime(path) < min_age:
+                kept += 1
+                continue
+
+            size = os.path.getsize(path)
+            print(f"{'삭제' if apply else '삭제 대상'}: {image_dir}/{filename} ({size} bytes)")
+            if apply:
+                os.remove(path)
+            removed += 1
+            removed_bytes += size
+
+    print(f"\n참조 중/보존: {kept}개, {'삭제' if apply else '삭제 대상'}: {removed}개 ({removed_bytes / 1024 / 1024:.2f}MB)")
+    if not apply and removed:
+        print("실제로 삭제하려면 --apply 옵션을 추가하세요.")
+
+
+async def gc_images(apply: bool, min_age_hours: float, exclude_deleted: bool) -> None:
+    print("이미지 가비지 컬렉션을 시작합니다...")
+    await init_pool()
+    try:
+        references = await collect_references(exclude_deleted)
+    finally:
+        await close_pool()
+    print(f"참조 중인 URL: {len(references)}개")
+    sweep(references, min_age_hours * 3600, apply)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Unreferenced upload image garbage collector")
+    parser.add_argument("--apply", action="store_true", help="실제로 삭제 (기본은 dry-run)")
+    parser.add_argument("--min-age", type=float, default=24, help="이 시간(시간 단위)보다 오래된 파일만 삭제")
+    parser.add_argument("--exclude-deleted", action="store_true", help="삭제된 게시글/사용자의 이미지는 참조로 보지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(gc_images(args.apply, args.min_age, args.exclude_deleted))
@@ -45,7 +45,11 @@ async def _maybe_clear(cursor, clear: bool):
 def _get_image_files(directory: str) -> List[str]:
     if not os.path.exists(directory):
         return []
-    return [f for f in os.listdir(directory) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))]
+    return [
+        f for f in os.listdir(directory)
+        if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))
+        and not os.path.splitext(f)[0].endswith(('_thumb', '_medium'))  # 리사이즈 변형 제외
+    ]
 
 
 async def _insert_users(cursor, faker: Faker, total: int, batch_size: int) -> List[str]:
@@ -94,8 +98,8 @@ async def _insert_posts(
     post_images = _get_image_files(post_img_dir)
 
     insert_sql = """
-        INSERT INTO posts (post_id, user_id, title, content, post_image_url, hits, comment_count, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s, 0, NOW())
+        INSERT INTO posts (post_id, user_id, title, content, excerpt, post_image_url, hits, comment_count, created_at)
+        VALUES (%s, %s, %s, %s, LEFT(%s, 200), %s, %s, 0, NOW())
     """
     while len(post_ids) < total:
         batch = min(batch_size, total - len(post_ids))
@@ -113,7 +117,7 @@ async def _insert_posts(
                 img_name = random.choice(post_images)
                 post_image_url = f"/public/image/post/{img_name}"
 
-            rows.append((post_id, user_id, title, content, post_image_url, hits))
+            rows.append((post_id, user_id, title, content, content, post_image_url, hits))
             post_ids.append(post_id)
         await cursor.executemany(insert_sql, rows)
     return post_ids
@@ -4,8 +4,8 @@
 -- 게시글 목록: deleted_at 필터 + created_at 정렬 최적화
 CREATE INDEX idx_posts_deleted_created ON posts(deleted_at, created_at DESC);
 
--- 댓글 목록(게시글): post_id + deleted_at + created_at 정렬 최적화
-CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC);
+-- 댓글 목록(게시글): post_id + deleted_at + (created_at, comment_id) 정렬 및 커서 seek 최적화
+CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC, comment_id DESC);
 
 -- 댓글 목록(사용자): user_id + deleted_at + created_at 정렬 최적화
 CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC);
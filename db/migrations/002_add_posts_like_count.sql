@@ -0,0 +1,17 @@
+-- Migration: Add denormalized like_count column to posts
+-- 목록/상세 조회 시 post_likes LEFT JOIN + GROUP BY 집계를 제거하기 위해
+-- 좋아요 수를 posts 테이블에 카운터로 저장합니다.
+-- 카운터는 post_likes INSERT/DELETE와 같은 트랜잭션에서 갱신됩니다. (PostModel.toggleLike)
+
+-- Add like_count column
+ALTER TABLE posts
+    ADD COLUMN like_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER comment_count;
+
+-- Backfill like_count from existing post_likes rows
+UPDATE posts p
+LEFT JOIN (
+    SELECT post_id, COUNT(*) AS cnt
+    FROM post_likes
+    GROUP BY post_id
+) pl ON pl.post_id = p.post_id
+SET p.like_count = COALESCE(pl.cnt, 0);
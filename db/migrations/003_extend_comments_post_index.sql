@@ -0,0 +1,9 @@
+-- Migration: Extend comment list index for cursor pagination
+-- 댓글 목록을 (created_at, comment_id) 커서로 seek 하기 위해
+-- idx_comments_post_deleted_created에 comment_id를 정렬 키로 추가합니다.
+-- created_at은 초 단위이므로 같은 초에 작성된 댓글은 comment_id(ULID)로 순서를 정합니다.
+-- InnoDB가 보조 인덱스에 붙이는 PK는 오름차순이므로, DESC 정렬을 filesort 없이 처리하려면 명시가 필요합니다.
+
+ALTER TABLE comments
+    DROP INDEX idx_comments_post_deleted_created,
+    ADD INDEX idx_comments_post_deleted_created (post_id, deleted_at, created_at DESC, comment_id DESC);
@@ -0,0 +1,10 @@
+-- Migration: Add resized variant URLs to post_images
+-- 업로드 직후 백그라운드에서 생성되는 썸네일(thumb)/중간 크기(medium) 변형의 URL을 저장합니다.
+-- 변형 생성이 끝나기 전이거나 Pillow가 없는 환경에서는 NULL이며, 이때 응답은 원본 URL을 사용합니다.
+-- 변형 생성 완료 시 image_url로 행을 찾아 갱신하므로 image_url 인덱스를 추가합니다.
+
+ALTER TABLE post_images
+    ADD COLUMN thumb_url VARCHAR(512) NULL AFTER image_url,
+    ADD COLUMN medium_url VARCHAR(512) NULL AFTER thumb_url;
+
+CREATE INDEX idx_post_images_url ON post_images(image_url);
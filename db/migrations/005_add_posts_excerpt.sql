@@ -0,0 +1,11 @@
+-- Migration: Add stored excerpt column to posts
+-- 게시글 목록(view=summary)에서 TEXT 본문 전체 대신 앞부분 미리보기만 읽고 전송하기 위해
+-- 본문 앞 200자를 excerpt 컬럼에 저장합니다.
+-- 작성/수정 시 PostModel이 함께 갱신하며, 길이는 models/post_model.py의 EXCERPT_LENGTH와 같아야 합니다.
+
+-- Add excerpt column
+ALTER TABLE posts
+    ADD COLUMN excerpt VARCHAR(200) NULL AFTER content;
+
+-- Backfill excerpt from existing content
+UPDATE posts SET excerpt = LEFT(content, 200) WHERE excerpt IS NULL;
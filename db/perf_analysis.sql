@@ -14,7 +14,7 @@ SELECT
     p.updated_at,
     p.hits,
     p.comment_count,
-    (SELECT COUNT(*) FROM post_likes pl WHERE pl.post_id = p.post_id) AS like_count
+    p.like_count
 FROM posts p
 LEFT JOIN users u ON u.user_id = p.user_id
 WHERE p.deleted_at IS NULL
@@ -34,7 +34,7 @@ SELECT
     p.updated_at,
     p.hits,
     p.comment_count,
-    (SELECT COUNT(*) FROM post_likes pl WHERE pl.post_id = p.post_id) AS like_count
+    p.like_count
 FROM posts p
 LEFT JOIN users u ON u.user_id = p.user_id
 WHERE p.post_id = '01JEXAMPLEPOST00000000000000' AND p.deleted_at IS NULL;
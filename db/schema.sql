@@ -16,9 +16,11 @@ CREATE TABLE IF NOT EXISTS posts (
     user_id VARCHAR(26) NULL,
     title VARCHAR(300) NOT NULL,
     content TEXT NOT NULL,
+    excerpt VARCHAR(200) NULL,
     post_image_url VARCHAR(512) NULL,
     hits INT UNSIGNED NOT NULL DEFAULT 0,
     comment_count INT UNSIGNED NOT NULL DEFAULT 0,
+    like_count INT UNSIGNED NOT NULL DEFAULT 0,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL,
     deleted_at TIMESTAMP NULL,
@@ -43,7 +45,7 @@ CREATE TABLE IF NOT EXISTS comments (
 
 CREATE INDEX idx_post_created ON comments(post_id, created_at ASC);
 CREATE INDEX idx_user ON comments(user_id);
-CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC);
+CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC, comment_id DESC);
 CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC);
 
 CREATE TABLE IF NOT EXISTS post_likes (
@@ -74,6 +76,8 @@ CREATE TABLE IF NOT EXISTS post_images (
     image_id VARCHAR(50) PRIMARY KEY,
     post_id VARCHAR(26) NOT NULL,
     image_url VARCHAR(512) NOT NULL,
+    thumb_url VARCHAR(512) NULL,
+    medium_url VARCHAR(512) NULL,
     sort_order INT UNSIGNED NOT NULL DEFAULT 0,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT fk_post_images_post FOREIGN KEY (post_id) REFERENCES posts(post_id) ON DELETE CASCADE
@@ -81,3 +85,4 @@ CREATE TABLE IF NOT EXISTS post_images (
 
 CREATE INDEX idx_post_images_post_order ON post_images(post_id, sort_order ASC);
 CREATE INDEX idx_post_images_post ON post_images(post_id);
+CREATE INDEX idx_post_images_url ON post_images(image_url);
@@ -1,18 +1,25 @@
+import hmac
 import logging
 import os
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
 
 from utils.common.response import StandardResponse
-from utils.errors.error_codes import SuccessCode
+from utils.common.metrics import metrics
+from utils.common.password_utils import shutdown_password_pool
+from utils.errors.error_codes import ErrorCode, SuccessCode
+from utils.errors.exceptions import APIError
 from utils.middleware.auth_middleware import AuthMiddleware
 from utils.middleware.db_session_middleware import DBSessionMiddleware
 from utils.middleware.request_id_middleware import RequestIDMiddleware, request_id_ctx
 from utils.middleware.access_log_middleware import AccessLogMiddleware
+from utils.middleware.compression_middleware import CompressionMiddleware
+from utils.common.compression import PrecompressedStaticFiles
 from utils.errors.exception_handlers import register_exception_handlers
 from utils.database.db import init_pool, close_pool
+from models.post_model import post_hit_buffer
+from utils.common.image_variants import image_variant_pipeline
 
 # 로깅 필터: 로그에 request_id 추가
 class RequestIDFilter(logging.Filter):
@@ -49,11 +56,17 @@ app = FastAPI(
 @app.on_event("startup")
 async def startup_event():
     await init_pool()
+    post_hit_buffer.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    # 반영되지 않은 조회수를 커넥션 풀 종료 전에 반영
+    await post_hit_buffer.stop()
+    # 진행 중인 이미지 변형 생성(및 DB 갱신)을 마친 뒤 풀 종료
+    await image_variant_pipeline.shutdown()
     await close_pool()
+    shutdown_password_pool()
 
 # 정적 파일 서빙
 UPLOAD_DIR = "public"
@@ -62,9 +75,14 @@ if not os.path.exists(UPLOAD_DIR):
     os.makedirs(os.path.join(UPLOAD_DIR, "image/post"))
     os.makedirs(os.path.join(UPLOAD_DIR, "image/profile"))
 
-app.mount("/public", StaticFiles(directory=UPLOAD_DIR), name="public")
+# 압축 가능한 정적 파일은 사전 압축본(.br/.gz)을 캐시해 두고 제공
+app.mount(
+    "/public",
+    PrecompressedStaticFiles(directory=UPLOAD_DIR, cache_dir=settings.static_precompress_dir),
+    name="public",
+)
 
-# 미들웨어 등록 (LIFO 순서로 실행됨: RequestID -> AccessLog -> CORS -> Session -> Auth -> App)
+# 미들웨어 등록 (LIFO 순서로 실행됨: RequestID -> AccessLog -> Compression -> CORS -> Session -> Auth -> App)
 app.add_middleware(AuthMiddleware)
 app.add_middleware(DBSessionMiddleware)
 app.add_middleware(CORSMiddleware,
@@ -77,6 +95,7 @@ app.add_middleware(CORSMiddleware,
                    allow_credentials=True,
                    allow_methods=["*"],
                    allow_headers=["*"])
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(AccessLogMiddleware)
 app.add_middleware(RequestIDMiddleware)
 
@@ -88,12 +107,25 @@ async def health_check():
     logger.info("Health check endpoint called")
     return StandardResponse.success(SuccessCode.SUCCESS, {"status": "healthy"})
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint(request: Request):
+    """내부용 메트릭 (커넥션 풀 사용량, 풀 획득 대기시간, 모델 메서드별 쿼리 수/지연/에러)"""
+    # 내부 구조가 드러나므로 토큰 일치 시(미설정이면 디버그 모드에서만) 노출, 그 외에는 존재 자체를 숨김
+    if settings.metrics_token:
+        authorization = request.headers.get("authorization", "")
+        if not hmac.compare_digest(authorization.encode(), f"Bearer {settings.metrics_token}".encode()):
+            raise APIError(ErrorCode.NOT_FOUND)
+    elif not settings.debug:
+        raise APIError(ErrorCode.NOT_FOUND)
+    return StandardResponse.success(SuccessCode.SUCCESS, metrics.snapshot())
+
 # 라우터 등록
-from routers import post_router, comment_router, auth_router, user_router
+from routers import post_router, comment_router, auth_router, user_router, event_router
 app.include_router(post_router)
 app.include_router(comment_router)
 app.include_router(auth_router)
 app.include_router(user_router)
+app.include_router(event_router)
 
 # 개발 환경(Debug Mode)에서만 테스트 라우터 포함
 if settings.debug:
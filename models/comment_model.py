@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Dict, List, Optional, Union
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.database.db import fetch_one, fetch_all, execute, transaction
 
 
 class CommentModel:
@@ -23,6 +24,7 @@ class CommentModel:
             "postId": row["post_id"],
             "userId": row["user_id"],
             "userNickname": row.get("user_nickname"),
+            "userProfileImageUrl": row.get("user_profile_image_url"),
             "content": row["content"],
             "createdAt": self._format_datetime(row.get("created_at")),
             "updatedAt": self._format_datetime(row.get("updated_at")),
@@ -48,40 +50,64 @@ class CommentModel:
         postIdStr = self._normalizeId(postId)
         userIdStr = self._normalizeId(userId)
 
-        await execute(
-            """
-            INSERT INTO comments (comment_id, post_id, user_id, content, created_at)
-            VALUES (%s, %s, %s, %s, NOW())
-            """,
-            (commentId, postIdStr, userIdStr, content),
-        )
+        async with transaction():
+            await execute(
+                """
+                INSERT INTO comments (comment_id, post_id, user_id, content, created_at)
+                VALUES (%s, %s, %s, %s, NOW())
+                """,
+                (commentId, postIdStr, userIdStr, content),
+            )
 
-        comment = await self.getCommentById(commentId)
+            comment = await self.getCommentById(commentId)
         if comment:
             comment["userNickname"] = userNickname
         return comment
 
-    async def getCommentsByPost(self, postId: Union[str, any]) -> List[Dict]:
-        """특정 게시글의 모든 댓글 조회 (최신순)"""
-        postIdStr = self._normalizeId(postId)
+    async def getCommentsByPost(
+        self,
+        postId: Union[str, any],
+        limit: int = 20,
+        beforeCreatedAt: Optional[datetime] = None,
+        beforeCommentId: Optional[str] = None,
+    ) -> Dict[str, Union[List[Dict], bool]]:
+        """
+        특정 게시글의 댓글 조회 (최신순, 커서 기반 페이징)
+        - (created_at, comment_id) < 커서 조건으로 idx_comments_post_deleted_created 범위를 seek
+        - 다음 페이지 존재 여부 판단을 위해 limit + 1개를 조회
+        """
+        where = ["c.post_id = %s", "c.deleted_at IS NULL"]
+        params: List = [self._normalizeId(postId)]
+        if beforeCreatedAt is not None and beforeCommentId:
+            where.append("(c.created_at < %s OR (c.created_at = %s AND c.comment_id < %s))")
+            params.extend([beforeCreatedAt, beforeCreatedAt, self._normalizeId(beforeCommentId)])
+        params.append(limit + 1)
+
         rows = await fetch_all(
-            """
+            f"""
             SELECT
                 c.comment_id,
                 c.post_id,
                 c.user_id,
                 u.nickname AS user_nickname,
+                u.profile_image_url AS user_profile_image_url,
                 c.content,
                 c.created_at,
                 c.updated_at
             FROM comments c
             LEFT JOIN users u ON u.user_id = c.user_id
-            WHERE c.post_id = %s AND c.deleted_at IS NULL
-            ORDER BY c.created_at DESC
+            WHERE {' AND '.join(where)}
+            ORDER BY c.created_at DESC, c.comment_id DESC
+            LIMIT %s
             """,
-            (postIdStr,),
+            params,
         )
-        return [self._row_to_comment(row) for row in rows]
+
+        rows = list(rows)
+        return {
+            "comments": [self._row_to_comment(row) for row in rows[:limit]],
+            "hasNext": len(rows) > limit,
+        }
 
     async def getCommentById(self, commentId: Union[str, any]) -> Optional[Dict]:
         """ID로 댓글 조회"""
@@ -93,6 +119,7 @@ class CommentModel:
                 c.post_id,
                 c.user_id,
                 u.nickname AS user_nickname,
+                u.profile_image_url AS user_profile_image_url,
                 c.content,
                 c.created_at,
                 c.updated_at
@@ -107,15 +134,16 @@ class CommentModel:
     async def updateComment(self, commentId: Union[str, any], content: str) -> Optional[Dict]:
         """댓글 수정"""
         commentIdStr = self._normalizeId(commentId)
-        await execute(
-            """
-            UPDATE comments
-            SET content = %s, updated_at = NOW()
-            WHERE comment_id = %s AND deleted_at IS NULL
-            """,
-            (content, commentIdStr),
-        )
-        return await self.getCommentById(commentIdStr)
+        async with transaction():
+            await execute(
+                """
+                UPDATE comments
+                SET content = %s, updated_at = NOW()
+                WHERE comment_id = %s AND deleted_at IS NULL
+                """,
+                (content, commentIdStr),
+            )
+            return await self.getCommentById(commentIdStr)
 
     async def deleteComment(self, commentId: Union[str, any]) -> bool:
         """댓글 삭제"""
@@ -136,6 +164,7 @@ class CommentModel:
                 c.post_id,
                 c.user_id,
                 u.nickname AS user_nickname,
+                u.profile_image_url AS user_profile_image_url,
                 c.content,
                 c.created_at,
                 c.updated_at
@@ -1,11 +1,26 @@
-from typing import Dict, List, Optional, Union
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Union
+from config import settings
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.common.image_variants import ready_variant_urls
+from utils.database.db import fetch_one, fetch_all, execute, transaction
+from utils.database.write_behind import WriteBehindCounter
+
+# 목록 요약(view=summary)용 본문 미리보기 길이 (문자 수, 005 마이그레이션의 LEFT(content, 200)과 일치해야 함)
+EXCERPT_LENGTH = 200
 
 
 class PostModel:
     """게시글 데이터 관리 Model"""
 
+    def __init__(self):
+        # 활성 게시글 수 캐시 (목록 totalCount용, post_count_ttl 초마다 COUNT(*)로 재계산)
+        self._activePostsCount: Optional[int] = None
+        self._activePostsCountAt = 0.0
+        # 재계산 single-flight용 (TTL 만료 시 동시 요청이 COUNT(*)를 한 번만 실행하도록)
+        self._activePostsCountLock: Optional[asyncio.Lock] = None
+
     def _normalizeId(self, idVal: Union[str, any]) -> str:
         """ID 정규화 (문자열로 변환)"""
         return str(idVal)
@@ -21,7 +36,8 @@ class PostModel:
         return {
             "postId": row["post_id"],
             "title": row["title"],
-            "content": row["content"],
+            "content": row.get("content"),
+            "excerpt": row.get("excerpt"),  # 목록 view=summary 에서만 조회
             "authorId": row["author_id"],
             "authorNickname": row.get("author_nickname"),
             "authorProfileImageUrl": row.get("author_profile_image_url"),
@@ -31,13 +47,35 @@ class PostModel:
             "hits": row.get("hits", 0),
             "likeCount": row.get("like_count", 0),
             "commentCount": row.get("comment_count", 0),
-            "isLiked": bool(row.get("is_liked", 0)),
+            "isLiked": bool(row["is_liked"]) if "is_liked" in row else None,
+        }
+
+    def _row_to_image(self, row: Dict) -> Dict:
+        return {
+            "imageId": row["image_id"],
+            "postId": row["post_id"],
+            "imageUrl": row["image_url"],
+            "thumbUrl": row.get("thumb_url"),
+            "mediumUrl": row.get("medium_url"),
+            "sortOrder": row["sort_order"],
         }
 
     async def clear(self):
         """저장소 초기화 (테스트용)"""
         await execute("DELETE FROM post_likes")
         await execute("DELETE FROM posts")
+        self._activePostsCount = None
+
+    def _makeExcerpt(self, content: str) -> str:
+        """본문 미리보기 (앞 EXCERPT_LENGTH 문자)"""
+        return content[:EXCERPT_LENGTH]
+
+    def _listContentColumns(self, summary: bool) -> str:
+        """목록 조회 본문 컬럼 (summary면 TEXT 본문 대신 저장된 미리보기만, 아니면 본문만 조회)"""
+        if summary:
+            # 백필 이전 행(excerpt NULL)만 본문에서 계산
+            return f"COALESCE(p.excerpt, LEFT(p.content, {EXCERPT_LENGTH})) AS excerpt"
+        return "p.content"
 
     def getNextPostId(self) -> str:
         """다음 게시글 ID 생성 (ULID)"""
@@ -55,71 +93,121 @@ class PostModel:
         postId = self.getNextPostId()
         authorIdStr = self._normalizeId(authorId)
 
-        await execute(
-            """
-            INSERT INTO posts (post_id, user_id, title, content, post_image_url, hits, comment_count, created_at)
-            VALUES (%s, %s, %s, %s, %s, 0, 0, NOW())
-            """,
-            (postId, authorIdStr, title, content, None),  # post_image_url is now NULL
-        )
-        
-        # 여러 이미지 저장
-        if fileUrls:
-            await self.addPostImages(postId, fileUrls)
+        # 게시글 + 이미지 INSERT를 하나의 트랜잭션으로 처리 (부분 저장 방지)
+        async with transaction():
+            await execute(
+                """
+                INSERT INTO posts (post_id, user_id, title, content, excerpt, post_image_url, hits, comment_count, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, 0, 0, NOW())
+                """,
+                (postId, authorIdStr, title, content, self._makeExcerpt(content), None),  # post_image_url is now NULL
+            )
 
-        post = await self.getPostById(postId)
+            # 여러 이미지 저장
+            if fileUrls:
+                await self.addPostImages(postId, fileUrls)
+
+            post = await self.getPostById(postId)
+        self._adjustActivePostsCount(1)
         if post:
             post["authorNickname"] = authorNickname
         return post
 
-    async def getPosts(self, limit: int = 10, offset: int = 0, current_user_id: Optional[str] = None) -> Dict[str, Union[List[Dict], int]]:
-        """게시글 목록 조회 (페이징 지원)"""
-        current_user_id_str = self._normalizeId(current_user_id) if current_user_id else None
-        
+    async def getPosts(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        exactCount: bool = False,
+        summary: bool = False,
+    ) -> Dict[str, Union[List[Dict], int, bool]]:
+        """
+        게시글 목록 조회 (페이징 지원, 좋아요 여부는 getLikedPostIds로 별도 일괄 조회)
+        - totalCount는 캐시된 활성 게시글 수 (exactCount=True 시 COUNT(*) 재계산)
+        - 다음 페이지 존재 여부는 근사치 totalCount 대신 limit + 1개 조회로 판단
+        - summary=True 시 본문(content) 대신 미리보기(excerpt)만 조회
+        """
         rows = await fetch_all(
-            """
+            f"""
             SELECT
                 p.post_id,
                 p.user_id AS author_id,
                 u.nickname AS author_nickname,
                 u.profile_image_url AS author_profile_image_url,
                 p.title,
-                p.content,
+                {self._listContentColumns(summary)},
                 p.post_image_url,
                 p.created_at,
                 p.updated_at,
                 p.hits,
                 p.comment_count,
-                COUNT(pl.user_id) AS like_count,
-                MAX(CASE WHEN pl.user_id = %s THEN 1 ELSE 0 END) AS is_liked
+                p.like_count
             FROM posts p
             LEFT JOIN users u ON u.user_id = p.user_id
-            LEFT JOIN post_likes pl ON pl.post_id = p.post_id
             WHERE p.deleted_at IS NULL
-            GROUP BY
+            ORDER BY p.created_at DESC
+            LIMIT %s OFFSET %s
+            """,
+            (limit + 1, offset),
+        )
+
+        rows = list(rows)
+        return {
+            "posts": [self._row_to_post(row) for row in rows[:limit]],
+            "totalCount": await self.getActivePostsCount(exact=exactCount),
+            "hasNext": len(rows) > limit,
+        }
+
+    async def getPostsByCursor(
+        self,
+        limit: int = 10,
+        beforePostId: Optional[str] = None,
+        exactCount: bool = False,
+        summary: bool = False,
+    ) -> Dict[str, Union[List[Dict], int, bool]]:
+        """
+        게시글 목록 조회 (커서 기반 페이징)
+        - ULID(post_id)는 시간순 정렬되므로 post_id < cursor 조건으로 seek
+        - OFFSET 없이 PK 범위 스캔만 수행하여 깊은 페이지도 일정한 비용
+        - 다음 페이지 존재 여부 판단을 위해 limit + 1개를 조회
+        - summary=True 시 본문(content) 대신 미리보기(excerpt)만 조회
+        """
+        where = ["p.deleted_at IS NULL"]
+        params: List = []
+        if beforePostId:
+            where.append("p.post_id < %s")
+            params.append(self._normalizeId(beforePostId))
+        params.append(limit + 1)
+
+        rows = await fetch_all(
+            f"""
+            SELECT
                 p.post_id,
-                p.user_id,
-                u.nickname,
-                u.profile_image_url,
+                p.user_id AS author_id,
+                u.nickname AS author_nickname,
+                u.profile_image_url AS author_profile_image_url,
                 p.title,
-                p.content,
+                {self._listContentColumns(summary)},
                 p.post_image_url,
                 p.created_at,
                 p.updated_at,
                 p.hits,
-                p.comment_count
-            ORDER BY p.created_at DESC
-            LIMIT %s OFFSET %s
+                p.comment_count,
+                p.like_count
+            FROM posts p
+            LEFT JOIN users u ON u.user_id = p.user_id
+            WHERE {' AND '.join(where)}
+            ORDER BY p.post_id DESC
+            LIMIT %s
             """,
-            (current_user_id_str, limit, offset),
+            params,
         )
 
-        total_row = await fetch_one("SELECT COUNT(*) AS total FROM posts WHERE deleted_at IS NULL")
-        totalCount = total_row["total"] if total_row else 0
-
+        rows = list(rows)
+        hasNext = len(rows) > limit
         return {
-            "posts": [self._row_to_post(row) for row in rows],
-            "totalCount": totalCount,
+            "posts": [self._row_to_post(row) for row in rows[:limit]],
+            "totalCount": await self.getActivePostsCount(exact=exactCount),
+            "hasNext": hasNext,
         }
 
     async def getPostById(self, postId: Union[str, any]) -> Optional[Dict]:
@@ -139,27 +227,55 @@ class PostModel:
                 p.updated_at,
                 p.hits,
                 p.comment_count,
-                COUNT(pl.user_id) AS like_count
+                p.like_count
             FROM posts p
             LEFT JOIN users u ON u.user_id = p.user_id
-            LEFT JOIN post_likes pl ON pl.post_id = p.post_id
             WHERE p.post_id = %s AND p.deleted_at IS NULL
-            GROUP BY
+            """,
+            (postIdStr,),
+        )
+        return self._row_to_post(row)
+
+    async def getPostVersion(self, postId: Union[str, any], userId: Optional[Union[str, any]] = None) -> Optional[Dict]:
+        """
+        게시글 상세 응답의 버전 정보 조회 (조건부 요청 검증용, 본문/이미지는 읽지 않음)
+        - 응답에 영향을 주는 수정 시각, 카운터, 작성자 닉네임/프로필, 이미지 상태, 조회자의 좋아요 여부를 한 번에 조회
+        - imageState는 imageState()와 같은 형식 (상세 본문에서 계산한 ETag와 일치해야 함)
+        """
+        postIdStr = self._normalizeId(postId)
+        userIdStr = self._normalizeId(userId) if userId else None
+        row = await fetch_one(
+            """
+            SELECT
                 p.post_id,
-                p.user_id,
-                u.nickname,
-                u.profile_image_url,
-                p.title,
-                p.content,
-                p.post_image_url,
-                p.created_at,
                 p.updated_at,
                 p.hits,
-                p.comment_count
+                p.comment_count,
+                p.like_count,
+                u.nickname AS author_nickname,
+                u.profile_image_url AS author_profile_image_url,
+                (SELECT CONCAT(COUNT(*), ':', COUNT(pi.thumb_url), ':', COALESCE(MAX(pi.image_id), ''))
+                   FROM post_images pi WHERE pi.post_id = p.post_id) AS image_state,
+                EXISTS(SELECT 1 FROM post_likes pl WHERE pl.post_id = p.post_id AND pl.user_id = %s) AS is_liked
+            FROM posts p
+            LEFT JOIN users u ON u.user_id = p.user_id
+            WHERE p.post_id = %s AND p.deleted_at IS NULL
             """,
-            (postIdStr,),
+            (userIdStr, postIdStr),
         )
-        return self._row_to_post(row)
+        if not row:
+            return None
+        return {
+            "postId": row["post_id"],
+            "updatedAt": self._format_datetime(row["updated_at"]),
+            "authorNickname": row["author_nickname"],
+            "authorProfileImageUrl": row["author_profile_image_url"],
+            "hits": row["hits"],
+            "commentCount": row["comment_count"],
+            "likeCount": row["like_count"],
+            "imageState": row["image_state"],
+            "isLiked": bool(row["is_liked"]),
+        }
 
     async def incrementViewCount(self, postId: Union[str, any]) -> bool:
         """조회수 증가"""
@@ -170,6 +286,22 @@ class PostModel:
         )
         return affected > 0
 
+    async def addHitsBulk(self, hitDeltas: Dict[str, int]) -> None:
+        """게시글별 조회수 증가량을 다중 행 UPDATE 한 번으로 반영"""
+        if not hitDeltas:
+            return
+        postIds = [self._normalizeId(postId) for postId in hitDeltas]
+        cases = " ".join(["WHEN %s THEN %s"] * len(postIds))
+        placeholders = ", ".join(["%s"] * len(postIds))
+        params: List = []
+        for postId, delta in zip(postIds, hitDeltas.values()):
+            params.extend([postId, delta])
+        params.extend(postIds)
+        await execute(
+            f"UPDATE posts SET hits = hits + CASE post_id {cases} ELSE 0 END WHERE post_id IN ({placeholders})",
+            params,
+        )
+
     async def updatePost(
         self,
         postId: Union[str, any],
@@ -179,30 +311,31 @@ class PostModel:
     ) -> Optional[Dict]:
         """게시글 수정"""
         postIdStr = self._normalizeId(postId)
-        fields = ["title = %s", "content = %s", "updated_at = NOW()"]
-        params = [title, content]
+        fields = ["title = %s", "content = %s", "excerpt = %s", "updated_at = NOW()"]
+        params = [title, content, self._makeExcerpt(content)]
 
         # post_image_url은 NULL로 설정 (이제 post_images 테이블 사용)
         fields.append("post_image_url = %s")
         params.append(None)
 
         params.append(postIdStr)
-        await execute(
-            f"""
-            UPDATE posts
-            SET {', '.join(fields)}
-            WHERE post_id = %s AND deleted_at IS NULL
-            """,
-            params,
-        )
-        
-        # 기존 이미지 삭제 후 새 이미지 추가
-        if fileUrls is not None:
-            await self.deletePostImages(postIdStr)
-            if fileUrls:  # 빈 리스트가 아니면
-                await self.addPostImages(postIdStr, fileUrls)
-        
-        return await self.getPostById(postIdStr)
+        async with transaction():
+            await execute(
+                f"""
+                UPDATE posts
+                SET {', '.join(fields)}
+                WHERE post_id = %s AND deleted_at IS NULL
+                """,
+                params,
+            )
+
+            # 기존 이미지 삭제 후 새 이미지 추가
+            if fileUrls is not None:
+                await self.deletePostImages(postIdStr)
+                if fileUrls:  # 빈 리스트가 아니면
+                    await self.addPostImages(postIdStr, fileUrls)
+
+            return await self.getPostById(postIdStr)
 
     async def deletePost(self, postId: Union[str, any]) -> bool:
         """게시글 삭제"""
@@ -211,6 +344,8 @@ class PostModel:
             "UPDATE posts SET deleted_at = NOW() WHERE post_id = %s AND deleted_at IS NULL",
             (postIdStr,),
         )
+        if affected:
+            self._adjustActivePostsCount(-affected)
         return affected > 0
 
     async def getTotalPostsCount(self) -> int:
@@ -218,44 +353,91 @@ class PostModel:
         row = await fetch_one("SELECT COUNT(*) AS total FROM posts WHERE deleted_at IS NULL")
         return row["total"] if row else 0
 
-    async def toggleLike(self, postId: Union[str, any], userId: Union[str, any]) -> int:
-        """좋아요 토글"""
+    async def getActivePostsCount(self, exact: bool = False) -> int:
+        """
+        활성 게시글 수 (캐시)
+        - 생성/삭제 시 즉시 증감하고, post_count_ttl 초가 지나면 COUNT(*)로 재계산
+        - 다른 워커의 생성/삭제나 롤백된 증감은 최대 post_count_ttl 동안 반영되지 않을 수 있음
+        - 만료 시점에 몰린 요청은 락을 잡은 한 요청만 재계산하고 나머지는 그 결과를 사용
+        """
+        if not exact and not self._isActivePostsCountStale():
+            return self._activePostsCount
+
+        if self._activePostsCountLock is None:
+            self._activePostsCountLock = asyncio.Lock()
+        requestedAt = time.monotonic()
+        async with self._activePostsCountLock:
+            # 대기하는 동안 다른 요청이 재계산했으면 그 결과 사용 (exact는 대기 시작 이후 계산된 값만 인정)
+            if exact:
+                if self._activePostsCount is not None and self._activePostsCountAt >= requestedAt:
+                    return self._activePostsCount
+            elif not self._isActivePostsCountStale():
+                return self._activePostsCount
+
+            startedAt = time.monotonic()
+            self._activePostsCount = await self.getTotalPostsCount()
+            self._activePostsCountAt = startedAt
+        return self._activePostsCount
+
+    def _isActivePostsCountStale(self) -> bool:
+        return (
+            self._activePostsCount is None
+            or time.monotonic() - self._activePostsCountAt >= settings.post_count_ttl
+        )
+
+    def _adjustActivePostsCount(self, delta: int) -> None:
+        if self._activePostsCount is not None:
+            self._activePostsCount = max(0, self._activePostsCount + delta)
+
+    async def toggleLike(self, postId: Union[str, any], userId: Union[str, any]) -> Dict:
+        """
+        좋아요 토글 (변경 후 좋아요 여부와 좋아요 수 반환)
+        - post_likes INSERT/DELETE와 posts.like_count 갱신을 하나의 트랜잭션으로 처리
+        - posts 행을 먼저 FOR UPDATE로 잠가 같은 게시글에 대한 토글을 직렬화
+          (post_likes INSERT/DELETE가 FK로 posts 행에 공유 잠금을 건 뒤 UPDATE가 배타 잠금을 기다리면
+           동시 요청끼리 교착 상태(1213)가 발생하므로 잠금 순서를 posts → post_likes로 고정)
+        - INSERT IGNORE 결과(rowcount)로 기존 좋아요 여부를 판단하고, 잠금 시 읽은 값으로 갱신 후 좋아요 수 계산
+        """
         postIdStr = self._normalizeId(postId)
         userIdStr = self._normalizeId(userId)
 
-        existing = await fetch_one(
-            "SELECT 1 FROM post_likes WHERE post_id = %s AND user_id = %s",
-            (postIdStr, userIdStr),
-        )
+        async with transaction():
+            row = await fetch_one(
+                "SELECT like_count FROM posts WHERE post_id = %s FOR UPDATE",
+                (postIdStr,),
+            )
+            if not row:
+                return {"likeCount": 0, "isLiked": False}
 
-        if existing:
-            await execute(
-                "DELETE FROM post_likes WHERE post_id = %s AND user_id = %s",
+            inserted = await execute(
+                "INSERT IGNORE INTO post_likes (post_id, user_id, created_at) VALUES (%s, %s, NOW())",
                 (postIdStr, userIdStr),
             )
-        else:
-            await execute(
-                "INSERT INTO post_likes (post_id, user_id, created_at) VALUES (%s, %s, NOW())",
+            delta = 1 if inserted else -await execute(
+                "DELETE FROM post_likes WHERE post_id = %s AND user_id = %s",
                 (postIdStr, userIdStr),
             )
 
-        count_row = await fetch_one(
-            "SELECT COUNT(*) AS cnt FROM post_likes WHERE post_id = %s",
-            (postIdStr,),
-        )
-        return count_row["cnt"] if count_row else 0
+            if delta:
+                await execute(
+                    "UPDATE posts SET like_count = like_count + %s WHERE post_id = %s",
+                    (delta, postIdStr),
+                )
+
+        return {"likeCount": max(row["like_count"] + delta, 0), "isLiked": inserted > 0}
 
     async def updateCommentCount(self, postId: Union[str, any], delta: int) -> int:
         """댓글 수 업데이트 (캐시)"""
         postIdStr = self._normalizeId(postId)
-        await execute(
-            "UPDATE posts SET comment_count = comment_count + %s WHERE post_id = %s AND deleted_at IS NULL",
-            (delta, postIdStr),
-        )
-        row = await fetch_one(
-            "SELECT comment_count FROM posts WHERE post_id = %s AND deleted_at IS NULL",
-            (postIdStr,),
-        )
+        async with transaction():
+            await execute(
+                "UPDATE posts SET comment_count = comment_count + %s WHERE post_id = %s AND deleted_at IS NULL",
+                (delta, postIdStr),
+            )
+            row = await fetch_one(
+                "SELECT comment_count FROM posts WHERE post_id = %s AND deleted_at IS NULL",
+                (postIdStr,),
+            )
         return row["comment_count"] if row else 0
 
     def updateAuthorNickname(self, authorId: str, newNickname: str) -> int:
@@ -263,13 +445,13 @@ class PostModel:
         return 0
 
     async def getLikeCount(self, postId: Union[str, any]) -> int:
-        """좋아요 수 조회"""
+        """좋아요 수 조회 (posts.like_count 카운터)"""
         postIdStr = self._normalizeId(postId)
         row = await fetch_one(
-            "SELECT COUNT(*) AS cnt FROM post_likes WHERE post_id = %s",
+            "SELECT like_count FROM posts WHERE post_id = %s",
             (postIdStr,),
         )
-        return row["cnt"] if row else 0
+        return row["like_count"] if row else 0
 
     async def isLikedByUser(self, postId: Union[str, any], userId: Union[str, any]) -> bool:
         """특정 사용자의 좋아요 여부"""
@@ -281,40 +463,100 @@ class PostModel:
         )
         return row is not None
 
+    async def getLikedPostIds(self, postIds: List[Union[str, any]], userId: Union[str, any]) -> Set[str]:
+        """여러 게시글 중 특정 사용자가 좋아요한 게시글 ID 집합 (단일 쿼리)"""
+        postIdStrs = list(dict.fromkeys(self._normalizeId(postId) for postId in postIds))
+        if not postIdStrs:
+            return set()
+
+        placeholders = ", ".join(["%s"] * len(postIdStrs))
+        rows = await fetch_all(
+            f"SELECT post_id FROM post_likes WHERE user_id = %s AND post_id IN ({placeholders})",
+            [self._normalizeId(userId), *postIdStrs],
+        )
+        return {row["post_id"] for row in rows}
+
+    def imageState(self, images: List[Dict]) -> str:
+        """이미지 목록의 버전 문자열 (getPostVersion의 image_state와 같은 형식: 개수:썸네일 수:최대 ID)"""
+        thumbCount = sum(1 for image in images if image.get("thumbUrl") is not None)
+        return f"{len(images)}:{thumbCount}:{max((image['imageId'] for image in images), default='')}"
+
     async def getPostImages(self, postId: Union[str, any]) -> List[Dict]:
         """특정 게시글의 이미지 리스트 조회"""
         postIdStr = self._normalizeId(postId)
         rows = await fetch_all(
-            "SELECT image_id, post_id, image_url, sort_order FROM post_images WHERE post_id = %s ORDER BY sort_order ASC",
+            "SELECT image_id, post_id, image_url, thumb_url, medium_url, sort_order FROM post_images WHERE post_id = %s ORDER BY sort_order ASC",
             (postIdStr,),
         )
-        return [
-            {
-                "imageId": row["image_id"],
-                "postId": row["post_id"],
-                "imageUrl": row["image_url"],
-                "sortOrder": row["sort_order"],
-            }
-            for row in rows
-        ]
+        return [self._row_to_image(row) for row in rows]
+
+    async def getPostImagesBulk(self, postIds: List[Union[str, any]]) -> Dict[str, List[Dict]]:
+        """여러 게시글의 이미지를 단일 쿼리로 조회 (post_id -> 이미지 리스트)"""
+        postIdStrs = list(dict.fromkeys(self._normalizeId(postId) for postId in postIds))
+        if not postIdStrs:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(postIdStrs))
+        rows = await fetch_all(
+            f"""
+            SELECT image_id, post_id, image_url, thumb_url, medium_url, sort_order
+            FROM post_images
+            WHERE post_id IN ({placeholders})
+            ORDER BY post_id, sort_order ASC
+            """,
+            postIdStrs,
+        )
+
+        images_by_post: Dict[str, List[Dict]] = {}
+        for row in rows:
+            images_by_post.setdefault(row["post_id"], []).append(self._row_to_image(row))
+        return images_by_post
+
 
     async def addPostImages(self, postId: Union[str, any], imageUrls: List[str]) -> int:
-        """게시글에 여러 이미지 추가"""
+        """게시글에 여러 이미지 추가 (다중 VALUES 단일 INSERT)"""
         if not imageUrls:
             return 0
         
         postIdStr = self._normalizeId(postId)
-        inserted_count = 0
-        
+        params: List = []
+        pendingUrls: List[str] = []
         for idx, imageUrl in enumerate(imageUrls):
-            imageId = generate_id()
-            await execute(
-                "INSERT INTO post_images (image_id, post_id, image_url, sort_order, created_at) VALUES (%s, %s, %s, %s, NOW())",
-                (imageId, postIdStr, imageUrl, idx),
-            )
-            inserted_count += 1
-        
-        return inserted_count
+            # 업로드 후 이미 생성된 변형은 바로 기록 (아직이면 생성 완료 시 setImageVariants로 갱신)
+            variants = ready_variant_urls(imageUrl)
+            if not all(variants.values()):
+                pendingUrls.append(imageUrl)
+            params.extend((generate_id(), postIdStr, imageUrl, variants["thumb"], variants["medium"], idx))
+
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, NOW())"] * len(imageUrls))
+        inserted = await execute(
+            f"""
+            INSERT INTO post_images (image_id, post_id, image_url, thumb_url, medium_url, sort_order, created_at)
+            VALUES {placeholders}
+            """,
+            params,
+        )
+
+        # 확인과 INSERT 사이에 변형 생성이 끝났으면 setImageVariants가 아직 없는 행을 갱신하고 지나갔을 수 있으므로 다시 확인
+        # (INSERT 이후에 끝나는 생성은 콜백의 UPDATE가 이 행을 갱신)
+        for imageUrl in pendingUrls:
+            variants = ready_variant_urls(imageUrl)
+            if any(variants.values()):
+                await execute(
+                    """
+                    UPDATE post_images SET thumb_url = %s, medium_url = %s
+                    WHERE post_id = %s AND image_url = %s
+                    """,
+                    (variants["thumb"], variants["medium"], postIdStr, imageUrl),
+                )
+        return inserted
+
+    async def setImageVariants(self, imageUrl: str, variantUrls: Dict[str, str]) -> int:
+        """원본 URL이 같은 이미지 행에 변형 URL 기록 (변형 생성 완료 콜백)"""
+        return await execute(
+            "UPDATE post_images SET thumb_url = %s, medium_url = %s WHERE image_url = %s",
+            (variantUrls.get("thumb"), variantUrls.get("medium"), imageUrl),
+        )
 
     async def deletePostImages(self, postId: Union[str, any]) -> int:
         """게시글의 모든 이미지 삭제"""
@@ -328,3 +570,11 @@ class PostModel:
 
 # Model 인스턴스 생성
 post_model = PostModel()
+
+# 조회수 write-behind 버퍼 (main의 startup/shutdown에서 시작/종료)
+post_hit_buffer = WriteBehindCounter(
+    "post_hits",
+    post_model.addHitsBulk,
+    flush_interval=settings.hit_flush_interval,
+    flush_threshold=settings.hit_flush_threshold,
+)
@@ -1,12 +1,18 @@
 from typing import Dict, Optional, List, Union
-import bcrypt
+from config import settings
+from utils.common.cache import TTLCache
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.common.password_utils import hash_password, verify_password
+from utils.database.db import fetch_one, fetch_all, execute, transaction
 
 
 class UserModel:
     """사용자 데이터 관리 Model"""
 
+    def __init__(self):
+        # 인증 사용자 조회용 캐시 (userId -> 사용자 정보, updateUser/deleteUser 시 무효화)
+        self._userCache = TTLCache("users", maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+
     def _normalizeId(self, idVal: Union[str, any]) -> str:
         """ID 정규화 (문자열로 변환)"""
         return str(idVal)
@@ -29,21 +35,18 @@ class UserModel:
             "updatedAt": self._format_datetime(row.get("updated_at")),
         }
 
-    def hashPassword(self, password: str) -> str:
-        """비밀번호 해싱 (bcrypt 직접 사용)"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    async def hashPassword(self, password: str) -> str:
+        """비밀번호 해싱 (bcrypt, 전용 스레드 풀에서 실행)"""
+        return await hash_password(password)
 
-    def verifyPassword(self, plainPassword: str, hashedPassword: str) -> bool:
-        """비밀번호 검증 (bcrypt 직접 사용)"""
-        try:
-            return bcrypt.checkpw(plainPassword.encode("utf-8"), hashedPassword.encode("utf-8"))
-        except Exception:
-            return False
+    async def verifyPassword(self, plainPassword: str, hashedPassword: str) -> bool:
+        """비밀번호 검증 (bcrypt, 전용 스레드 풀에서 실행)"""
+        return await verify_password(plainPassword, hashedPassword)
 
     async def clear(self):
         """저장소 초기화 (테스트용)"""
         await execute("DELETE FROM users")
+        self._userCache.clear()
 
     def getNextUserId(self) -> str:
         """다음 사용자 ID 생성 (ULID)"""
@@ -52,17 +55,18 @@ class UserModel:
     async def createUser(self, email: str, password: str, nickname: str, profileImageUrl: Optional[str] = None) -> Dict:
         """사용자 생성"""
         userId = self.getNextUserId()
-        hashedPassword = self.hashPassword(password)
+        hashedPassword = await self.hashPassword(password)
 
-        await execute(
-            """
-            INSERT INTO users (user_id, email, password, nickname, profile_image_url, created_at)
-            VALUES (%s, %s, %s, %s, %s, NOW())
-            """,
-            (userId, email, hashedPassword, nickname, profileImageUrl),
-        )
+        async with transaction():
+            await execute(
+                """
+                INSERT INTO users (user_id, email, password, nickname, profile_image_url, created_at)
+                VALUES (%s, %s, %s, %s, %s, NOW())
+                """,
+                (userId, email, hashedPassword, nickname, profileImageUrl),
+            )
 
-        return await self.getUserById(userId)
+            return await self.getUserById(userId)
 
     async def getUserById(self, userId: Union[str, any]) -> Optional[Dict]:
         """ID로 사용자 조회"""
@@ -77,6 +81,18 @@ class UserModel:
         )
         return self._row_to_user(row)
 
+    async def getCachedUserById(self, userId: Union[str, any]) -> Optional[Dict]:
+        """ID로 사용자 조회 (짧은 TTL 캐시 우선, 인증 사용자 확인용)"""
+        userIdStr = self._normalizeId(userId)
+        cached = self._userCache.get(userIdStr)
+        if cached is not None:
+            return dict(cached)
+
+        user = await self.getUserById(userIdStr)
+        if user:
+            self._userCache.set(userIdStr, dict(user))
+        return user
+
     async def getUserByEmail(self, email: str) -> Optional[Dict]:
         """이메일로 사용자 조회"""
         row = await fetch_one(
@@ -121,21 +137,26 @@ class UserModel:
 
         if "password" in updateData:
             fields.append("password = %s")
-            params.append(self.hashPassword(updateData["password"]))
+            params.append(await self.hashPassword(updateData["password"]))
 
         if "profileImageUrl" in updateData:
             fields.append("profile_image_url = %s")
             params.append(updateData["profileImageUrl"])
 
-        if fields:
-            fields.append("updated_at = NOW()")
-            params.append(userIdStr)
-            await execute(
-                f"UPDATE users SET {', '.join(fields)} WHERE user_id = %s AND deleted_at IS NULL",
-                params,
-            )
+        async with transaction():
+            if fields:
+                fields.append("updated_at = NOW()")
+                params.append(userIdStr)
+                await execute(
+                    f"UPDATE users SET {', '.join(fields)} WHERE user_id = %s AND deleted_at IS NULL",
+                    params,
+                )
+
+            updatedUser = await self.getUserById(userIdStr)
 
-        return await self.getUserById(userIdStr)
+        # 커밋 이후 무효화 (커밋 전 다른 요청이 이전 값을 다시 캐시하지 않도록)
+        self._userCache.delete(userIdStr)
+        return updatedUser
 
     async def deleteUser(self, userId: Union[str, any]) -> bool:
         """사용자 삭제"""
@@ -144,6 +165,7 @@ class UserModel:
             "UPDATE users SET deleted_at = NOW() WHERE user_id = %s AND deleted_at IS NULL",
             (userIdStr,),
         )
+        self._userCache.delete(userIdStr)
         return affected > 0
 
     async def getAllUsers(self) -> List[Dict]:
@@ -160,7 +182,7 @@ class UserModel:
     async def authenticateUser(self, email: str, password: str) -> Optional[Dict]:
         """사용자 인증"""
         user = await self.getUserByEmail(email)
-        if user and self.verifyPassword(password, user["password"]):
+        if user and await self.verifyPassword(password, user["password"]):
             return user
         return None
 
@@ -35,25 +35,25 @@ async def logout(request: Request):
 async def get_me(user: Dict = Depends(get_current_user)):
     """내 정보 조회 (로그인 상태 검증)"""
     data = await auth_controller.getMe(user)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return StandardResponse.success_response(SuccessCode.SUCCESS, data)
 
 
 @router.get("/emails/availability", response_model=StandardResponseSchema[EmailAvailabilityResponse], status_code=status.HTTP_200_OK)
 async def check_email_availability(email: str = Query(..., description="중복 확인할 이메일")):
     """이메일 중복 체크"""
     data = await auth_controller.checkEmailAvailability(email)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return StandardResponse.success_response(SuccessCode.SUCCESS, data)
 
 
 @router.get("/nicknames/availability", response_model=StandardResponseSchema[NicknameAvailabilityResponse], status_code=status.HTTP_200_OK)
 async def check_nickname_availability(nickname: str = Query(..., description="중복 확인할 닉네임")):
     """닉네임 중복 체크"""
     data = await auth_controller.checkNicknameAvailability(nickname)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return StandardResponse.success_response(SuccessCode.SUCCESS, data)
 
 
 @router.post("/profile-image", response_model=StandardResponseSchema[UserProfileImageResponse], status_code=status.HTTP_201_CREATED)
 async def upload_signup_profile_image(profileImage: UploadFile = File(...)):
     """회원가입용 프로필 이미지 업로드 (인증 불필요)"""
-    fileUrl = save_upload_file(profileImage, "profile")
+    fileUrl = await save_upload_file(profileImage, "profile")
     return StandardResponse.success(SuccessCode.UPDATED, {"profileImageUrl": fileUrl})
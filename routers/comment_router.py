@@ -1,21 +1,29 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query, Request
 from typing import Dict, List, Optional
 from utils.common.response import StandardResponse
 from utils.errors.error_codes import SuccessCode
 from controllers.comment_controller import comment_controller
-from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, StandardResponse as StandardResponseSchema
+from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, StandardResponse as StandardResponseSchema, PaginatedResponse as PaginatedResponseSchema
 from utils.middleware.auth_middleware import get_current_user
+from utils.common.http_cache import conditional_response
 
 router = APIRouter(prefix="/v1/posts", tags=["댓글"])
 
 
-@router.get("/{postId}/comments", response_model=StandardResponseSchema[List[CommentResponse]], status_code=status.HTTP_200_OK)
-async def get_comments(postId: str):
+@router.get("/{postId}/comments", response_model=PaginatedResponseSchema[List[CommentResponse]], status_code=status.HTTP_200_OK)
+async def get_comments(
+    request: Request,
+    postId: str,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="커서 기반 페이징 (첫 페이지는 생략, 이후 nextCursor 전달)"),
+):
     """
-    댓글 목록 조회
+    댓글 목록 조회 (최신순, 페이징 메타데이터 포함)
+    - 응답의 nextCursor로 다음 페이지 조회
+    - 응답 본문 기반 ETag 제공, If-None-Match 일치 시 304 (본문 전송 생략)
     """
-    data = await comment_controller.getCommentsByPost(postId)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    data = await comment_controller.getCommentsByPost(postId, limit=limit, cursor=cursor or "")
+    return conditional_response(request, StandardResponse.success_response(SuccessCode.SUCCESS, data))
 
 
 @router.post("/{postId}/comments", response_model=StandardResponseSchema[Dict], status_code=status.HTTP_201_CREATED)
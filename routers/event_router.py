@@ -0,0 +1,33 @@
+from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+from config import settings
+from utils.common.event_bus import event_bus
+from utils.errors.exceptions import APIError
+from utils.errors.error_codes import ErrorCode
+
+router = APIRouter(prefix="/v1/events", tags=["이벤트"])
+
+
+@router.get("", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def stream_events():
+    """
+    실시간 이벤트 스트림 (Server-Sent Events, 목록/내 정보 폴링 대체)
+    - post-created / post-deleted: 게시글 생성·삭제
+    - like-count / comment-count: 게시글 좋아요 수·댓글 수 변경
+    - profile-changed: 사용자 닉네임·프로필 이미지 변경
+    - 연결 직후 ready 이벤트 전송 (재연결 시 이 시점에 목록을 한 번 다시 조회)
+    - 이벤트가 없으면 주기적으로 주석(ping) 전송
+    - 인증 불필요 (공개 정보만 전달)
+    """
+    if not event_bus.has_capacity():
+        raise APIError(ErrorCode.TOO_MANY_REQUEST)
+
+    return StreamingResponse(
+        event_bus.stream(settings.event_ping_interval),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 리버스 프록시(nginx) 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        },
+    )
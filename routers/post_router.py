@@ -1,32 +1,53 @@
-from fastapi import APIRouter, Depends, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, status, Query, Request, UploadFile, File
 from typing import Dict, List, Optional
 from utils.common.response import StandardResponse
 from utils.errors.error_codes import SuccessCode
 from controllers.post_controller import post_controller
 from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostImageUploadResponse, PostImagesUploadResponse, StandardResponse as StandardResponseSchema, PaginatedResponse as PaginatedResponseSchema
 from utils.middleware.auth_middleware import get_current_user, get_optional_user
-from utils.common.file_utils import save_upload_file
+from utils.common.file_utils import save_upload_file, save_upload_files
+from utils.common.http_cache import conditional_response, is_not_modified, not_modified_response
 
 router = APIRouter(prefix="/v1/posts", tags=["게시글"])
 
 
 @router.get("", response_model=PaginatedResponseSchema[List[PostResponse]], status_code=status.HTTP_200_OK)
 async def get_posts(
+    request: Request,
     offset: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="커서 기반 페이징 (첫 페이지는 빈 값, 이후 nextCursor 전달)"),
+    exactCount: bool = Query(False, description="totalCount를 캐시 대신 정확한 값으로 계산"),
+    view: str = Query("full", pattern="^(full|summary)$", description="summary 시 본문(content) 대신 미리보기(excerpt)만 반환"),
     user: Optional[Dict] = Depends(get_optional_user)
 ):
     """
     게시글 목록 조회 (페이징 메타데이터 포함)
     - 모든 게시글을 최신순으로 반환
+    - cursor 지정 시 커서 모드로 동작하며 offset은 무시됨 (응답의 nextCursor로 다음 페이지 조회)
+    - cursor 미지정 시 기존 offset 모드 (하위 호환)
+    - totalCount는 최대 수십 초 지연될 수 있는 캐시 값 (exactCount=true 시 정확한 값)
+    - view=summary 시 content는 null, excerpt(본문 앞 200자)만 포함 (목록 화면용 경량 응답)
+    - 기본(view=full)은 content만 포함하고 excerpt는 null
+    - 응답 본문 기반 ETag 제공, If-None-Match 일치 시 304 (본문 전송 생략)
     - 인증 불필요
     """
-    data = await post_controller.getAllPosts(limit=limit, offset=offset, current_user_id=(user or {}).get("userId"))
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    current_user_id = (user or {}).get("userId")
+    summary = view == "summary"
+    if cursor is not None:
+        data = await post_controller.getPostsByCursor(
+            limit=limit, cursor=cursor, current_user_id=current_user_id, exact_count=exactCount, summary=summary
+        )
+    else:
+        data = await post_controller.getAllPosts(
+            limit=limit, offset=offset, current_user_id=current_user_id, exact_count=exactCount, summary=summary
+        )
+    return conditional_response(request, StandardResponse.success_response(SuccessCode.SUCCESS, data))
 
 
 @router.get("/{postId}", response_model=StandardResponseSchema[PostResponse], status_code=status.HTTP_200_OK)
 async def get_post(
+    request: Request,
     postId: str,
     incHits: bool = Query(True, description="조회수 증가 여부"),
     user: Optional[Dict] = Depends(get_optional_user),
@@ -35,10 +56,29 @@ async def get_post(
     게시글 상세 조회
     - 특정 게시글의 상세 정보 반환
     - incHits=false 시 조회수가 증가하지 않음
+    - 같은 세션(비로그인은 IP)의 반복 조회는 일정 시간 동안 한 번만 집계
+    - incHits=false 시 ETag 제공, 조건부 요청이 일치하면 버전 조회만으로 304 응답
     - 인증 불필요
     """
-    data = await post_controller.getPostById(postId, incHits=incHits, current_user_id=(user or {}).get("userId"))
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    current_user_id = (user or {}).get("userId")
+    if not incHits:
+        # 버전 조회만으로 304 판단 (불일치 시 본문 기준 ETag로 응답)
+        etag = await post_controller.getPostEtag(postId, current_user_id)
+        if etag and is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        data, etag = await post_controller.getPostWithEtag(postId, current_user_id=current_user_id)
+        response = StandardResponse.success_response(SuccessCode.SUCCESS, data)
+        return conditional_response(request, response, etag=etag)
+
+    viewer_key = getattr(request.state, "_session_key", None) or (request.client.host if request.client else None)
+    data = await post_controller.getPostById(
+        postId,
+        incHits=incHits,
+        current_user_id=current_user_id,
+        viewer_key=viewer_key,
+    )
+    return StandardResponse.success_response(SuccessCode.SUCCESS, data)
 
 
 @router.post("", response_model=StandardResponseSchema[PostResponse], status_code=status.HTTP_201_CREATED)
@@ -79,9 +119,11 @@ async def upload_post_image(postFile: UploadFile = File(...), user: Dict = Depen
     """
     게시글 이미지 업로드 (단일)
     - 실제 로컬 폴더에 이미지 저장 및 URL 반환
+    - 썸네일/중간 크기 변형은 백그라운드에서 생성
     - 하위 호환성 유지용
     """
-    fileUrl = save_upload_file(postFile, "post")
+    fileUrl = await save_upload_file(postFile, "post")
+    post_controller.scheduleImageVariants([fileUrl])
     return StandardResponse.success(SuccessCode.UPDATED, {"postFileUrl": fileUrl})
 
 
@@ -89,14 +131,16 @@ async def upload_post_image(postFile: UploadFile = File(...), user: Dict = Depen
 async def upload_post_images(postFiles: List[UploadFile] = File(...), user: Dict = Depends(get_current_user)):
     """
     게시글 이미지 업로드 (다중, 최대 5장)
-    - 실제 로컬 폴더에 이미지 저장 및 URL 리스트 반환
+    - 실제 로컬 폴더에 이미지 저장 및 URL 리스트 반환 (파일들을 동시에 저장)
+    - 썸네일/중간 크기 변형은 백그라운드에서 생성
     """
     if len(postFiles) > 5:
         from utils.errors.exceptions import APIError
         from utils.errors.error_codes import ErrorCode
         raise APIError(ErrorCode.BAD_REQUEST, {"message": "최대 5개의 이미지만 업로드할 수 있습니다"})
     
-    fileUrls = [save_upload_file(postFile, "post") for postFile in postFiles]
+    fileUrls = await save_upload_files(postFiles, "post")
+    post_controller.scheduleImageVariants(fileUrls)
     return StandardResponse.success(SuccessCode.UPDATED, {"postFileUrls": fileUrls})
 
 
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/v1/users", tags=["사용자"])
 @router.get("/me", response_model=StandardResponseSchema[UserResponse], status_code=status.HTTP_200_OK)
 async def get_my_info(user: Dict = Depends(get_current_user)):
     """현재 로그인한 사용자 정보 조회"""
-    return StandardResponse.success(SuccessCode.SUCCESS, UserResponse.model_validate(user))
+    return StandardResponse.success_response(SuccessCode.SUCCESS, UserResponse.model_validate(user))
 
 
 @router.patch("/me", response_model=StandardResponseSchema[UserResponse], status_code=status.HTTP_200_OK)
@@ -41,7 +41,7 @@ async def delete_my_account(request: Request, user: Dict = Depends(get_current_u
 async def get_user_info(userId: str):
     """특정 사용자 정보 조회"""
     data = await user_controller.getUserById(userId)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return StandardResponse.success_response(SuccessCode.SUCCESS, data)
 
 
 @router.patch("/{userId}", response_model=StandardResponseSchema[UserResponse], status_code=status.HTTP_200_OK)
@@ -68,5 +68,5 @@ async def delete_user_account(userId: str, request: Request, user: Dict = Depend
 @router.post("/me/profile-image", response_model=StandardResponseSchema[UserProfileImageResponse], status_code=status.HTTP_201_CREATED)
 async def upload_profile_image(profileImage: UploadFile = File(...), user: Dict = Depends(get_current_user)):
     """프로필 이미지 업로드"""
-    fileUrl = save_upload_file(profileImage, "profile")
+    fileUrl = await save_upload_file(profileImage, "profile")
     return StandardResponse.success(SuccessCode.UPDATED, {"profileImageUrl": fileUrl})
@@ -18,13 +18,14 @@ class StandardResponse(BaseSchema, Generic[T]):
     details: Optional[Dict[str, Any]] = None
 
 class PaginationMeta(BaseSchema):
-    """페이징 메타데이터"""
+    """페이징 메타데이터 (커서 모드에서는 offset/currentPage 대신 nextCursor 사용)"""
     totalCount: int
     limit: int
-    offset: int
-    currentPage: int
+    offset: Optional[int] = None
+    currentPage: Optional[int] = None
     totalPage: int
     hasNext: bool
+    nextCursor: Optional[str] = None
 
 class PaginatedData(BaseSchema, Generic[T]):
     """페이징 데이터와 메타데이터 결합"""
@@ -34,6 +34,8 @@ class PostAuthor(BaseSchema):
 class PostImage(BaseSchema):
     imageId: str
     imageUrl: str
+    thumbUrl: Optional[str] = None  # 목록용 썸네일 (변형 생성 전에는 원본 URL)
+    mediumUrl: Optional[str] = None  # 상세용 중간 크기 (변형 생성 전에는 원본 URL)
     sortOrder: int
 
 class PostFile(BaseSchema):
@@ -43,7 +45,8 @@ class PostFile(BaseSchema):
 class PostResponse(BaseSchema):
     postId: str
     title: str
-    content: str
+    content: Optional[str] = None  # 목록 view=summary 에서는 생략(null)
+    excerpt: Optional[str] = None  # 본문 앞부분 미리보기, 목록 view=summary 에서만 포함 (그 외에는 null)
     likeCount: int = 0
     commentCount: int = 0
     hits: int = 0
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+응답 압축 효과 측정 벤치마크
+- http: 실행 중인 서버의 GET /v1/posts?limit=100 을 Accept-Encoding(identity / gzip / br)별로 호출하여
+        전송 바이트와 time-to-last-byte 비교 (--rate-kbps 지정 시 해당 대역폭에서의 예상 전송 시간도 출력)
+- inproc: 서버/DB 없이 게시글 100개 페이지 응답을 압축 미들웨어로 처리하여 압축 비용(ms)과 압축률 비교
+
+사용 예:
+    python test/benchmarks/compression_bench.py http --iterations 200 --rate-kbps 10000
+    python test/benchmarks/compression_bench.py inproc --iterations 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+# 프로젝트 루트를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+BASE_URL = "http://localhost:8000"
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def print_stats(label: str, size: int, samples_ms: List[float], rate_kbps: int = 0) -> None:
+    samples_ms = sorted(samples_ms)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    line = (
+        f"{label:<10} {size:>9,} bytes | avg {statistics.mean(samples_ms):7.3f}ms | "
+        f"p50 {statistics.median(samples_ms):7.3f}ms | p95 {p95:7.3f}ms"
+    )
+    if rate_kbps:
+        line += f" | @{rate_kbps}kbps 전송 {size * 8 / rate_kbps:8.1f}ms"
+    print(line)
+
+
+async def _measure(client, path: str, encoding: str, iterations: int):
+    """(전송 바이트, 지연시간 목록) - 본문 끝까지 수신한 시점 기준"""
+    headers = {"Accept-Encoding": encoding}
+    samples: List[float] = []
+    size = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        async with client.stream("GET", path, headers=headers) as response:
+            response.raise_for_status()
+            size = 0
+            async for chunk in response.aiter_raw():
+                size += len(chunk)
+        samples.append((time.perf_counter() - start) * 1000)
+    return size, samples
+
+
+async def bench_http(iterations: int, rate_kbps: int) -> None:
+    import httpx
+
+    path = "/v1/posts?offset=0&limit=100"
+    print_section(f"HTTP 레벨: GET {path} {iterations}회")
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10) as client:
+        for encoding in ENCODINGS:
+            await _measure(client, path, encoding, min(20, iterations))  # warm-up
+            size, samples = await _measure(client, path, encoding, iterations)
+            print_stats(encoding, size, samples, rate_kbps)
+
+
+async def bench_inproc(iterations: int) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from response_serialization_bench import PAGE_SIZE, build_page
+    from utils.common.compression import supported_encodings
+    from utils.common.response import StandardResponse
+    from utils.errors.error_codes import SuccessCode
+    from utils.middleware.compression_middleware import CompressionMiddleware
+
+    print_section(f"In-process: 게시글 {PAGE_SIZE}개 페이지 {iterations}회 (지원 인코딩: {', '.join(supported_encodings())})")
+    page = build_page()
+    app = FastAPI()
+
+    @app.get("/posts")
+    async def posts():
+        return StandardResponse.success_response(SuccessCode.SUCCESS, page)
+
+    app.add_middleware(CompressionMiddleware)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for encoding in ENCODINGS:
+            if encoding != "identity" and encoding not in supported_encodings():
+                print(f"{encoding:<10} (미설치, 건너뜀)")
+                continue
+            await _measure(client, "/posts", encoding, min(20, iterations))  # warm-up
+            size, samples = await _measure(client, "/posts", encoding, iterations)
+            print_stats(encoding, size, samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response compression benchmark")
+    parser.add_argument("mode", choices=["http", "inproc"])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--rate-kbps", type=int, default=0, help="예상 전송 시간 계산용 대역폭 (kbps)")
+    args = parser.parse_args()
+
+    if args.mode == "http":
+        asyncio.run(bench_http(args.iterations, args.rate_kbps))
+    else:
+        asyncio.run(bench_inproc(args.iterations))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+미들웨어 스택 오버헤드 측정 벤치마크 (BaseHTTPMiddleware vs 순수 ASGI)
+- inproc: 서버 없이 ASGI 앱을 직접 호출하여 /health 처리량(req/s) 비교
+          (A) 아무 일도 하지 않는 BaseHTTPMiddleware 4단, (B) 순수 ASGI 4단, (C) 현재 프로젝트 미들웨어 스택
+- http: 실행 중인 서버의 /health, GET /v1/posts 처리량(req/s) 측정
+        (변경 전/후 커밋에서 각각 실행하여 비교)
+
+사용 예:
+    python test/benchmarks/middleware_bench.py inproc --requests 5000
+    python test/benchmarks/middleware_bench.py http --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+# 프로젝트 루트를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+BASE_URL = "http://localhost:8000"
+MIDDLEWARE_DEPTH = 4
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def print_stats(label: str, total: int, elapsed: float, samples_ms: List[float]) -> None:
+    samples_ms = sorted(samples_ms)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<28} {total / elapsed:9.1f} req/s | "
+        f"p50 {statistics.median(samples_ms):7.3f}ms | p95 {p95:7.3f}ms"
+    )
+
+
+def _build_app(variant: str):
+    from fastapi import FastAPI
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    if variant == "base":
+        class PassthroughBaseMiddleware(BaseHTTPMiddleware):
+            async def dispatch(self, request, call_next):
+                return await call_next(request)
+
+        for _ in range(MIDDLEWARE_DEPTH):
+            app.add_middleware(PassthroughBaseMiddleware)
+    elif variant == "asgi":
+        class PassthroughASGIMiddleware:
+            def __init__(self, app):
+                self.app = app
+
+            async def __call__(self, scope, receive, send):
+                await self.app(scope, receive, send)
+
+        for _ in range(MIDDLEWARE_DEPTH):
+            app.add_middleware(PassthroughASGIMiddleware)
+    else:
+        # main.py와 동일한 순서 (세션 쿠키가 없으므로 DB 조회 없음)
+        from utils.middleware.access_log_middleware import AccessLogMiddleware
+        from utils.middleware.auth_middleware import AuthMiddleware
+        from utils.middleware.db_session_middleware import DBSessionMiddleware
+        from utils.middleware.request_id_middleware import RequestIDMiddleware
+
+        app.add_middleware(AuthMiddleware)
+        app.add_middleware(DBSessionMiddleware)
+        app.add_middleware(AccessLogMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+async def _drive(client, path: str, total: int, concurrency: int) -> Tuple[float, List[float]]:
+    samples: List[float] = []
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, samples
+
+
+async def bench_inproc(total: int, concurrency: int) -> None:
+    import httpx
+
+    print_section(f"In-process: GET /health {total}회 (동시성 {concurrency})")
+    # 접근 로그 출력이 측정을 왜곡하지 않도록 비활성화
+    logging.getLogger("access_logger").disabled = True
+
+    variants = [
+        ("base", f"BaseHTTPMiddleware x{MIDDLEWARE_DEPTH}"),
+        ("asgi", f"pure ASGI x{MIDDLEWARE_DEPTH}"),
+        ("project", "project middleware stack"),
+    ]
+    for variant, label in variants:
+        transport = httpx.ASGITransport(app=_build_app(variant))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _drive(client, "/health", min(200, total), concurrency)  # warm-up
+            elapsed, samples = await _drive(client, "/health", total, concurrency)
+        print_stats(label, total, elapsed, samples)
+
+
+async def bench_http(total: int, concurrency: int) -> None:
+    import httpx
+
+    print_section(f"HTTP 레벨: {BASE_URL} {total}회 (동시성 {concurrency})")
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=10) as client:
+        for path in ["/health", "/v1/posts?offset=0&limit=10"]:
+            await _drive(client, path, min(100, total), concurrency)  # warm-up
+            elapsed, samples = await _drive(client, path, total, concurrency)
+            print_stats(f"GET {path.split('?')[0]}", total, elapsed, samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Middleware stack overhead benchmark")
+    parser.add_argument("mode", choices=["inproc", "http"])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.mode == "inproc":
+        asyncio.run(bench_inproc(args.requests, args.concurrency))
+    else:
+        asyncio.run(bench_http(args.requests, args.concurrency))
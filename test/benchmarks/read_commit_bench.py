@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+조회 쿼리 COMMIT 왕복 제거 효과 측정 벤치마크
+- db: 게시글 상세 조회 쿼리를 (A) autocommit=False + 매 쿼리 COMMIT, (B) autocommit=True 로 반복 실행하여
+      쿼리당 평균 지연시간 비교 (요청당 절감량)
+- http: 실행 중인 서버의 GET /v1/posts/{postId}?incHits=false 지연시간 측정
+        (변경 전/후 커밋에서 각각 실행하여 비교)
+
+사용 예:
+    python test/benchmarks/read_commit_bench.py db --iterations 2000
+    python test/benchmarks/read_commit_bench.py http --post-id 01J... --iterations 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+# 프로젝트 루트를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+BASE_URL = "http://localhost:8000"
+
+POST_DETAIL_SQL = """
+    SELECT
+        p.post_id, p.user_id AS author_id, u.nickname AS author_nickname,
+        u.profile_image_url AS author_profile_image_url, p.title, p.content,
+        p.created_at, p.updated_at, p.hits, p.comment_count, p.like_count
+    FROM posts p
+    LEFT JOIN users u ON u.user_id = p.user_id
+    WHERE p.post_id = %s AND p.deleted_at IS NULL
+"""
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def print_stats(label: str, samples_ms: List[float]) -> None:
+    samples_ms = sorted(samples_ms)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<28} avg {statistics.mean(samples_ms):7.3f}ms | "
+        f"p50 {statistics.median(samples_ms):7.3f}ms | p95 {p95:7.3f}ms"
+    )
+
+
+async def _run_queries(autocommit: bool, post_id: str, iterations: int) -> List[float]:
+    import aiomysql
+    from config import settings
+
+    conn = await aiomysql.connect(
+        host=settings.db_host,
+        port=settings.db_port,
+        user=settings.db_user,
+        password=settings.db_password,
+        db=settings.db_name,
+        autocommit=autocommit,
+    )
+    samples: List[float] = []
+    try:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await cursor.execute(POST_DETAIL_SQL, (post_id,))
+                await cursor.fetchone()
+                if not autocommit:
+                    await conn.commit()
+                samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        conn.close()
+    return samples
+
+
+async def bench_db(post_id: str, iterations: int) -> None:
+    print_section(f"DB 레벨: 게시글 상세 조회 {iterations}회")
+    if not post_id:
+        import aiomysql
+        from config import settings
+
+        conn = await aiomysql.connect(
+            host=settings.db_host, port=settings.db_port, user=settings.db_user,
+            password=settings.db_password, db=settings.db_name, autocommit=True,
+        )
+        async with conn.cursor() as cursor:
+            await cursor.execute("SELECT post_id FROM posts WHERE deleted_at IS NULL LIMIT 1")
+            row = await cursor.fetchone()
+        conn.close()
+        if not row:
+            print("❌ 게시글이 없습니다. db/generate_dummy_data.py로 데이터를 먼저 생성하세요.")
+            return
+        post_id = row[0]
+
+    with_commit = await _run_queries(False, post_id, iterations)
+    autocommit = await _run_queries(True, post_id, iterations)
+
+    print_stats("SELECT + COMMIT (기존)", with_commit)
+    print_stats("SELECT (autocommit)", autocommit)
+    saved = statistics.mean(with_commit) - statistics.mean(autocommit)
+    print(f"\n📊 쿼리당 절감: {saved:.3f}ms ({saved / statistics.mean(with_commit) * 100:.1f}%)")
+    print("   상세 조회 요청은 세션 조회 + 게시글 조회 + 이미지 조회 등 최소 3회의 읽기를 수행하므로")
+    print(f"   요청당 예상 절감: 약 {saved * 3:.3f}ms")
+
+
+def bench_http(post_id: str, iterations: int) -> None:
+    import requests
+
+    print_section(f"HTTP 레벨: GET /v1/posts/{{postId}}?incHits=false {iterations}회")
+    session = requests.Session()
+    if not post_id:
+        items = session.get(f"{BASE_URL}/v1/posts?limit=1", timeout=5).json()["data"]["items"]
+        if not items:
+            print("❌ 게시글이 없습니다.")
+            return
+        post_id = items[0]["postId"]
+
+    url = f"{BASE_URL}/v1/posts/{post_id}?incHits=false"
+    session.get(url, timeout=5)  # warm-up
+
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = session.get(url, timeout=5)
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    print_stats("GET /v1/posts/{postId}", samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read-path COMMIT round trip benchmark")
+    parser.add_argument("mode", choices=["db", "http"])
+    parser.add_argument("--post-id", default="")
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.mode == "db":
+        asyncio.run(bench_db(args.post_id, args.iterations))
+    else:
+        bench_http(args.post_id, args.iterations)
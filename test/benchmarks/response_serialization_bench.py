@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 경로 비교 벤치마크 (게시글 100개 페이지, DB 불필요)
+- encode: 응답 본문 생성 비용만 비교
+          (A) 기존: dict 반환 → response_model 재검증 → JSON 직렬화 (FastAPI serialize_response + JSONResponse)
+          (B) 변경: StandardResponse.success_response (검증된 모델을 pydantic-core로 바로 bytes 변환)
+- route: 같은 데이터를 반환하는 두 라우트를 ASGI로 직접 호출하여 req/s 비교
+
+사용 예:
+    python test/benchmarks/response_serialization_bench.py encode --iterations 2000
+    python test/benchmarks/response_serialization_bench.py route --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+# 프로젝트 루트를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+PAGE_SIZE = 100
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def print_stats(label: str, samples_ms: List[float]) -> None:
+    samples_ms = sorted(samples_ms)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<28} avg {statistics.mean(samples_ms):7.3f}ms | "
+        f"p50 {statistics.median(samples_ms):7.3f}ms | p95 {p95:7.3f}ms"
+    )
+
+
+def build_page():
+    """게시글 목록 응답과 같은 모양의 PaginatedData (이미지 2장, 한글 본문 포함)"""
+    from controllers.post_controller import post_controller
+    from schemas import PaginatedData, PaginationMeta
+
+    now = datetime(2024, 1, 1)
+    items = []
+    for i in range(PAGE_SIZE):
+        post = {
+            "postId": f"01HZX{i:021d}",
+            "title": f"벤치마크 게시글 제목 {i}",
+            "content": "본문 내용입니다. " * 20,
+            "authorId": f"01HZU{i % 10:021d}",
+            "authorNickname": f"작성자{i % 10}",
+            "authorProfileImageUrl": f"/public/image/profile/{i % 10}.png",
+            "createdAt": (now - timedelta(minutes=i)).isoformat(),
+            "updatedAt": None,
+            "hits": i * 3,
+            "likeCount": i,
+            "commentCount": i % 7,
+            "isLiked": i % 2 == 0,
+        }
+        images = [
+            {"imageId": f"img{i}-{n}", "imageUrl": f"/public/image/post/{i}-{n}.jpg", "sortOrder": n}
+            for n in range(2)
+        ]
+        items.append(post_controller._buildPostResponse(post, images, post["isLiked"]))
+
+    return PaginatedData(
+        items=items,
+        pagination=PaginationMeta(
+            totalCount=1000, limit=PAGE_SIZE, offset=0, currentPage=1, totalPage=10, hasNext=True
+        ),
+    )
+
+
+def _legacy_encoder() -> Callable:
+    """기존 경로: response_model 검증 + 직렬화 후 JSONResponse 렌더링"""
+    from typing import List as TypingList
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from schemas import PaginatedResponse, PostResponse
+    from utils.common.response import StandardResponse
+    from utils.errors.error_codes import SuccessCode
+
+    field = create_model_field(name="Response", type_=PaginatedResponse[TypingList[PostResponse]], mode="serialization")
+
+    async def encode(page) -> bytes:
+        content = await serialize_response(
+            field=field, response_content=StandardResponse.success(SuccessCode.SUCCESS, page)
+        )
+        return JSONResponse(content).body
+
+    return encode
+
+
+def _fast_encoder() -> Callable:
+    from utils.common.response import StandardResponse
+    from utils.errors.error_codes import SuccessCode
+
+    async def encode(page) -> bytes:
+        return StandardResponse.success_response(SuccessCode.SUCCESS, page).body
+
+    return encode
+
+
+async def bench_encode(iterations: int) -> None:
+    print_section(f"응답 본문 생성: 게시글 {PAGE_SIZE}개 페이지 {iterations}회")
+    page = build_page()
+    legacy, fast = _legacy_encoder(), _fast_encoder()
+
+    legacy_body, fast_body = await legacy(page), await fast(page)
+    if json.loads(legacy_body) != json.loads(fast_body):
+        print("❌ 두 경로의 응답 JSON이 다릅니다.")
+        return
+    print(f"✅ 응답 JSON 동일 ({len(fast_body):,} bytes)")
+
+    results = {}
+    for label, encode in [("response_model + json (기존)", legacy), ("success_response (변경)", fast)]:
+        for _ in range(min(100, iterations)):  # warm-up
+            await encode(page)
+        samples: List[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await encode(page)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[label] = samples
+        print_stats(label, samples)
+
+    legacy_avg, fast_avg = (statistics.mean(samples) for samples in results.values())
+    print(f"\n📊 요청당 절감: {legacy_avg - fast_avg:.3f}ms ({legacy_avg / fast_avg:.1f}배)")
+
+
+async def bench_route(total: int) -> None:
+    import httpx
+    from typing import List as TypingList
+    from fastapi import FastAPI
+    from schemas import PaginatedResponse, PostResponse
+    from utils.common.response import StandardResponse
+    from utils.errors.error_codes import SuccessCode
+
+    print_section(f"In-process: 게시글 {PAGE_SIZE}개 페이지 라우트 {total}회")
+    page = build_page()
+    app = FastAPI()
+
+    @app.get("/legacy", response_model=PaginatedResponse[TypingList[PostResponse]])
+    async def legacy():
+        return StandardResponse.success(SuccessCode.SUCCESS, page)
+
+    @app.get("/fast", response_model=PaginatedResponse[TypingList[PostResponse]])
+    async def fast():
+        return StandardResponse.success_response(SuccessCode.SUCCESS, page)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path, label in [("/legacy", "response_model + json (기존)"), ("/fast", "success_response (변경)")]:
+            for _ in range(min(100, total)):  # warm-up
+                await client.get(path)
+            samples: List[float] = []
+            started = time.perf_counter()
+            for _ in range(total):
+                start = time.perf_counter()
+                response = await client.get(path)
+                samples.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+            elapsed = time.perf_counter() - started
+            print_stats(label, samples)
+            print(f"{'':<28} {total / elapsed:9.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response serialization path benchmark")
+    parser.add_argument("mode", choices=["encode", "route"])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.mode == "encode":
+        asyncio.run(bench_encode(args.iterations))
+    else:
+        asyncio.run(bench_route(args.requests))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+실시간 이벤트 스트림(SSE) 체크(런타임 체크)
+- GET /v1/events 에 연결한 뒤 게시글 작성 / 좋아요 / 댓글 작성 / 프로필 수정을 수행
+- post-created, like-count, comment-count, profile-changed 이벤트가 순서대로 수신되는지 확인
+- 단일 워커(uvicorn 기본값)로 실행 중인 서버 기준 (이벤트 버스는 워커 프로세스별 인메모리)
+
+사용 예:
+    python test/runtime_checks/event_stream_check.py
+"""
+import json
+import sys
+import threading
+from datetime import datetime
+from queue import Empty, Queue
+from typing import Dict, Tuple
+
+import requests
+
+BASE_URL = "http://localhost:8000"
+PASSWORD = "Test1234@$"
+TIMEOUT = 5
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def listen(events: "Queue[Tuple[str, Dict]]", stop: threading.Event) -> None:
+    """SSE 스트림을 읽어 (event, data) 를 큐에 적재"""
+    with requests.get(f"{BASE_URL}/v1/events", stream=True, timeout=30) as response:
+        response.raise_for_status()
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if stop.is_set():
+                return
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: ") and event:
+                events.put((event, json.loads(line[len("data: "):])))
+                event = None
+
+
+def expect(events: "Queue[Tuple[str, Dict]]", name: str, **fields) -> bool:
+    try:
+        while True:
+            event, data = events.get(timeout=TIMEOUT)
+            if event != name:
+                continue
+            if all(data.get(key) == value for key, value in fields.items()):
+                print(f"✅ {name}: {data}")
+                return True
+    except Empty:
+        print(f"❌ {name} 이벤트를 {TIMEOUT}초 내에 받지 못함 (기대값: {fields})")
+        return False
+
+
+def check_event_stream() -> bool:
+    print_section("실시간 이벤트 스트림(SSE) 확인")
+    events: "Queue[Tuple[str, Dict]]" = Queue()
+    stop = threading.Event()
+    threading.Thread(target=listen, args=(events, stop), daemon=True).start()
+    if not expect(events, "ready"):
+        return False
+
+    suffix = datetime.now().strftime("%H%M%S")
+    email = f"sse{suffix}@example.com"
+    session = requests.Session()
+    session.post(
+        f"{BASE_URL}/v1/auth/signup",
+        json={"email": email, "password": PASSWORD, "nickname": f"sse{suffix}"},
+        timeout=10,
+    ).raise_for_status()
+    session.post(f"{BASE_URL}/v1/auth/login", json={"email": email, "password": PASSWORD}, timeout=10).raise_for_status()
+
+    try:
+        post = session.post(f"{BASE_URL}/v1/posts", json={"title": "SSE", "content": "SSE check"}, timeout=10).json()["data"]
+        ok = expect(events, "post-created", postId=post["postId"])
+
+        session.post(f"{BASE_URL}/v1/posts/{post['postId']}/likes", timeout=10).raise_for_status()
+        ok = expect(events, "like-count", postId=post["postId"], likeCount=1) and ok
+
+        session.post(f"{BASE_URL}/v1/posts/{post['postId']}/comments", json={"content": "hi"}, timeout=10).raise_for_status()
+        ok = expect(events, "comment-count", postId=post["postId"], commentCount=1) and ok
+
+        session.patch(f"{BASE_URL}/v1/users/me", json={"nickname": f"ssn{suffix}"}, timeout=10).raise_for_status()
+        ok = expect(events, "profile-changed", nickname=f"ssn{suffix}") and ok
+
+        session.delete(f"{BASE_URL}/v1/posts/{post['postId']}", timeout=10)
+        return ok
+    finally:
+        stop.set()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_event_stream() else 1)
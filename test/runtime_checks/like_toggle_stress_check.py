@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+좋아요 토글 동시성 스트레스 체크(런타임 체크)
+- 여러 사용자가 같은 게시글에 POST /v1/posts/{postId}/likes 를 동시에 반복 호출
+- 최종 likeCount가 (토글 횟수가 홀수인 사용자 수)와 일치하는지 확인
+- --db 옵션 시 posts.like_count와 post_likes 실제 행 수(COUNT(*))가 일치하는지도 확인
+
+사용 예:
+    python test/runtime_checks/like_toggle_stress_check.py --users 10 --toggles 21 --concurrency 32 --db
+"""
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List
+
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+BASE_URL = "http://localhost:8000"
+PASSWORD = "Test1234@$"
+
+
+def print_section(title: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {title}")
+    print("=" * 60)
+
+
+def create_user(index: int) -> requests.Session:
+    # 닉네임 최대 10자
+    suffix = f"{datetime.now().strftime('%M%S')}{index:02d}"
+    email = f"like{suffix}@example.com"
+    session = requests.Session()
+    session.post(
+        f"{BASE_URL}/v1/auth/signup",
+        json={"email": email, "password": PASSWORD, "nickname": f"lk{suffix}"},
+        timeout=10,
+    ).raise_for_status()
+    session.post(f"{BASE_URL}/v1/auth/login", json={"email": email, "password": PASSWORD}, timeout=10).raise_for_status()
+    return session
+
+
+def toggle(session: requests.Session, post_id: str) -> int:
+    response = session.post(f"{BASE_URL}/v1/posts/{post_id}/likes", timeout=10)
+    response.raise_for_status()
+    return response.status_code
+
+
+async def count_in_db(post_id: str) -> tuple:
+    from utils.database.db import close_pool, fetch_one, init_pool
+
+    await init_pool()
+    try:
+        counter = await fetch_one("SELECT like_count FROM posts WHERE post_id = %s", (post_id,), primary=True)
+        actual = await fetch_one("SELECT COUNT(*) AS cnt FROM post_likes WHERE post_id = %s", (post_id,), primary=True)
+        return counter["like_count"], actual["cnt"]
+    finally:
+        await close_pool()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Like toggle concurrency stress check")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--toggles", type=int, default=21, help="사용자별 토글 횟수 (홀수면 최종 좋아요 상태)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--db", action="store_true", help="DB의 like_count와 post_likes 행 수 비교")
+    args = parser.parse_args()
+
+    print_section(f"좋아요 토글 스트레스: 사용자 {args.users}명 x {args.toggles}회 (동시성 {args.concurrency})")
+    sessions: List[requests.Session] = [create_user(i) for i in range(args.users)]
+    response = sessions[0].post(f"{BASE_URL}/v1/posts", json={"title": "like stress", "content": "like stress"}, timeout=10)
+    response.raise_for_status()
+    post_id = response.json()["data"]["postId"]
+    print(f"   - 게시글 ID: {post_id}")
+
+    # 사용자별 토글 요청을 섞어서 동시에 실행 (같은 사용자의 연속 클릭도 동시에 도착하도록)
+    jobs = [session for _ in range(args.toggles) for session in sessions]
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        statuses = list(executor.map(lambda session: toggle(session, post_id), jobs))
+    print(f"   - 요청 {len(statuses)}건 완료")
+
+    expected = args.users if args.toggles % 2 else 0
+    like_count = sessions[0].get(f"{BASE_URL}/v1/posts/{post_id}?incHits=false", timeout=10).json()["data"]["likeCount"]
+
+    ok = like_count == expected
+    print(f"{'✅' if ok else '❌'} likeCount={like_count} (기대값 {expected})")
+
+    if args.db:
+        counter, actual = asyncio.run(count_in_db(post_id))
+        db_ok = counter == actual == expected
+        print(f"{'✅' if db_ok else '❌'} posts.like_count={counter}, COUNT(post_likes)={actual}")
+        ok = ok and db_ok
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+읽기 복제본 라우팅 확인(런타임 체크)
+- DB_REPLICA_HOSTS 설정 시 조회가 복제본으로 라운드 로빈 되는지 확인
+- 쓰기(execute) 이후 같은 컨텍스트의 조회가 primary로 가는지(read-your-writes) 확인
+
+로컬에서는 MySQL 컨테이너 두 개(primary/replica, server_id가 서로 다름)로 확인할 수 있습니다.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from config import settings
+from utils.database.db import close_pool, execute, fetch_one, init_pool
+
+SERVER_SQL = "SELECT @@server_id AS server_id, @@hostname AS hostname"
+
+
+async def check_replica_routing() -> bool:
+    print("=" * 60)
+    print("  읽기 복제본 라우팅 확인")
+    print("=" * 60)
+    print(f"  primary : {settings.db_host}:{settings.db_port}")
+    print(f"  replicas: {settings.db_replica_hosts or '(없음)'}")
+
+    await init_pool()
+    try:
+        primary = await fetch_one(SERVER_SQL, primary=True)
+        print(f"\n✅ primary server_id={primary['server_id']} ({primary['hostname']})")
+
+        print("\n[조회 라우팅]")
+        served = set()
+        for i in range(6):
+            row = await fetch_one(SERVER_SQL)
+            served.add(row["server_id"])
+            print(f"  read #{i + 1}: server_id={row['server_id']} ({row['hostname']})")
+
+        if settings.db_replica_hosts and primary["server_id"] in served:
+            print("⚠️  일부 조회가 primary로 전송됨 (복제본이 비정상 상태일 수 있음)")
+
+        print("\n[read-your-writes]")
+        await execute("DELETE FROM sessions WHERE expires_at < NOW()")
+        row = await fetch_one(SERVER_SQL)
+        if row["server_id"] != primary["server_id"]:
+            print(f"❌ 쓰기 이후 조회가 복제본(server_id={row['server_id']})으로 전송됨")
+            return False
+        print("✅ 쓰기 이후 조회는 primary로 전송됨")
+        return True
+    except Exception as e:
+        print(f"\n❌ 확인 실패: {e}")
+        return False
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(check_replica_routing()) else 1)
@@ -223,6 +223,70 @@ def test_post_list_pagination(api_client):
     assert data["pagination"]["totalCount"] == 5
     assert data["pagination"]["offset"] == 2
     assert data["pagination"]["limit"] == 2
+    assert data["pagination"]["hasNext"] is True
+
+    # 마지막 페이지 + 정확한 totalCount 요청
+    resp = api_client.get("/v1/posts?limit=2&offset=4&exactCount=true")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert len(data["items"]) == 1
+    assert data["pagination"]["totalCount"] == 5
+    assert data["pagination"]["hasNext"] is False
+
+def test_post_list_cursor_pagination(api_client):
+    """커서 기반 게시글 목록 조회 (nextCursor로 중복/누락 없이 순회)"""
+    api_client.post("/v1/auth/signup", json={"email": "cursor@t.com", "password": "Password123!", "nickname": "cursor"})
+    api_client.post("/v1/auth/login", json={"email": "cursor@t.com", "password": "Password123!"})
+
+    post_ids = []
+    for i in range(5):
+        resp = api_client.post("/v1/posts", json={"title": f"Cursor {i+1}", "content": "Content"})
+        post_ids.append(resp.json()["data"]["postId"])
+
+    # 첫 페이지 (빈 커서)
+    resp = api_client.get("/v1/posts?limit=2&cursor=")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert [item["postId"] for item in data["items"]] == post_ids[::-1][:2]
+    assert data["pagination"]["hasNext"] is True
+    assert data["pagination"]["nextCursor"]
+
+    # nextCursor를 따라 끝까지 순회
+    seen = [item["postId"] for item in data["items"]]
+    while data["pagination"]["nextCursor"]:
+        resp = api_client.get(f"/v1/posts?limit=2&cursor={data['pagination']['nextCursor']}")
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        seen.extend(item["postId"] for item in data["items"])
+    assert seen == post_ids[::-1]
+    assert data["pagination"]["hasNext"] is False
+
+    # 잘못된 커서
+    resp = api_client.get("/v1/posts?cursor=not-a-cursor")
+    assert resp.status_code == 422
+    assert resp.json()["code"] == "INVALID_INPUT"
+
+def test_post_list_summary_view(api_client):
+    """view=summary 목록은 본문 대신 미리보기(excerpt)만 반환"""
+    api_client.post("/v1/auth/signup", json={"email": "summary@t.com", "password": "Password123!", "nickname": "summary"})
+    api_client.post("/v1/auth/login", json={"email": "summary@t.com", "password": "Password123!"})
+
+    content = "가나다라마바사 " * 50
+    api_client.post("/v1/posts", json={"title": "Summary Title", "content": content})
+
+    resp = api_client.get("/v1/posts?view=summary")
+    assert resp.status_code == 200
+    item = resp.json()["data"]["items"][0]
+    assert item["content"] is None
+    assert item["excerpt"] == content[:200]
+
+    resp = api_client.get("/v1/posts")
+    item = resp.json()["data"]["items"][0]
+    assert item["content"] == content
+    assert item["excerpt"] is None
+
+    resp = api_client.get("/v1/posts?view=compact")
+    assert resp.status_code == 422
 
 def test_post_full_lifecycle(api_client):
     """게시글 생성, 조회, 수정, 좋아요, 삭제 전체 흐름"""
@@ -245,6 +309,7 @@ def test_post_full_lifecycle(api_client):
     # 다시 토글해서 취소
     resp = api_client.post(f"/v1/posts/{postId}/likes")
     assert resp.json()["data"]["likeCount"] == 0
+    assert resp.json()["data"]["isLiked"] is False
     
     # 4. 수정
     resp = api_client.patch(f"/v1/posts/{postId}", json={"title": "Updated Title", "content": "Updated Content"})
@@ -266,6 +331,100 @@ def test_post_full_lifecycle(api_client):
     resp = api_client.get(f"/v1/posts/{postId}")
     assert resp.status_code == 404
 
+def test_post_like_counter_and_is_liked(api_client):
+    """좋아요 카운터(posts.like_count)와 isLiked가 목록/상세에 반영되는지 검증"""
+    api_client.post("/v1/auth/signup", json={"email": "like@t.com", "password": "Password123!", "nickname": "liker"})
+    api_client.post("/v1/auth/login", json={"email": "like@t.com", "password": "Password123!"})
+
+    resp = api_client.post("/v1/posts", json={"title": "Like Title", "content": "Like Content"})
+    postId = resp.json()["data"]["postId"]
+
+    resp = api_client.post(f"/v1/posts/{postId}/likes")
+    assert resp.json()["data"]["likeCount"] == 1
+    assert resp.json()["data"]["isLiked"] is True
+
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false")
+    assert resp.json()["data"]["likeCount"] == 1
+    assert resp.json()["data"]["isLiked"] is True
+
+    resp = api_client.get("/v1/posts")
+    item = next(item for item in resp.json()["data"]["items"] if item["postId"] == postId)
+    assert item["likeCount"] == 1
+    assert item["isLiked"] is True
+
+    # 로그아웃 상태에서는 isLiked가 False
+    api_client.post("/v1/auth/logout")
+    resp = api_client.get("/v1/posts")
+    item = next(item for item in resp.json()["data"]["items"] if item["postId"] == postId)
+    assert item["likeCount"] == 1
+    assert item["isLiked"] is False
+
+def test_post_view_deduplicated_per_viewer(api_client):
+    """같은 조회자의 반복 조회는 조회수에 한 번만 반영"""
+    api_client.post("/v1/auth/signup", json={"email": "view@t.com", "password": "Password123!", "nickname": "viewer"})
+    api_client.post("/v1/auth/login", json={"email": "view@t.com", "password": "Password123!"})
+
+    resp = api_client.post("/v1/posts", json={"title": "View Title", "content": "View Content"})
+    postId = resp.json()["data"]["postId"]
+
+    resp = api_client.get(f"/v1/posts/{postId}")
+    assert resp.json()["data"]["hits"] == 1
+
+    resp = api_client.get(f"/v1/posts/{postId}")
+    assert resp.json()["data"]["hits"] == 1
+
+def test_post_detail_conditional_get(api_client):
+    """ETag 재검증 시 변경이 없으면 304, 좋아요 후에는 새 응답"""
+    api_client.post("/v1/auth/signup", json={"email": "etag@t.com", "password": "Password123!", "nickname": "etagger"})
+    api_client.post("/v1/auth/login", json={"email": "etag@t.com", "password": "Password123!"})
+
+    resp = api_client.post("/v1/posts", json={"title": "ETag Title", "content": "ETag Content"})
+    postId = resp.json()["data"]["postId"]
+
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+    # 카운터 변경은 타임스탬프에 반영되지 않으므로 Last-Modified 기반 재검증은 제공하지 않음
+    assert "Last-Modified" not in resp.headers
+
+    resp = api_client.get(
+        f"/v1/posts/{postId}?incHits=false", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    )
+    assert resp.status_code == 200
+
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+
+    api_client.post(f"/v1/posts/{postId}/likes")
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["isLiked"] is True
+
+def test_post_detail_compressed(api_client):
+    """Accept-Encoding: gzip 요청 시 큰 응답은 gzip으로 압축"""
+    api_client.post("/v1/auth/signup", json={"email": "gzip@t.com", "password": "Password123!", "nickname": "gzipper"})
+    api_client.post("/v1/auth/login", json={"email": "gzip@t.com", "password": "Password123!"})
+
+    content = "압축 테스트 본문 " * 200
+    resp = api_client.post("/v1/posts", json={"title": "Gzip Title", "content": content})
+    postId = resp.json()["data"]["postId"]
+
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert resp.json()["data"]["content"] == content
+
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in resp.headers
+    assert "Accept-Encoding" in resp.headers["Vary"]
+
+    # 압축하지 않는 작은 응답도 압축 대상 형식이면 Vary 포함 (캐시 키 일관성)
+    resp = api_client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in resp.headers
+    assert "Accept-Encoding" in resp.headers["Vary"]
+
 # --- Comment API Tests ---
 
 def test_comment_list(api_client):
@@ -287,14 +446,29 @@ def test_comment_list(api_client):
     # 댓글 목록 조회
     resp = api_client.get(f"/v1/posts/{postId}/comments")
     assert resp.status_code == 200
-    comments = resp.json()["data"]
+    data = resp.json()["data"]
+    comments = data["items"]
     assert len(comments) == 3  # 생성한 3개 댓글 모두 조회
+    assert data["pagination"]["totalCount"] == 3
+    assert data["pagination"]["hasNext"] is False
 
     # 각 댓글이 올바르게 표시되는지 확인 (최신순 정렬이므로 역순)
     for i, comment in enumerate(comments):
         assert comment["content"] == f"Comment {3-i}"
         assert comment["author"]["nickname"] == "commenter"
 
+    # 커서 기반 페이징 (limit=2 → nextCursor로 나머지 조회)
+    resp = api_client.get(f"/v1/posts/{postId}/comments?limit=2")
+    data = resp.json()["data"]
+    assert [c["content"] for c in data["items"]] == ["Comment 3", "Comment 2"]
+    assert data["pagination"]["hasNext"] is True
+
+    resp = api_client.get(f"/v1/posts/{postId}/comments?limit=2&cursor={data['pagination']['nextCursor']}")
+    data = resp.json()["data"]
+    assert [c["content"] for c in data["items"]] == ["Comment 1"]
+    assert data["pagination"]["hasNext"] is False
+    assert data["pagination"]["nextCursor"] is None
+
 def test_comment_lifecycle_and_cache(api_client):
     """댓글 작성, 수정, 삭제 및 게시글 내 캐시 카운트 검증"""
     api_client.post("/v1/auth/signup", json={"email": "c@t.com", "password": "Password123!", "nickname": "comm"})
@@ -344,3 +518,9 @@ def test_image_upload_and_directory_creation(api_client):
     resp = api_client.post("/v1/posts/image", files=files)
     assert resp.status_code == 201
     assert "postFileUrl" in resp.json()["data"]
+
+    # 같은 내용의 이미지는 같은 파일/URL로 저장 (콘텐츠 주소 저장)
+    files = {"postFile": ("again.jpg", b"fake_post_image", "image/jpeg")}
+    resp_again = api_client.post("/v1/posts/image", files=files)
+    assert resp_again.status_code == 201
+    assert resp_again.json()["data"]["postFileUrl"] == resp.json()["data"]["postFileUrl"]
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import aiomysql
+import pytest
+
+# 프로젝트 루트를 path에 추가하여 utils, models 등을 가져올 수 있게 함
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../2-owen-community-be"))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.database import db
+
+
+class _FakePool:
+    """acquire()만 흉내 내는 복제본 풀 (DB 없이 라우팅만 검증)"""
+
+    def acquire(self):
+        @asynccontextmanager
+        async def _acquire():
+            yield "replica-conn"
+        return _acquire()
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """정상 상태의 복제본 하나와 primary 커넥션을 가짜로 구성"""
+    fake = db._Replica("replica", 3306)
+    fake.pool = _FakePool()
+    fake.healthy = True
+    monkeypatch.setattr(db, "_replicas", [fake])
+
+    @asynccontextmanager
+    async def primary_connection():
+        yield "primary-conn"
+
+    monkeypatch.setattr(db, "connection", primary_connection)
+    return fake
+
+
+def _run_failing_on_replica(error):
+    async def _run(conn, query, params, fetchone, fetchall, caller):
+        if conn == "replica-conn":
+            raise error
+        return {"conn": conn}
+    return _run
+
+
+@pytest.mark.parametrize("code", [2003, 2006, 2013, 2055])
+def test_replica_connection_error_falls_back_and_marks_unhealthy(replica, monkeypatch, code):
+    """연결 수준 오류는 복제본을 비정상으로 표시하고 primary로 재시도"""
+    monkeypatch.setattr(db, "_run", _run_failing_on_replica(aiomysql.OperationalError(code, "lost connection")))
+
+    row = asyncio.run(db.fetch_one("SELECT 1"))
+
+    assert row == {"conn": "primary-conn"}
+    assert replica.healthy is False
+
+
+@pytest.mark.parametrize("code", [1205, 3024])
+def test_replica_query_error_keeps_replica_healthy(replica, monkeypatch, code):
+    """락 대기/실행 시간 초과 등 쿼리 수준 오류는 복제본을 유지하고 그대로 전달"""
+    monkeypatch.setattr(db, "_run", _run_failing_on_replica(aiomysql.OperationalError(code, "query error")))
+
+    with pytest.raises(aiomysql.OperationalError):
+        asyncio.run(db.fetch_one("SELECT 1"))
+
+    assert replica.healthy is True
+
+
+def test_replica_os_error_falls_back(replica, monkeypatch):
+    """소켓 오류(OSError)도 연결 장애로 처리"""
+    monkeypatch.setattr(db, "_run", _run_failing_on_replica(ConnectionResetError()))
+
+    row = asyncio.run(db.fetch_one("SELECT 1"))
+
+    assert row == {"conn": "primary-conn"}
+    assert replica.healthy is False
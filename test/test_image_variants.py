@@ -0,0 +1,121 @@
+import asyncio
+import os
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+# 프로젝트 루트를 path에 추가하여 utils, models 등을 가져올 수 있게 함
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../2-owen-community-be"))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+Image = pytest.importorskip("PIL.Image")
+
+from utils.common.image_variants import (
+    VARIANT_SIZES,
+    ImageVariantPipeline,
+    _generate_variants,
+    ready_variant_urls,
+    variant_url,
+)
+
+FILE_URL = "/public/image/post/sample.png"
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """임시 디렉토리를 작업 디렉토리로 하여 '/public/image/post/...' URL이 그 아래 파일을 가리키도록 함"""
+    monkeypatch.chdir(tmp_path)
+    directory = tmp_path / "public" / "image" / "post"
+    directory.mkdir(parents=True)
+    return directory
+
+
+def test_generate_png_variants(tmp_path):
+    """긴 변 기준으로 비율을 유지하여 축소하고 원본 형식(PNG)으로 저장"""
+    source = tmp_path / "wide.png"
+    Image.new("RGBA", (2000, 1000), (255, 0, 0, 128)).save(source)
+
+    paths = _generate_variants(str(source))
+
+    assert set(paths) == set(VARIANT_SIZES)
+    for name, maxSize in VARIANT_SIZES.items():
+        assert paths[name] == variant_url(str(source), name)
+        with Image.open(paths[name]) as variant:
+            assert variant.format == "PNG"
+            assert variant.size == (maxSize, maxSize // 2)
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".part")]
+
+
+def test_generate_jpeg_variants_converts_mode(tmp_path):
+    """JPEG는 RGB로 변환하여 저장하고 원본보다 크게 늘리지 않음"""
+    source = tmp_path / "small.jpg"
+    Image.new("CMYK", (600, 800)).save(source, "JPEG")
+
+    paths = _generate_variants(str(source))
+
+    with Image.open(paths["thumb"]) as thumb:
+        assert thumb.format == "JPEG"
+        assert thumb.mode == "RGB"
+        assert thumb.size == (240, 320)
+    with Image.open(paths["medium"]) as medium:
+        assert medium.size == (600, 800)
+
+
+def test_generate_skips_gif(tmp_path):
+    """GIF는 애니메이션 보존을 위해 변형을 만들지 않음"""
+    source = tmp_path / "anim.gif"
+    Image.new("P", (800, 800)).save(source, "GIF")
+
+    assert _generate_variants(str(source)) == {}
+    assert os.listdir(tmp_path) == ["anim.gif"]
+
+
+def test_pipeline_calls_back_with_variant_urls(upload_dir):
+    """생성 완료 시 콜백(setImageVariants)에 원본 URL과 변형 URL 전달"""
+    Image.new("RGB", (1200, 900)).save(upload_dir / "sample.png")
+    calls: List[Tuple[str, Dict[str, str]]] = []
+
+    async def setImageVariants(imageUrl: str, variantUrls: Dict[str, str]) -> None:
+        calls.append((imageUrl, variantUrls))
+
+    async def scenario():
+        pipeline = ImageVariantPipeline(maxWorkers=1)
+        pipeline.schedule(FILE_URL, onComplete=setImageVariants)
+        await pipeline.shutdown()
+
+    asyncio.run(scenario())
+
+    expected = {name: variant_url(FILE_URL, name) for name in VARIANT_SIZES}
+    assert calls == [(FILE_URL, expected)]
+    assert ready_variant_urls(FILE_URL) == expected
+
+
+def test_pipeline_dedupes_inflight_jobs(upload_dir, monkeypatch):
+    """같은 원본을 생성 중에 다시 예약하면 새 작업 없이 기존 작업의 완료 콜백에 합류"""
+    Image.new("RGB", (1200, 900)).save(upload_dir / "sample.png")
+    calls: List[str] = []
+
+    async def first(imageUrl: str, variantUrls: Dict[str, str]) -> None:
+        calls.append("first")
+
+    async def second(imageUrl: str, variantUrls: Dict[str, str]) -> None:
+        calls.append("second")
+
+    async def scenario():
+        pipeline = ImageVariantPipeline(maxWorkers=2)
+        pipeline.schedule(FILE_URL, onComplete=first)
+        pipeline.schedule(FILE_URL, onComplete=first)
+        pipeline.schedule(FILE_URL, onComplete=second)
+        scheduled = len(pipeline._tasks)
+        await pipeline.shutdown()
+
+        # 변형이 이미 있으면 재생성하지 않음
+        pipeline.schedule(FILE_URL, onComplete=first)
+        return scheduled, len(pipeline._tasks)
+
+    scheduled, rescheduled = asyncio.run(scenario())
+    assert scheduled == 1
+    assert rescheduled == 0
+    assert calls == ["first", "second"]
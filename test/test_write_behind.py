@@ -0,0 +1,90 @@
+import asyncio
+import os
+import sys
+from typing import Dict, List
+
+# 프로젝트 루트를 path에 추가하여 utils, models 등을 가져올 수 있게 함
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../2-owen-community-be"))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.database.write_behind import WriteBehindCounter
+
+
+class _SlowStore:
+    """반영에 시간이 걸리는 가짜 저장소 (반영된 증가량 누적)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.totals: Dict[str, int] = {}
+        self.started = asyncio.Event()
+
+    async def flush(self, batch: Dict[str, int]) -> None:
+        self.started.set()
+        await asyncio.sleep(self.delay)
+        for key, delta in batch.items():
+            self.totals[key] = self.totals.get(key, 0) + delta
+
+
+def test_stop_during_periodic_flush_loses_nothing():
+    """주기 flush가 진행 중일 때 stop()해도 진행 중 배치와 이후 증가량이 모두 반영"""
+    async def scenario():
+        store = _SlowStore(delay=0.2)
+        counter = WriteBehindCounter("test_stop", store.flush, flush_interval=0.01, flush_threshold=10 ** 9)
+        counter.start()
+        counter.add("post-1", 3)
+        counter.add("post-2", 1)
+
+        await asyncio.wait_for(store.started.wait(), 1)
+        counter.add("post-1", 2)  # 진행 중인 배치와 별도로 쌓인 증가량
+        assert counter.pending("post-1") == 5
+
+        await counter.stop()
+        return store.totals, counter.stats()
+
+    totals, stats = asyncio.run(scenario())
+    assert totals == {"post-1": 5, "post-2": 1}
+    assert stats == {"pendingKeys": 0, "pendingTotal": 0, "inflightTotal": 0}
+
+
+def test_cancelled_flush_restores_batch():
+    """반영 도중 취소되면 배치를 버퍼에 되돌려 다음 flush에서 재시도"""
+    async def scenario():
+        store = _SlowStore(delay=10)
+        counter = WriteBehindCounter("test_cancel", store.flush, flush_interval=60, flush_threshold=10 ** 9)
+        counter.add("post-1", 4)
+
+        task = asyncio.create_task(counter.flush())
+        await asyncio.wait_for(store.started.wait(), 1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        pending = counter.pending("post-1")
+
+        store.delay = 0
+        await counter.flush()
+        return pending, store.totals
+
+    pending, totals = asyncio.run(scenario())
+    assert pending == 4
+    assert totals == {"post-1": 4}
+
+
+def test_failed_flush_is_retried():
+    """반영 실패 시 증가량을 되돌려 다음 flush에서 다시 반영"""
+    attempts: List[Dict[str, int]] = []
+
+    async def flaky(batch: Dict[str, int]) -> None:
+        attempts.append(dict(batch))
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+
+    async def scenario():
+        counter = WriteBehindCounter("test_retry", flaky, flush_interval=60, flush_threshold=10 ** 9)
+        counter.add("post-1")
+        await counter.flush()
+        counter.add("post-1")
+        await counter.flush()
+        return counter.pending("post-1")
+
+    assert asyncio.run(scenario()) == 0
+    assert attempts == [{"post-1": 1}, {"post-1": 2}]
@@ -0,0 +1,208 @@
+"""
+응답 압축(gzip / brotli) 공통 유틸리티
+- Accept-Encoding 협상 (q 값 반영, 같은 우선순위면 brotli 우선)
+- 압축 대상 Content-Type 판별 (텍스트/JSON 계열만, 이미지·SSE 제외)
+- 청크 단위 스트리밍 압축기 (청크마다 flush하여 버퍼링 없이 바로 전송)
+- 정적 파일(/public)의 사전 압축본(.br/.gz)을 캐시 디렉토리에 만들어 두고 재사용하는 StaticFiles
+- brotli 미설치 환경에서는 gzip만 사용
+"""
+
+import gzip
+import logging
+import os
+import tempfile
+import zlib
+from typing import Optional, Tuple
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Scope
+from config import settings
+from utils.common.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (pip install ".[compression]")
+    brotli = None
+
+_logger = logging.getLogger("compression")
+
+# 압축 대상 Content-Type (text/* 는 text/event-stream 제외하고 모두 대상)
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+_EXCLUDED_TYPES = {"text/event-stream"}
+
+# 사전 압축본 확장자
+_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """선호 순서대로 지원하는 인코딩"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더로 사용할 인코딩 결정 (없으면 None)"""
+    if not accept_encoding:
+        return None
+
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = qualities.get(coding, qualities.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in _EXCLUDED_TYPES:
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+class StreamCompressor:
+    """청크 단위 압축기 (final=False면 지금까지의 입력을 모두 내보내도록 flush)"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.compression_brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits=31: gzip 헤더/트레일러 포함
+            self._zlib = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self._brotli is not None:
+            out = self._brotli.process(data) if data else b""
+            if final:
+                return out + self._brotli.finish()
+            return out + self._brotli.flush() if data else out
+
+        out = self._zlib.compress(data) if data else b""
+        if final:
+            return out + self._zlib.flush(zlib.Z_FINISH)
+        return out + self._zlib.flush(zlib.Z_SYNC_FLUSH) if data else out
+
+
+def _compress_file(source: str, target: str, encoding: str, mtime_ns: int) -> None:
+    """정적 파일 사전 압축 (최대 압축률, 원본 mtime을 기록하여 갱신 여부 판단)"""
+    with open(source, "rb") as f:
+        data = f.read()
+    if encoding == "br":
+        compressed = brotli.compress(data, quality=11)
+    else:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+    target_dir = os.path.dirname(target)
+    os.makedirs(target_dir, exist_ok=True)
+    # 같은 프로세스의 동시 요청(스레드 풀)도 서로의 임시 파일을 덮어쓰지 않도록 호출마다 고유한 파일 사용
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(compressed)
+        os.utime(temp_path, ns=(mtime_ns, mtime_ns))
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    압축 가능한 정적 파일(svg, css, js 등)에 대해 사전 압축본을 제공하는 StaticFiles
+    - 첫 요청 시 cache_dir 아래에 .br/.gz 파일을 만들고, 원본 mtime이 바뀌면 다시 생성
+    - 업로드 디렉토리(public)와 분리된 위치에 저장하여 정적 경로로 노출되거나 이미지 GC 대상이 되지 않음
+    - 이미지 등 이미 압축된 형식과 Range 요청은 원본 그대로 제공
+    """
+
+    def __init__(self, *args, cache_dir: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_dir = cache_dir
+
+    def _variant_path(self, full_path: str, encoding: str) -> str:
+        relative = os.path.relpath(os.path.realpath(full_path), os.path.realpath(str(self.directory)))
+        return os.path.join(self.cache_dir, relative + _SUFFIXES[encoding])
+
+    def _ensure_variant(self, full_path: str, encoding: str) -> Optional[Tuple[str, os.stat_result]]:
+        source_stat = os.stat(full_path)
+        target = self._variant_path(full_path, encoding)
+        try:
+            target_stat = os.stat(target)
+            if target_stat.st_mtime_ns == source_stat.st_mtime_ns:
+                return target, target_stat
+        except FileNotFoundError:
+            pass
+
+        try:
+            _compress_file(full_path, target, encoding, source_stat.st_mtime_ns)
+        except OSError as e:
+            _logger.warning(f"사전 압축 실패 ({full_path}): {e}")
+            return None
+        metrics.inc("static_precompressed", label=encoding)
+        return target, os.stat(target)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if not isinstance(response, FileResponse) or response.status_code != 200:
+            return response
+
+        request_headers = Headers(scope=scope)
+        if "range" in request_headers or not is_compressible(response.media_type):
+            return response
+        if int(response.headers.get("content-length", 0)) < settings.compression_min_size:
+            return response
+
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if encoding is None:
+            return response
+
+        variant = await anyio.to_thread.run_sync(self._ensure_variant, str(response.path), encoding)
+        if variant is None:
+            return response
+
+        variant_path, variant_stat = variant
+        return FileResponse(
+            variant_path,
+            stat_result=variant_stat,
+            media_type=response.media_type,
+            headers={
+                "Content-Encoding": encoding,
+                "Vary": "Accept-Encoding",
+                # 원본 기준 검증자 유지 (인코딩별 본문이 다르므로 약한 ETag)
+                "ETag": f"W/{response.headers['etag']}",
+                "Last-Modified": response.headers["last-modified"],
+            },
+        )
@@ -0,0 +1,136 @@
+"""
+인프로세스 이벤트 발행/구독 버스 (SSE 실시간 피드용)
+- 컨트롤러가 쓰기 작업(커밋) 후 publish → 구독 중인 모든 SSE 연결의 큐에 전달
+- 이벤트는 발행 시점에 SSE 프레임(bytes)으로 한 번만 직렬화하여 모든 구독자가 공유
+- 구독자별 큐는 크기 제한이 있으며, 가득 차면(느린 클라이언트) 해당 구독을 종료하여 메모리 사용량 상한 유지
+  (EventSource는 자동 재연결하고, 재연결 직후 ready 이벤트를 받아 목록을 다시 조회)
+- 워커 프로세스별 인메모리이므로 같은 프로세스에서 발생한 쓰기만 전달됨 (다중 워커 배포 시 외부 브로커 필요)
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from config import settings
+from utils.common.metrics import metrics
+
+# 이벤트 종류
+POST_CREATED = "post-created"
+POST_DELETED = "post-deleted"
+LIKE_COUNT = "like-count"
+COMMENT_COUNT = "comment-count"
+PROFILE_CHANGED = "profile-changed"
+
+# 연결 직후 전송하는 이벤트 (클라이언트는 이 시점에 목록을 한 번 동기화)
+READY = "ready"
+
+# 재연결 대기 시간 (ms, EventSource retry 필드)
+RETRY_MS = 3000
+
+PING_FRAME = b": ping\n\n"
+
+# 구독 종료 신호 (큐 overflow 시 넣음)
+_CLOSED = b""
+
+
+def encode_event(event: str, data: Any) -> bytes:
+    """SSE 프레임 직렬화 (data는 한 줄 JSON)"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Subscription:
+    """SSE 연결 하나에 대응하는 구독 (크기 제한 큐)"""
+
+    def __init__(self, maxsize: int):
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    def offer(self, frame: bytes) -> bool:
+        """이벤트 적재 (큐가 가득 차면 구독을 닫고 False)"""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            self.closed = True
+            # 대기 중인 소비자를 깨우기 위해 가장 오래된 이벤트를 버리고 종료 신호 적재
+            self._queue.get_nowait()
+            self._queue.put_nowait(_CLOSED)
+            return False
+
+    async def next(self, timeout: float) -> Optional[bytes]:
+        """다음 이벤트 프레임 (timeout 동안 없으면 None, 구독 종료 시 _CLOSED)"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """프로세스 내 이벤트 발행/구독"""
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscription] = set()
+        metrics.register_gauge("event_bus", self.stats)
+
+    def has_capacity(self) -> bool:
+        """새 구독을 받을 수 있는지 (응답 시작 전 429 판단용, 초과 시 거절 수 집계)"""
+        if len(self._subscribers) >= self.max_subscribers:
+            metrics.inc("event_bus_rejected")
+            return False
+        return True
+
+    def subscribe(self) -> Optional[Subscription]:
+        """구독 생성 (최대 구독 수 초과 시 None)"""
+        if not self.has_capacity():
+            return None
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.closed = True
+        self._subscribers.discard(subscription)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """모든 구독자에게 이벤트 전달 (대기 없음, 커밋 이후 호출)"""
+        metrics.inc("event_bus_published", label=event)
+        if not self._subscribers:
+            return
+        frame = encode_event(event, data)
+        for subscription in list(self._subscribers):
+            if not subscription.offer(frame):
+                metrics.inc("event_bus_overflow")
+                self._subscribers.discard(subscription)
+
+    async def stream(self, ping_interval: float) -> AsyncIterator[bytes]:
+        """
+        SSE 응답 본문 (재연결 간격 → ready → 이벤트/ping 반복, 종료 시 구독 해제)
+        - 구독은 본문 전송이 시작될 때 생성하므로, 응답이 시작되기 전에 실패/취소되어도 구독이 남지 않음
+        - 사전 확인과 전송 시작 사이에 상한에 도달했으면 빈 본문으로 종료 (클라이언트는 retry 후 재연결)
+        """
+        subscription = self.subscribe()
+        if subscription is None:
+            return
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode("ascii") + encode_event(READY, {})
+            while True:
+                frame = await subscription.next(ping_interval)
+                if frame is None:
+                    yield PING_FRAME
+                elif frame == _CLOSED:
+                    return
+                else:
+                    yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, int]:
+        return {"subscribers": len(self._subscribers), "maxSubscribers": self.max_subscribers}
+
+
+# 전역 이벤트 버스 인스턴스
+event_bus = EventBus(settings.event_queue_size, settings.event_max_subscribers)
@@ -1,24 +1,67 @@
+import asyncio
+import hashlib
 import os
 import uuid
+from typing import List, Tuple
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from utils.common.image_variants import VARIANT_SIZES, variant_url
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
 
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".JPG", ".JPEG"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+CHUNK_SIZE = 256 * 1024  # 스트리밍 복사 단위 (256KB)
 
-def save_upload_file(file: UploadFile, domain: str) -> str:
+
+def _write_chunk(buffer, hasher, chunk: bytes) -> None:
+    """(스레드 풀에서 실행) 청크 기록과 해시 갱신"""
+    hasher.update(chunk)
+    buffer.write(chunk)
+
+
+def _commit_blob(temp_path: str, file_path: str) -> None:
     """
-    업로드된 파일을 로컬에 저장하고 URL 경로 반환
-    domain: 'post' 또는 'profile'
+    (스레드 풀에서 실행) 임시 파일을 콘텐츠 주소 경로로 이동
+    - 같은 내용의 파일이 이미 있으면 임시 파일만 삭제 (중복 저장 방지)
+    - 이 경우 기존 파일과 변형의 mtime을 갱신하여, 아직 게시글/프로필에 연결되기 전인 재업로드 파일을
+      고아 이미지 정리(db/gc_images.py의 최소 경과 시간)가 삭제하지 않도록 함
+    """
+    try:
+        os.utime(file_path)
+    except FileNotFoundError:
+        os.replace(temp_path, file_path)
+        return
+
+    os.remove(temp_path)
+    for name in VARIANT_SIZES:
+        try:
+            os.utime(variant_url(file_path, name))
+        except FileNotFoundError:
+            pass
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def _stream_upload_file(file: UploadFile, domain: str) -> Tuple[str, str]:
+    """
+    업로드 파일을 고정 크기 청크로 임시 파일에 복사한 뒤 콘텐츠 주소 경로로 이동
+    - 복사하면서 SHA-256을 계산하여 파일명으로 사용 (같은 내용은 같은 파일/URL)
+    - 디스크 I/O와 해시 계산은 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+    - 누적 크기가 MAX_FILE_SIZE를 넘는 즉시 중단하고 임시 파일 삭제
+    - (저장 경로, URL 경로) 반환
     """
     # 1. 확장자 검증
     file_extension = os.path.splitext(file.filename)[1]
     if file_extension not in ALLOWED_EXTENSIONS:
         raise APIError(ErrorCode.BAD_REQUEST, message=f"허용되지 않은 파일 형식입니다. ({', '.join(ALLOWED_EXTENSIONS)})")
 
-    # 2. 파일 크기 검증 (FastAPI UploadFile.size 사용)
-    # size가 없는 경우를 대비해 file.file.seek 활용 가능하지만 최신 FastAPI 기준 size 활용
+    # 2. 파일 크기 사전 검증 (size를 알 수 있으면 복사 전에 거절, 실제 크기는 복사 중에 다시 확인)
     if file.size and file.size > MAX_FILE_SIZE:
         raise APIError(ErrorCode.PAYLOAD_TOO_LARGE, message="파일 크기는 5MB를 초과할 수 없습니다.")
 
@@ -30,17 +73,61 @@ def save_upload_file(file: UploadFile, domain: str) -> str:
     if not os.path.exists(upload_path):
         os.makedirs(upload_path, exist_ok=True)
         
-    # 파일명 중복 방지를 위한 UUID 추가
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    
-    file_path = os.path.join(upload_path, unique_filename)
+    # 해시가 정해지기 전까지는 고유한 임시 파일에 기록 (동시 업로드 충돌 방지)
+    temp_path = os.path.join(upload_path, f"{uuid.uuid4()}.part")
     
     # 파일 포인터를 처음으로 되돌림 (검증 과정에서 읽었을 수 있음)
-    file.file.seek(0)
-    
-    with open(file_path, "wb") as buffer:
-        buffer.write(file.file.read())
-        
+    await file.seek(0)
+
+    written = 0
+    hasher = hashlib.sha256()
+    buffer = await run_in_threadpool(open, temp_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            written += len(chunk)
+            if written > MAX_FILE_SIZE:
+                raise APIError(ErrorCode.PAYLOAD_TOO_LARGE, message="파일 크기는 5MB를 초과할 수 없습니다.")
+            await run_in_threadpool(_write_chunk, buffer, hasher, chunk)
+        await run_in_threadpool(buffer.close)
+
+        # 콘텐츠 주소 파일명 (확장자는 소문자로 통일하여 같은 내용이 같은 URL을 갖도록 함)
+        content_filename = f"{hasher.hexdigest()}{file_extension.lower()}"
+        file_path = os.path.join(upload_path, content_filename)
+        await run_in_threadpool(_commit_blob, temp_path, file_path)
+    except BaseException:
+        # 크기 초과/오류/취소 시 부분 파일 정리
+        await run_in_threadpool(buffer.close)
+        await run_in_threadpool(_remove_quietly, temp_path)
+        raise
+
     # 접근 가능한 URL 경로 반환 (실무에서는 도메인 주소를 환경변수에서 가져옴)
     # 여기서는 상대 경로 기반의 URL 반환
-    return f"/public/{sub_dir}/{unique_filename}"
+    return file_path, f"/public/{sub_dir}/{content_filename}"
+
+
+async def save_upload_file(file: UploadFile, domain: str) -> str:
+    """
+    업로드된 파일을 로컬에 저장하고 URL 경로 반환 (청크 단위 비동기 스트리밍)
+    domain: 'post' 또는 'profile'
+    """
+    _, file_url = await _stream_upload_file(file, domain)
+    return file_url
+
+
+async def save_upload_files(files: List[UploadFile], domain: str) -> List[str]:
+    """
+    여러 파일을 동시에 저장하고 URL 경로 리스트 반환 (입력 순서 유지)
+    - 하나라도 실패하면 첫 번째 오류를 그대로 전달
+      (이미 저장된 파일은 다른 게시글이 참조 중일 수 있으므로 삭제하지 않고 db/gc_images.py에 맡김)
+    """
+    results = await asyncio.gather(
+        *(_stream_upload_file(file, domain) for file in files),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    return [file_url for _, file_url in results]
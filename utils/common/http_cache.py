@@ -0,0 +1,102 @@
+"""
+HTTP 조건부 요청(ETag / Last-Modified) 유틸리티
+- 응답 본문 또는 버전 정보로 약한 ETag(W/"...") 생성
+- If-None-Match(우선) / If-Modified-Since 검사 후 304 Not Modified 응답
+- 세션에 따라 응답(isLiked 등)이 달라지므로 공유 캐시는 막고(private) 매번 재검증(no-cache)하도록 지정
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+from fastapi import Request, Response, status
+from utils.common.metrics import metrics
+
+CACHE_CONTROL = "private, no-cache"
+VARY = "Cookie"
+
+# 응답 포맷이 바뀌면 올려서 기존 ETag를 모두 무효화 (3: 게시글 excerpt는 목록 view=summary 에서만 포함)
+CONTENT_VERSION = "3"
+
+
+def make_etag(*parts: Any) -> str:
+    """값(또는 직렬화된 본문 bytes)들로 약한 ETag 생성"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(CONTENT_VERSION.encode())
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _to_utc(value: datetime) -> datetime:
+    # DB 타임스탬프는 UTC 기준 naive datetime
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두사 무시, 여러 값 및 * 지원)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    조건부 요청 검사 (RFC 9110)
+    - If-None-Match가 있으면 그것만 사용하고 If-Modified-Since는 무시
+    - If-Modified-Since는 초 단위로 비교
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return _to_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": VARY}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """본문 없는 304 응답 (캐시 검증 헤더 포함)"""
+    metrics.inc("http_not_modified")
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, last_modified))
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """
+    직렬화를 마친 응답에 캐시 검증 헤더를 붙이고, 조건부 요청이 일치하면 304로 대체
+    - etag 미지정 시 응답 본문 해시로 생성
+    """
+    etag = etag or make_etag(response.body)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response.headers.update(cache_headers(etag, last_modified))
+    return response
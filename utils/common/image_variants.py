@@ -0,0 +1,159 @@
+"""
+이미지 변형(썸네일/중간 크기) 생성 파이프라인
+- 업로드 저장 직후 백그라운드에서 비율을 유지한 축소 + 재압축 변형을 생성
+  (원본이 x.png 이면 x_thumb.png, x_medium.png 로 같은 디렉토리에 저장)
+- 이미지 디코딩/리사이즈는 CPU 작업이므로 프로세스 풀에서 실행
+- 생성 완료 시 콜백으로 변형 URL 전달 (예: post_images.thumb_url/medium_url 갱신)
+- Pillow 미설치 환경에서는 변형을 생성하지 않고 원본만 사용
+"""
+
+import asyncio
+import contextvars
+import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from config import settings
+from utils.common.metrics import metrics
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성 (pip install ".[images]")
+    Image = None
+    ImageOps = None
+
+_logger = logging.getLogger("image_variants")
+
+# 변형 이름 -> 긴 변 최대 픽셀 (원본보다 크게 늘리지 않음)
+VARIANT_SIZES = {"thumb": 320, "medium": 960}
+
+# 재압축 대상 형식 (gif는 애니메이션 보존을 위해 원본 유지)
+_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG"}
+
+VariantCallback = Callable[[str, Dict[str, str]], Awaitable[None]]
+
+
+def variant_url(fileUrl: str, name: str) -> str:
+    """원본 URL(또는 경로)에 대응하는 변형 URL"""
+    stem, ext = os.path.splitext(fileUrl)
+    return f"{stem}_{name}{ext}"
+
+
+def _local_path(fileUrl: str) -> str:
+    """'/public/image/...' URL을 로컬 파일 경로로 변환"""
+    return fileUrl.lstrip("/")
+
+
+def ready_variant_urls(fileUrl: str) -> Dict[str, Optional[str]]:
+    """이미 생성이 끝난 변형 URL (아직 없으면 None)"""
+    return {
+        name: url if os.path.exists(_local_path(url)) else None
+        for name, url in ((name, variant_url(fileUrl, name)) for name in VARIANT_SIZES)
+    }
+
+
+def _generate_variants(sourcePath: str) -> Dict[str, str]:
+    """(프로세스 풀 워커에서 실행) 변형 파일을 생성하고 {변형명: 경로} 반환"""
+    imageFormat = _FORMATS.get(os.path.splitext(sourcePath)[1].lower())
+    if Image is None or imageFormat is None:
+        return {}
+
+    results = {}
+    with Image.open(sourcePath) as original:
+        # EXIF 회전 정보 반영 (휴대폰 사진이 눕는 문제 방지)
+        source = ImageOps.exif_transpose(original)
+        for name, maxSize in VARIANT_SIZES.items():
+            targetPath = variant_url(sourcePath, name)
+            image = source.copy()
+            image.thumbnail((maxSize, maxSize))
+            if imageFormat == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            # 같은 원본(콘텐츠 주소)의 변형을 다른 프로세스가 동시에 만들더라도 서로의 임시 파일을 덮어쓰지 않도록
+            # 업로드 임시 파일과 같은 방식의 고유 이름 사용
+            tempPath = f"{targetPath}.{uuid.uuid4().hex}.part"
+            try:
+                if imageFormat == "JPEG":
+                    image.save(tempPath, "JPEG", quality=80, optimize=True, progressive=True)
+                else:
+                    image.save(tempPath, "PNG", optimize=True)
+                os.replace(tempPath, targetPath)
+            except BaseException:
+                try:
+                    os.remove(tempPath)
+                except OSError:
+                    pass
+                raise
+            results[name] = targetPath
+    return results
+
+
+class ImageVariantPipeline:
+    """업로드 이미지의 변형을 프로세스 풀에서 생성하는 백그라운드 파이프라인"""
+
+    def __init__(self, maxWorkers: int):
+        self.maxWorkers = maxWorkers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+        # 생성 중인 원본 URL -> 완료 시 호출할 콜백 (같은 원본의 중복 예약은 새 작업 없이 여기에 합류)
+        self._inflight: Dict[str, List[VariantCallback]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None and self.maxWorkers > 0
+
+    def schedule(self, fileUrl: str, onComplete: Optional[VariantCallback] = None) -> None:
+        """변형 생성 예약 (응답을 기다리게 하지 않음)"""
+        if not self.enabled:
+            return
+        # 같은 원본을 이미 생성 중이면 (한 요청의 중복 파일, 여러 사용자의 같은 이미지) 새 작업 없이 콜백만 추가
+        callbacks = self._inflight.get(fileUrl)
+        if callbacks is not None:
+            if onComplete is not None and onComplete not in callbacks:
+                callbacks.append(onComplete)
+            return
+        # 같은 내용이 이미 업로드되어 변형까지 있는 경우 (콘텐츠 주소 저장) 재생성 생략
+        if all(ready_variant_urls(fileUrl).values()):
+            return
+        self._inflight[fileUrl] = [onComplete] if onComplete is not None else []
+        # 요청 컨텍스트(고정된 커넥션/트랜잭션)를 물려받지 않도록 빈 컨텍스트에서 생성
+        task = contextvars.Context().run(asyncio.create_task, self._run(fileUrl))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, fileUrl: str) -> None:
+        if self._executor is None:
+            # 이벤트 루프/커넥션 풀/스레드가 떠 있는 프로세스를 fork하면 자식에서 교착될 수 있으므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.maxWorkers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                paths = await loop.run_in_executor(self._executor, _generate_variants, _local_path(fileUrl))
+            finally:
+                # 콜백 실행 전에 진행 중 목록에서 제거 (이후 예약은 디스크의 완성된 변형을 보고 생략)
+                callbacks = self._inflight.pop(fileUrl, [])
+            if not paths:
+                return
+            urls = {name: variant_url(fileUrl, name) for name in paths}
+            for onComplete in callbacks:
+                await onComplete(fileUrl, urls)
+            metrics.inc("image_variants", label="generated")
+        except Exception as e:
+            metrics.inc("image_variants", label="failed")
+            _logger.warning(f"Image variant generation failed ({fileUrl}): {str(e)}")
+
+    async def shutdown(self) -> None:
+        """진행 중인 변형 생성을 마친 뒤 프로세스 풀 종료 (서버 종료 시 호출)"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# 전역 인스턴스
+image_variant_pipeline = ImageVariantPipeline(maxWorkers=settings.image_variant_workers)
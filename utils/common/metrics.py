@@ -0,0 +1,86 @@
+"""
+인프로세스 메트릭 레지스트리
+- Counter / Histogram / Gauge(조회 시점에 계산되는 콜백)
+- 라벨 단위(예: 모델 메서드명)로 집계하고 /metrics 엔드포인트에서 스냅샷으로 노출
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+
+class Histogram:
+    """고정 버킷(ms) 히스토그램"""
+
+    DEFAULT_BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """누적 버킷 카운트 포함 (le_10 = 10ms 이하 관측 수)"""
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[f"le_{bound:g}"] = cumulative
+        buckets["le_inf"] = self.count
+        return {
+            "count": self.count,
+            "sumMs": round(self.sum, 3),
+            "avgMs": round(self.sum / self.count, 3) if self.count else 0.0,
+            "maxMs": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class MetricsRegistry:
+    """이름(+선택적 라벨) 단위로 메트릭을 보관하는 레지스트리"""
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[Optional[str], int]] = defaultdict(lambda: defaultdict(int))
+        self._histograms: Dict[str, Dict[Optional[str], Histogram]] = defaultdict(dict)
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+
+    def inc(self, name: str, value: int = 1, label: Optional[str] = None) -> None:
+        self._counters[name][label] += value
+
+    def observe(self, name: str, value: float, label: Optional[str] = None) -> None:
+        histogram = self._histograms[name].get(label)
+        if histogram is None:
+            histogram = self._histograms[name][label] = Histogram()
+        histogram.observe(value)
+
+    def register_gauge(self, name: str, callback: Callable[[], Any]) -> None:
+        """조회 시점에 값을 계산하는 게이지 등록 (예: 커넥션 풀 사용량)"""
+        self._gauges[name] = callback
+
+    @staticmethod
+    def _by_label(values: Dict[Optional[str], Any], convert: Callable[[Any], Any]) -> Any:
+        if set(values) == {None}:
+            return convert(values[None])
+        return {str(label): convert(value) for label, value in sorted(values.items(), key=lambda item: str(item[0]))}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "counters": {name: self._by_label(values, int) for name, values in self._counters.items()},
+            "gauges": {name: callback() for name, callback in self._gauges.items()},
+            "histograms": {
+                name: self._by_label(values, Histogram.snapshot) for name, values in self._histograms.items()
+            },
+        }
+
+
+# 전역 레지스트리 인스턴스
+metrics = MetricsRegistry()
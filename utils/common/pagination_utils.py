@@ -0,0 +1,27 @@
+import base64
+import json
+from typing import Any, List
+from utils.errors.exceptions import APIError
+from utils.errors.error_codes import ErrorCode
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값들을 불투명(opaque) 커서 문자열로 인코딩"""
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 리스트로 디코딩
+    - size: 기대하는 키 개수 (형식이 다르면 INVALID_INPUT)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise APIError(ErrorCode.INVALID_INPUT, {"cursor": ["INVALID_FORMAT"]})
+    return values
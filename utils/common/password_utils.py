@@ -0,0 +1,85 @@
+"""
+비밀번호 해싱/검증 유틸리티
+- bcrypt 연산(수백 ms)을 전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+  (bcrypt는 해싱 중 GIL을 해제하므로 스레드만으로 병렬 처리 가능)
+- 세마포어로 동시 실행 수를 제한하고, 대기 중인 요청 수를 메트릭(/metrics)으로 노출
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import bcrypt
+from config import settings
+from utils.common.metrics import metrics
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_concurrency,
+    thread_name_prefix="password-hash",
+)
+_semaphore: Optional[asyncio.Semaphore] = None  # 실행 중인 이벤트 루프에서 생성
+_waiting = 0
+_running = 0
+
+
+def _pool_stats() -> Dict[str, int]:
+    return {
+        "maxConcurrency": settings.password_hash_concurrency,
+        "running": _running,
+        "waiting": _waiting,
+    }
+
+
+metrics.register_gauge("password_hash_pool", _pool_stats)
+
+
+async def _run_in_pool(operation: str, func: Callable[..., Any], *args) -> Any:
+    """동시 실행 수 제한 하에 스레드 풀에서 bcrypt 연산 실행"""
+    global _semaphore, _waiting, _running
+
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.password_hash_concurrency)
+    queued_at = time.perf_counter()
+    _waiting += 1
+    try:
+        await _semaphore.acquire()
+    finally:
+        _waiting -= 1
+    metrics.observe("password_hash_wait_ms", (time.perf_counter() - queued_at) * 1000, operation)
+
+    _running += 1
+    started_at = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, func, *args)
+    finally:
+        _running -= 1
+        _semaphore.release()
+        metrics.observe("password_hash_duration_ms", (time.perf_counter() - started_at) * 1000, operation)
+
+
+def _hash(password: str) -> str:
+    salt = bcrypt.gensalt()
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify(plainPassword: str, hashedPassword: str) -> bool:
+    try:
+        return bcrypt.checkpw(plainPassword.encode("utf-8"), hashedPassword.encode("utf-8"))
+    except Exception:
+        return False
+
+
+async def hash_password(password: str) -> str:
+    """비밀번호 해싱"""
+    return await _run_in_pool("hash", _hash, password)
+
+
+async def verify_password(plainPassword: str, hashedPassword: str) -> bool:
+    """비밀번호 검증"""
+    return await _run_in_pool("verify", _verify, plainPassword, hashedPassword)
+
+
+def shutdown_password_pool() -> None:
+    """서버 종료 시 스레드 풀 정리"""
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -2,12 +2,28 @@
 표준 API 응답 포맷
 - Enum 기반 코드 사용
 - 계층적 에러 구조 지원
+- 조회 응답은 FastJSONResponse로 바로 직렬화 (response_model 재검증 생략)
 """
 
 from typing import Any, Dict, List, Optional
+from fastapi import Response, status
+from pydantic_core import to_json
 from ..errors.error_codes import ErrorCode, SuccessCode, get_success_message
 
 
+class FastJSONResponse(Response):
+    """
+    이미 검증된 Pydantic 모델(PostResponse 등)을 포함한 응답을 pydantic-core 직렬화기로 바로 bytes 변환
+    - 라우트가 Response를 반환하면 FastAPI의 response_model 검증/직렬화를 거치지 않으므로
+      data에는 응답 스키마 모델 인스턴스(또는 스키마와 같은 모양의 dict)만 담아야 함
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 class StandardResponse:
     """모든 API 응답의 표준 포맷"""
 
@@ -20,6 +36,13 @@ class StandardResponse:
             "data": data if data is not None else {}
         }
 
+    @staticmethod
+    def success_response(code: SuccessCode, data: Any = None, status_code: int = status.HTTP_200_OK) -> FastJSONResponse:
+        """성공 응답을 바로 직렬화한 Response (response_model의 StandardResponse 스키마와 같은 모양)"""
+        envelope = StandardResponse.success(code, data)
+        envelope["details"] = None
+        return FastJSONResponse(envelope, status_code=status_code)
+
     @staticmethod
     def error(code: ErrorCode, details: Any = None, message: Optional[str] = None) -> Dict:
         """
@@ -0,0 +1,70 @@
+"""
+게시글 조회수 중복 제거 (시간 버킷 방식)
+- (조회자 키, postId)를 64비트 지문(fingerprint)으로 축약하여 현재/직전 두 개의 버킷(set)에 보관
+- 두 버킷 중 하나에 있으면 중복 조회로 판단 → 같은 조회자는 window ~ 2*window 동안 한 번만 집계
+- 버킷당 최대 개수를 넘으면 조기 교체하여 메모리 사용량 상한 유지 (이때 중복 제거 기간이 짧아질 수 있음)
+"""
+
+import hashlib
+import time
+from typing import Dict, Optional, Set
+from config import settings
+from utils.common.metrics import metrics
+
+
+class ViewDeduplicator:
+    """조회자별 게시글 조회 중복 제거기"""
+
+    def __init__(self, window: float, max_entries: int):
+        self.window = window
+        self.max_entries = max_entries
+        self._current: Set[int] = set()
+        self._previous: Set[int] = set()
+        self._bucket_started = time.monotonic()
+        metrics.register_gauge("view_dedup", self.stats)
+
+    @staticmethod
+    def _fingerprint(viewer_key: str, post_id: str) -> int:
+        digest = hashlib.blake2b(f"{viewer_key}|{post_id}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def _rotate(self, now: float) -> None:
+        elapsed = now - self._bucket_started
+        if elapsed >= 2 * self.window:
+            # 두 버킷 모두 만료
+            self._previous = set()
+            self._current = set()
+            self._bucket_started = now
+        elif elapsed >= self.window or len(self._current) >= self.max_entries:
+            self._previous = self._current
+            self._current = set()
+            self._bucket_started = now
+
+    def first_view(self, viewer_key: Optional[str], post_id: str) -> bool:
+        """윈도우 내 첫 조회이면 True (조회자 키가 없으면 항상 True)"""
+        if not viewer_key or self.window <= 0:
+            return True
+
+        self._rotate(time.monotonic())
+        fingerprint = self._fingerprint(viewer_key, post_id)
+        if fingerprint in self._current or fingerprint in self._previous:
+            metrics.inc("post_views", label="deduplicated")
+            return False
+
+        self._current.add(fingerprint)
+        metrics.inc("post_views", label="counted")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "currentBucket": len(self._current),
+            "previousBucket": len(self._previous),
+            "maxEntries": self.max_entries,
+        }
+
+
+# 전역 인스턴스 (워커 프로세스별 인메모리)
+view_deduplicator = ViewDeduplicator(
+    window=settings.view_dedup_window,
+    max_entries=settings.view_dedup_max_entries,
+)
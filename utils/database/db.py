@@ -1,31 +1,102 @@
-from typing import Any, Dict, Iterable, Optional
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 import logging
 import aiomysql
 from config import settings
+from utils.common.metrics import metrics
 
 
 _pool: Optional[aiomysql.Pool] = None
 _logger = logging.getLogger("db")
 
+# 현재 작업 단위에 고정된 커넥션 / 트랜잭션 진행 여부 (connection(), transaction() 참고)
+_conn_ctx: ContextVar[Optional[aiomysql.Connection]] = ContextVar("db_connection", default=None)
+_tx_ctx: ContextVar[bool] = ContextVar("db_in_transaction", default=False)
 
-async def init_pool() -> None:
-    global _pool
-    if _pool is not None:
-        return
-    _pool = await aiomysql.create_pool(
-        host=settings.db_host,
-        port=settings.db_port,
+# 현재 요청(Context)에서 쓰기가 발생했는지 여부
+# 쓰기 이후의 조회는 primary로 보내 같은 요청 안에서 read-your-writes 보장
+_wrote_ctx: ContextVar[bool] = ContextVar("db_wrote", default=False)
+
+
+class _Replica:
+    """읽기 전용 복제본(Replica) 커넥션 풀과 헬스 상태"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.pool: Optional[aiomysql.Pool] = None
+        self.healthy = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.host}:{self.port}"
+
+
+_replicas: List[_Replica] = []
+_replica_index = 0
+
+# 복제본을 비정상으로 표시하는 연결 수준 오류 코드
+# (2003 접속 불가, 2006 서버 연결 끊김, 2013 쿼리 중 연결 끊김, 2055 읽기/쓰기 중 연결 끊김)
+# 락 대기 타임아웃(1205), 실행 시간 초과(3024) 등 쿼리 수준 OperationalError는 복제본 상태와 무관
+_CONNECTION_ERROR_CODES = {2003, 2006, 2013, 2055}
+_health_task: Optional[asyncio.Task] = None
+
+
+def _parse_replica_hosts(value: str) -> List[Tuple[str, int]]:
+    """'host1:3307,host2' 형식의 설정값을 (host, port) 리스트로 변환"""
+    hosts = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(":")
+        hosts.append((host, int(port) if port else settings.db_port))
+    return hosts
+
+
+async def _create_pool(host: str, port: int, maxsize: int) -> aiomysql.Pool:
+    return await aiomysql.create_pool(
+        host=host,
+        port=port,
         user=settings.db_user,
         password=settings.db_password,
         db=settings.db_name,
         minsize=1,
-        maxsize=settings.db_pool_size,
-        autocommit=False,
+        maxsize=maxsize,
+        # 단일 쿼리는 서버 autocommit으로 처리하여 조회마다 COMMIT 왕복을 생략
+        # 여러 쿼리를 묶어야 하는 경우 transaction()이 명시적으로 BEGIN/COMMIT
+        autocommit=True,
     )
 
 
+async def init_pool() -> None:
+    global _pool, _replicas, _health_task
+    if _pool is not None:
+        return
+    _pool = await _create_pool(settings.db_host, settings.db_port, settings.db_pool_size)
+
+    _replicas = [_Replica(host, port) for host, port in _parse_replica_hosts(settings.db_replica_hosts)]
+    if _replicas:
+        await _check_replicas()
+        _health_task = asyncio.create_task(_health_check_loop())
+
+
 async def close_pool() -> None:
-    global _pool
+    global _pool, _replicas, _health_task
+    if _health_task is not None:
+        _health_task.cancel()
+        _health_task = None
+
+    for replica in _replicas:
+        if replica.pool is not None:
+            replica.pool.close()
+            await replica.pool.wait_closed()
+    _replicas = []
+
     if _pool is None:
         return
     _pool.close()
@@ -38,53 +109,213 @@ async def _ensure_pool() -> None:
         await init_pool()
 
 
+async def _check_replica(replica: _Replica) -> None:
+    """복제본에 SELECT 1을 보내 헬스 상태 갱신 (풀 생성 실패 시 다음 주기에 재시도)"""
+    try:
+        if replica.pool is None:
+            replica.pool = await _create_pool(replica.host, replica.port, settings.db_replica_pool_size)
+        async with replica.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT 1")
+        if not replica.healthy:
+            _logger.info(f"Replica {replica.name} is healthy")
+        replica.healthy = True
+    except Exception as e:
+        if replica.healthy or replica.pool is None:
+            _logger.warning(f"Replica {replica.name} is unhealthy: {str(e)}")
+        replica.healthy = False
+
+
+async def _check_replicas() -> None:
+    await asyncio.gather(*(
+        asyncio.wait_for(_check_replica(replica), timeout=settings.db_replica_health_interval)
+        for replica in _replicas
+    ), return_exceptions=True)
+
+
+async def _health_check_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.db_replica_health_interval)
+        await _check_replicas()
+
+
+def _is_connection_error(e: BaseException) -> bool:
+    """복제본 자체의 장애(접속 실패/연결 끊김)로 볼 수 있는 오류인지"""
+    if isinstance(e, aiomysql.OperationalError):
+        return bool(e.args) and e.args[0] in _CONNECTION_ERROR_CODES
+    return isinstance(e, OSError)
+
+
+def _pick_replica() -> Optional[_Replica]:
+    """정상 상태인 복제본을 라운드 로빈으로 선택 (없으면 None → primary 사용)"""
+    global _replica_index
+    healthy = [replica for replica in _replicas if replica.healthy and replica.pool is not None]
+    if not healthy:
+        return None
+    _replica_index = (_replica_index + 1) % len(healthy)
+    return healthy[_replica_index]
+
+
+@asynccontextmanager
+async def _acquire(pool: aiomysql.Pool, name: str) -> AsyncIterator[aiomysql.Connection]:
+    """풀에서 커넥션 획득 (획득 대기 시간을 메트릭으로 기록)"""
+    start = time.perf_counter()
+    async with pool.acquire() as conn:
+        metrics.observe("db_pool_acquire_wait_ms", (time.perf_counter() - start) * 1000, label=name)
+        yield conn
+
+
+def _pool_stats(pool: Optional[aiomysql.Pool]) -> Dict[str, int]:
+    if pool is None:
+        return {"size": 0, "free": 0, "inUse": 0, "maxSize": 0}
+    return {
+        "size": pool.size,
+        "free": pool.freesize,
+        "inUse": pool.size - pool.freesize,
+        "maxSize": pool.maxsize,
+    }
+
+
+def pool_metrics() -> Dict[str, Any]:
+    """커넥션 풀 사용량 게이지 (primary + 복제본)"""
+    return {
+        "primary": _pool_stats(_pool),
+        "replicas": {
+            replica.name: {**_pool_stats(replica.pool), "healthy": replica.healthy}
+            for replica in _replicas
+        },
+    }
+
+
+metrics.register_gauge("db_pool", pool_metrics)
+
+
+def _caller_name() -> str:
+    """fetch_one/fetch_all/execute를 호출한 함수명 (예: PostModel.getPosts) - 쿼리 메트릭 라벨용"""
+    code = sys._getframe(2).f_code
+    return getattr(code, "co_qualname", code.co_name)
+
+
+@asynccontextmanager
+async def connection() -> AsyncIterator[aiomysql.Connection]:
+    """
+    작업 단위(unit of work) 동안 하나의 커넥션을 고정
+    - 블록 안의 fetch_one/fetch_all/execute 는 contextvar로 전파된 같은 커넥션을 사용
+    - 이미 고정된 커넥션이 있으면 그대로 재사용 (중첩 가능)
+    - 고정된 커넥션은 한 번에 하나의 쿼리만 실행 가능하므로 블록 안에서 asyncio.gather 등으로 병렬 쿼리 금지
+    """
+    conn = _conn_ctx.get()
+    if conn is not None:
+        yield conn
+        return
+
+    await _ensure_pool()
+    if _pool is None:
+        raise RuntimeError("DB pool is not initialized")
+
+    async with _acquire(_pool, "primary") as conn:
+        token = _conn_ctx.set(conn)
+        try:
+            yield conn
+        finally:
+            _conn_ctx.reset(token)
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[aiomysql.Connection]:
+    """
+    블록 안의 모든 쿼리를 하나의 커넥션, 하나의 트랜잭션으로 실행
+    - 블록이 정상 종료되면 COMMIT 1회, 예외 발생 시 ROLLBACK (부분 쓰기 방지)
+    - 중첩 호출 시 바깥 트랜잭션에 합류
+    """
+    if _tx_ctx.get():
+        yield _conn_ctx.get()
+        return
+
+    async with connection() as conn:
+        token = _tx_ctx.set(True)
+        try:
+            await conn.begin()
+            yield conn
+            await conn.commit()
+        except Exception as e:
+            await conn.rollback()
+            _logger.error(f"DB Transaction Error: {str(e)}")
+            raise e
+        finally:
+            _tx_ctx.reset(token)
+
+
+async def _run(
+    conn: aiomysql.Connection,
+    query: str,
+    params: Optional[Iterable[Any]],
+    fetchone: bool,
+    fetchall: bool,
+    caller: str,
+) -> Any:
+    start = time.perf_counter()
+    async with conn.cursor(aiomysql.DictCursor) as cursor:
+        try:
+            await cursor.execute(query, params or ())
+            if fetchone:
+                return await cursor.fetchone()
+            if fetchall:
+                return await cursor.fetchall()
+            return cursor.rowcount
+        except Exception as e:
+            metrics.inc("db_query_errors", label=caller)
+            _logger.error(f"DB Error: {str(e)} | Query: {query} | Params: {params}")
+            raise e
+        finally:
+            metrics.inc("db_queries", label=caller)
+            metrics.observe("db_query_duration_ms", (time.perf_counter() - start) * 1000, label=caller)
+
+
 async def _execute(
     query: str,
     params: Optional[Iterable[Any]] = None,
     fetchone: bool = False,
     fetchall: bool = False,
+    primary: bool = False,
+    caller: str = "unknown",
 ) -> Any:
-    await _ensure_pool()
-    if _pool is None:
-        raise RuntimeError("DB pool is not initialized")
-
-    async with _pool.acquire() as conn:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
+    """
+    쿼리 실행 (조회 시 결과, 그 외에는 영향받은 행 수 반환)
+    - 풀 커넥션이 autocommit 모드이므로 트랜잭션 밖의 쿼리는 별도 COMMIT 없이 즉시 반영
+    - 트랜잭션 안에서는 transaction() 종료 시 일괄 COMMIT
+    - 조회는 복제본으로 라우팅, 단 고정 커넥션/트랜잭션 안이거나 같은 요청에서 쓰기가 있었으면 primary 사용
+    """
+    is_read = fetchone or fetchall
+    if is_read and not primary and _conn_ctx.get() is None and not _wrote_ctx.get():
+        replica = _pick_replica()
+        if replica is not None:
             try:
-                await cursor.execute(query, params or ())
-                result = None
-                if fetchone:
-                    result = await cursor.fetchone()
-                elif fetchall:
-                    result = await cursor.fetchall()
-                await conn.commit()
-                return result
-            except Exception as e:
-                await conn.rollback()
-                _logger.error(f"DB Error: {str(e)} | Query: {query} | Params: {params}")
-                raise e
+                async with _acquire(replica.pool, replica.name) as conn:
+                    return await _run(conn, query, params, fetchone, fetchall, caller)
+            except (aiomysql.OperationalError, OSError) as e:
+                # 연결 오류만 복제본을 비정상으로 표시하고 primary로 재시도 (헬스 체크가 복구)
+                # 쿼리 수준 오류는 primary에서도 같은 결과일 가능성이 높으므로 그대로 전달
+                if not _is_connection_error(e):
+                    raise
+                replica.healthy = False
+                metrics.inc("db_replica_fallbacks", label=replica.name)
+                _logger.warning(f"Replica {replica.name} failed, falling back to primary: {str(e)}")
 
+    async with connection() as conn:
+        result = await _run(conn, query, params, fetchone, fetchall, caller)
+    if not is_read:
+        _wrote_ctx.set(True)
+    return result
 
-async def fetch_one(query: str, params: Optional[Iterable[Any]] = None) -> Optional[Dict[str, Any]]:
-    return await _execute(query, params=params, fetchone=True)
 
+async def fetch_one(query: str, params: Optional[Iterable[Any]] = None, primary: bool = False) -> Optional[Dict[str, Any]]:
+    return await _execute(query, params=params, fetchone=True, primary=primary, caller=_caller_name())
 
-async def fetch_all(query: str, params: Optional[Iterable[Any]] = None) -> Iterable[Dict[str, Any]]:
-    return await _execute(query, params=params, fetchall=True)
 
+async def fetch_all(query: str, params: Optional[Iterable[Any]] = None, primary: bool = False) -> Iterable[Dict[str, Any]]:
+    return await _execute(query, params=params, fetchall=True, primary=primary, caller=_caller_name())
 
-async def execute(query: str, params: Optional[Iterable[Any]] = None) -> int:
-    await _ensure_pool()
-    if _pool is None:
-        raise RuntimeError("DB pool is not initialized")
 
-    async with _pool.acquire() as conn:
-        async with conn.cursor() as cursor:
-            try:
-                await cursor.execute(query, params or ())
-                await conn.commit()
-                return cursor.rowcount
-            except Exception as e:
-                await conn.rollback()
-                _logger.error(f"DB Error: {str(e)} | Query: {query} | Params: {params}")
-                raise e
+async def execute(query: str, params: Optional[Iterable[Any]] = None) -> int:
+    return await _execute(query, params=params, caller=_caller_name())
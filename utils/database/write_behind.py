@@ -0,0 +1,115 @@
+"""
+Write-behind 카운터
+- 키별 증가량(delta)을 메모리에 모아 두었다가 주기(flush_interval) 또는 누적량(flush_threshold)
+  기준으로 flush 함수에 한 번에 전달 (예: 게시글 조회수를 다중 행 UPDATE 한 번으로 반영)
+- 반영 실패 시 증가량을 버퍼에 되돌려 다음 flush에서 재시도
+- 워커 프로세스별 인메모리이므로 종료 시 stop()으로 남은 증가량을 반드시 반영해야 함
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+from utils.common.metrics import metrics
+
+_logger = logging.getLogger("db")
+
+
+class WriteBehindCounter:
+    """키별 증가량을 모아 일괄 반영하는 카운터"""
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[Dict[str, int]], Awaitable[None]],
+        flush_interval: float,
+        flush_threshold: int,
+    ):
+        self.name = name
+        self._flush = flush
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[str, int] = {}
+        self._pending_total = 0
+        # flush 중인 배치 (DB 반영 완료 전까지 pending()에 계속 포함)
+        self._inflight: Dict[str, int] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._threshold_task: Optional[asyncio.Task] = None
+        metrics.register_gauge(f"write_behind_{name}", self.stats)
+
+    def add(self, key: str, delta: int = 1) -> None:
+        """증가량 누적 (임계치 도달 시 백그라운드 flush 예약)"""
+        self._pending[key] = self._pending.get(key, 0) + delta
+        self._pending_total += delta
+        if self._pending_total >= self.flush_threshold and self._task is not None:
+            if self._threshold_task is None or self._threshold_task.done():
+                # 요청 컨텍스트(고정된 커넥션/트랜잭션)를 물려받지 않도록 빈 컨텍스트에서 생성
+                self._threshold_task = contextvars.Context().run(asyncio.create_task, self.flush())
+
+    def pending(self, key: str) -> int:
+        """아직 DB에 반영되지 않은 증가량 (flush 중인 배치 포함)"""
+        return self._pending.get(key, 0) + self._inflight.get(key, 0)
+
+    async def flush(self) -> None:
+        """누적된 증가량을 flush 함수로 일괄 반영"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._pending:
+                return
+
+            batch, self._pending, self._pending_total = self._pending, {}, 0
+            self._inflight = batch
+            try:
+                await self._flush(batch)
+                metrics.inc("write_behind_flushes", label=self.name)
+            except Exception as e:
+                # 실패한 증가량은 버퍼에 되돌려 다음 flush에서 재시도
+                self._restore(batch)
+                metrics.inc("write_behind_flush_errors", label=self.name)
+                _logger.error(f"Write-behind flush failed ({self.name}): {str(e)}")
+            except BaseException:
+                # 취소 등으로 중단된 배치도 버리지 않고 되돌림 (_inflight를 비우기 전에 되돌려야 유실 없음)
+                self._restore(batch)
+                raise
+            finally:
+                self._inflight = {}
+
+    def _restore(self, batch: Dict[str, int]) -> None:
+        for key, delta in batch.items():
+            self._pending[key] = self._pending.get(key, 0) + delta
+            self._pending_total += delta
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+                return
+            except asyncio.TimeoutError:
+                await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = contextvars.Context().run(asyncio.create_task, self._flush_loop())
+
+    async def stop(self) -> None:
+        """주기 flush 중단 후 남은 증가량 반영 (서버 종료 시 호출)"""
+        if self._task is not None:
+            # 취소하면 진행 중인 반영이 중단되므로, 종료 신호를 보내고 현재 반영이 끝날 때까지 대기
+            self._stopping.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._threshold_task is not None:
+            await asyncio.gather(self._threshold_task, return_exceptions=True)
+            self._threshold_task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pendingKeys": len(self._pending),
+            "pendingTotal": self._pending_total,
+            "inflightTotal": sum(self._inflight.values()),
+        }
@@ -1,29 +1,37 @@
 import time
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("access_logger")
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
+class AccessLogMiddleware:
     """
-    모든 HTTP 요청과 응답을 로깅하는 미들웨어.
+    모든 HTTP 요청과 응답을 로깅하는 미들웨어 (순수 ASGI).
     - 요청: Method, URL, Client IP
     - 응답: Status Code, 처리 시간(ms)
     """
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
         
         # 요청 정보 추출
-        method = request.method
-        path = request.url.path
-        client_ip = request.client.host if request.client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
         
         # 특정 경로 제외 (정적 파일 및 빈번한 폴링성 요청)
         # /public: 정적 파일
         # /v1/posts: 게시글 목록/상세/댓글 (폴링성)
         # /v1/users/me: 내 정보 조회 (폴링성)
-        excluded_paths = ["/v1/posts", "/v1/users/me"]
+        # /v1/events: 실시간 이벤트 스트림 (장시간 유지되는 연결)
+        excluded_paths = ["/v1/posts", "/v1/users/me", "/v1/events"]
         
         is_excluded = (
             path.startswith("/public") or 
@@ -32,23 +40,29 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
         )
 
         if is_excluded:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # 요청 로깅
         logger.info(f"Request: {method} {path} - IP: {client_ip}")
+
+        status_code = None
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_status)
             
             # 처리 시간 계산
             process_time = (time.time() - start_time) * 1000
-            status_code = response.status_code
             
             # 응답 로깅
             logger.info(f"Response: {method} {path} - Status: {status_code} - Time: {process_time:.2f}ms")
             
-            return response
-            
         except Exception as e:
             # 예외 발생 시 로깅 (이미 exception_handler에서 처리되지만, 미들웨어 레벨에서도 기록)
             process_time = (time.time() - start_time) * 1000
@@ -1,16 +1,22 @@
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
 from models.user_model import user_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # 1. 세션에서 userId 추출하여 state에 가볍게 저장 (식별 역할)
-        request.state.user_id = request.session.get("userId")
-        
-        response = await call_next(request)
-        return response
+class AuthMiddleware:
+    """세션의 userId를 request.state.user_id로 노출하는 미들웨어 (순수 ASGI)"""
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            # 1. 세션에서 userId 추출하여 state에 가볍게 저장 (식별 역할)
+            connection = HTTPConnection(scope)
+            connection.state.user_id = connection.session.get("userId")
+
+        await self.app(scope, receive, send)
 
 async def get_current_user(request: Request):
     """요청에 인증된 사용자 반환 (없으면 401, 검증 역할)"""
@@ -19,8 +25,8 @@ async def get_current_user(request: Request):
     if not user_id:
         raise APIError(ErrorCode.UNAUTHORIZED)
         
-    # 실제 DB(메모리)에서 최신 사용자 정보 조회
-    user = await user_model.getUserById(user_id)
+    # 사용자 정보 조회 (짧은 TTL 캐시, 수정/탈퇴 시 무효화)
+    user = await user_model.getCachedUserById(user_id)
     if not user:
         # 사용자가 없는 경우 세션 클리어 후 401
         request.session.clear()
@@ -35,7 +41,7 @@ async def get_optional_user(request: Request):
     if not user_id:
         return None
 
-    user = await user_model.getUserById(user_id)
+    user = await user_model.getCachedUserById(user_id)
     if not user:
         # 사용자가 없는 경우 세션 클리어
         request.session.clear()
@@ -0,0 +1,113 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config import settings
+from utils.common.compression import StreamCompressor, is_compressible, negotiate_encoding
+from utils.common.metrics import metrics
+
+# 본문이 없거나 부분 응답이라 압축하지 않는 상태 코드
+_SKIP_STATUS = {204, 206, 304}
+
+
+def _add_vary_accept_encoding(message: Message) -> None:
+    """Vary에 Accept-Encoding 추가 (이미 있으면 생략)"""
+    headers = MutableHeaders(scope=message)
+    vary = [value.strip().lower() for value in headers.get("vary", "").split(",")]
+    if "accept-encoding" not in vary and "*" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상 기반 응답 압축 미들웨어 (순수 ASGI, gzip / brotli).
+    - 텍스트/JSON 계열만 압축 (이미지, text/event-stream, 이미 인코딩된 응답은 그대로 전달)
+    - 단일 청크 응답은 compression_min_size 미만이면 압축하지 않고, 압축 후 Content-Length 재설정
+    - 스트리밍 응답은 본문 전체를 모으지 않고 청크마다 압축 + flush 하여 바로 전송 (Content-Length 제거)
+    - 압축 대상 형식이면 실제 압축 여부(크기, 협상 결과)와 무관하게 Vary: Accept-Encoding 추가
+      (캐시가 압축본과 원본을 같은 키로 섞어 저장하지 않도록)
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        if scope["method"] != "HEAD":
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            async def send_with_vary(message: Message):
+                if message["type"] == "http.response.start" and is_compressible(
+                    Headers(raw=message["headers"]).get("content-type")
+                ):
+                    _add_vary_accept_encoding(message)
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                compressible = is_compressible(headers.get("content-type"))
+                if compressible:
+                    _add_vary_accept_encoding(message)
+                if message["status"] in _SKIP_STATUS or "content-encoding" in headers or not compressible:
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 첫 본문 청크를 보고 압축 여부를 결정할 때까지 헤더 전송 보류
+                    start_message = message
+                return
+
+            if message_type != "http.response.body":
+                # 본문 외 확장 메시지(pathsend 등)는 압축하지 않고 그대로 전달
+                passthrough = True
+                if start_message is not None and compressor is None:
+                    await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < settings.compression_min_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = StreamCompressor(encoding)
+                headers = MutableHeaders(scope=start_message)
+                headers["Content-Encoding"] = encoding
+                # 인코딩별로 본문이 달라지므로 강한 ETag는 약한 ETag로 변경
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+                compressed = compressor.compress(body, final=not more_body)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(compressed))
+                await send(start_message)
+            else:
+                compressed = compressor.compress(body, final=not more_body)
+
+            metrics.inc("compression_bytes_in", len(body), label=encoding)
+            metrics.inc("compression_bytes_out", len(compressed), label=encoding)
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
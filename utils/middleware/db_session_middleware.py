@@ -1,81 +1,137 @@
 import json
 import secrets
 from datetime import datetime, timedelta
-from typing import Dict
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from config import settings
+from utils.common.cache import TTLCache
 from utils.database.db import fetch_one, execute
 
+# session_key -> 세션 데이터 캐시 (저장/삭제 시 함께 갱신)
+session_cache = TTLCache("sessions", maxsize=settings.session_cache_size, ttl=settings.session_cache_ttl)
 
-class DBSessionMiddleware(BaseHTTPMiddleware):
-    """DB 기반 세션 미들웨어"""
 
-    async def dispatch(self, request: Request, call_next):
-        session_key = request.cookies.get(settings.session_cookie_name)
+async def _load_session(session_key: str) -> Optional[Dict]:
+    """세션 조회 (캐시 우선, 미스 시 DB 조회 후 DB 만료 시각을 넘지 않도록 캐시)"""
+    cached = session_cache.get(session_key)
+    if cached is not None:
+        return dict(cached)
+
+    row = await fetch_one(
+        "SELECT data, expires_at FROM sessions WHERE session_key = %s AND expires_at > NOW()",
+        (session_key,),
+        primary=True,  # 직전 요청(로그인 등)에서 기록한 세션을 복제 지연 없이 읽기 위해 primary 조회
+    )
+    if not row or not row.get("data"):
+        return None
+
+    session = json.loads(row["data"])
+    remaining = (row["expires_at"] - datetime.utcnow()).total_seconds()
+    session_cache.set(session_key, session, ttl=remaining)
+    return dict(session)
+
+
+def _append_cookie_headers(headers: MutableHeaders, cookie_response: Response) -> None:
+    """임시 Response에 설정된 Set-Cookie 헤더를 실제 응답 헤더에 복사"""
+    for key, value in cookie_response.raw_headers:
+        if key == b"set-cookie":
+            headers.append("set-cookie", value.decode("latin-1"))
+
+
+async def _save_session(scope: Scope, session_key: Optional[str], snapshot: str, clear_cookie: bool) -> Response:
+    """변경된 세션을 저장하고, 응답에 붙일 쿠키를 담은 임시 Response 반환"""
+    cookie_response = Response()
+    current_session = scope.get("session", {})
+    current_snapshot = json.dumps(current_session, sort_keys=True)
+
+    if current_snapshot != snapshot:
+        if not current_session:
+            if session_key:
+                session_cache.delete(session_key)
+                await execute(
+                    "DELETE FROM sessions WHERE session_key = %s",
+                    (session_key,),
+                )
+            cookie_response.delete_cookie(settings.session_cookie_name)
+            return cookie_response
+
+        if not session_key:
+            session_key = secrets.token_urlsafe(32)
+
+        expires_at = datetime.utcnow() + timedelta(seconds=settings.session_timeout)
+        data_json = json.dumps(current_session)
+        user_id = current_session.get("userId")
+
+        await execute(
+            """
+            INSERT INTO sessions (session_key, user_id, data, expires_at, created_at)
+            VALUES (%s, %s, %s, %s, NOW())
+            ON DUPLICATE KEY UPDATE
+                user_id = VALUES(user_id),
+                data = VALUES(data),
+                expires_at = VALUES(expires_at)
+            """,
+            (session_key, user_id, data_json, expires_at),
+        )
+        session_cache.set(session_key, json.loads(data_json))
+
+        cookie_response.set_cookie(
+            settings.session_cookie_name,
+            session_key,
+            max_age=settings.session_timeout,
+            httponly=True,
+            samesite=settings.cookie_samesite,
+            secure=settings.cookie_secure,
+        )
+
+    if clear_cookie:
+        cookie_response.delete_cookie(settings.session_cookie_name)
+
+    return cookie_response
+
+
+class DBSessionMiddleware:
+    """DB 기반 세션 미들웨어 (순수 ASGI, 인메모리 TTL/LRU 캐시 적용)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 정적 파일은 세션이 필요 없으므로 조회/저장 생략
+        if scope["path"].startswith("/public"):
+            scope["session"] = {}
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        session_key = connection.cookies.get(settings.session_cookie_name)
         session: Dict = {}
 
         clear_cookie = False
         if session_key:
-            row = await fetch_one(
-                "SELECT data, expires_at FROM sessions WHERE session_key = %s AND expires_at > NOW()",
-                (session_key,),
-            )
-            if row and row.get("data"):
-                session = json.loads(row["data"])
+            loaded = await _load_session(session_key)
+            if loaded is not None:
+                session = loaded
             else:
                 session_key = None
                 clear_cookie = True
 
-        request.scope["session"] = session
-        request.state._session_key = session_key
-        request.state._session_snapshot = json.dumps(session, sort_keys=True)
-        request.state._clear_cookie = clear_cookie
-
-        response: Response = await call_next(request)
-
-        current_session = request.scope.get("session", {})
-        current_snapshot = json.dumps(current_session, sort_keys=True)
-
-        if current_snapshot != request.state._session_snapshot:
-            if not current_session:
-                if session_key:
-                    await execute(
-                        "DELETE FROM sessions WHERE session_key = %s",
-                        (session_key,),
-                    )
-                response.delete_cookie(settings.session_cookie_name)
-                return response
-
-            if not session_key:
-                session_key = secrets.token_urlsafe(32)
-
-            expires_at = datetime.utcnow() + timedelta(seconds=settings.session_timeout)
-            data_json = json.dumps(current_session)
-            user_id = current_session.get("userId")
-
-            await execute(
-                """
-                INSERT INTO sessions (session_key, user_id, data, expires_at, created_at)
-                VALUES (%s, %s, %s, %s, NOW())
-                ON DUPLICATE KEY UPDATE
-                    user_id = VALUES(user_id),
-                    data = VALUES(data),
-                    expires_at = VALUES(expires_at)
-                """,
-                (session_key, user_id, data_json, expires_at),
-            )
-
-            response.set_cookie(
-                settings.session_cookie_name,
-                session_key,
-                max_age=settings.session_timeout,
-                httponly=True,
-                samesite=settings.cookie_samesite,
-                secure=settings.cookie_secure,
-            )
-
-        if request.state._clear_cookie:
-            response.delete_cookie(settings.session_cookie_name)
-
-        return response
+        scope["session"] = session
+        connection.state._session_key = session_key
+        snapshot = json.dumps(session, sort_keys=True)
+
+        async def send_with_session(message: Message):
+            # 응답 헤더가 나가기 직전에 세션을 저장하고 쿠키를 설정
+            if message["type"] == "http.response.start":
+                cookie_response = await _save_session(scope, session_key, snapshot, clear_cookie)
+                _append_cookie_headers(MutableHeaders(scope=message), cookie_response)
+            await send(message)
+
+        await self.app(scope, receive, send_with_session)